@@ -0,0 +1,103 @@
+"""Benchmark: backfill scaling with worker count, and the serial merge it ends with.
+
+Builds ``(date, hour, metric, value)`` rows for every column of every hour
+of a range of days and reports, per worker count:
+
+- seconds for ``backfill`` and rows per second, against a sequential
+  ``parse_rows`` / ``store_columns`` ingest of the same rows
+- the serial work left in the parent for that many partitions: milliseconds
+  to unpickle the partition stores, as results arrive from the workers, and
+  to combine them by copying every reading (``WeatherStore.merge``) or by
+  adopting their days (what ``backfill`` does)
+
+The speedup cannot exceed the number of CPUs, which is printed first.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_backfill --days 365 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+from datetime import date, timedelta
+
+from src.tdd_practice.backfill import _build_partition, backfill, partition_by_date
+from src.tdd_practice.ingest import parse_rows, store_columns
+from src.tdd_practice.weather_store import COLUMNS, WeatherStore
+
+
+def history_rows(days: int) -> list:
+    """Return one row per column per hour of ``days`` days from 2024-01-01."""
+    start = date(2024, 1, 1)
+    result = []
+    for offset in range(days):
+        day = (start + timedelta(days=offset)).isoformat()
+        for hour in range(24):
+            for index, column in enumerate(COLUMNS):
+                result.append((day, hour, column, float(offset % 30 + hour + index)))
+    return result
+
+
+def _sequential(rows: list) -> float:
+    started = time.perf_counter()
+    columns, _ = parse_rows(rows)
+    store_columns(columns, WeatherStore())
+    return time.perf_counter() - started
+
+
+def _serial_merge(rows: list, partitions: int) -> tuple[float, float, float]:
+    """Return seconds to unpickle the partition stores, merge them and adopt them."""
+    payloads = [
+        pickle.dumps(_build_partition(chunk)[0])
+        for _, chunk in partition_by_date(rows, partitions)
+    ]
+    started = time.perf_counter()
+    for payload in payloads:
+        pickle.loads(payload)
+    unpickle = time.perf_counter() - started
+
+    timings = []
+    for combine in (WeatherStore.merge, WeatherStore._adopt):
+        stores = [pickle.loads(payload) for payload in payloads]
+        storage = WeatherStore()
+        started = time.perf_counter()
+        for store in stores:
+            combine(storage, store)
+        timings.append(time.perf_counter() - started)
+    return unpickle, timings[0], timings[1]
+
+
+def run(days: int, workers: list) -> tuple[int, float, list]:
+    data = history_rows(days)
+    sequential = _sequential(data)
+    results = []
+    for count in workers:
+        started = time.perf_counter()
+        backfill(data, workers=count)
+        seconds = time.perf_counter() - started
+        results.append((count, seconds, *_serial_merge(data, count)))
+    return len(data), sequential, results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    count, sequential, results = run(args.days, args.workers)
+    print(f"{os.cpu_count()} CPUs, {count} rows, sequential ingest {sequential:.2f} s "
+          f"({count / sequential:,.0f} rows/s)")
+    print(f"{'workers':>7} {'seconds':>8} {'rows/s':>10} {'speedup':>8} "
+          f"{'unpickle ms':>12} {'merge ms':>9} {'adopt ms':>9}")
+    for workers, seconds, unpickle, merge, adopt in results:
+        print(f"{workers:7} {seconds:8.2f} {count / seconds:10,.0f} {sequential / seconds:7.2f}x "
+              f"{unpickle * 1e3:12.1f} {merge * 1e3:9.1f} {adopt * 1e3:9.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Benchmark: memory saved and decode cost of sealed (compressed) days.
+
+Fills a WeatherStore with a synthetic but realistic year: temperatures and
+wind speeds that drift slowly at 0.1 resolution, and rainfall that is zero
+most hours with occasional showers. It then seals every day and reports:
+
+- bytes per day of the values block before and after sealing, and the ratio
+- bytes per day of the same readings in the nested storage dict
+- microseconds to decode one sealed day and to read one hour from it
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compression --days 365
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+def _dates(days: int) -> list[str]:
+    start = date(2024, 1, 1)
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def fill(storage, days: int, seed: int = 0) -> None:
+    """Store ``days`` days of realistic hourly readings into storage."""
+    generator = random.Random(seed)
+    wind = 10.0
+    raining = False
+    for offset, day in enumerate(_dates(days)):
+        seasonal = 12 - 10 * math.cos(2 * math.pi * offset / 365)
+        for hour in range(24):
+            average = round(seasonal + 6 * math.sin(math.pi * (hour - 9) / 12) + generator.gauss(0, 0.3), 1)
+            store_temperature(day, hour, {
+                'max': round(average + 1.5, 1),
+                'min': round(average - 1.5, 1),
+                'average': average,
+            }, storage)
+            wind = min(max(wind + generator.gauss(0, 0.8), 0.0), 40.0)
+            store_wind_speed(day, hour, {'min': round(wind * 0.6, 1), 'max': round(wind, 1)}, storage)
+            raining = generator.random() < (0.3 if raining else 0.05)
+            store_rainfall(day, hour, round(generator.expovariate(1.5), 1) if raining else 0.0, storage)
+
+
+def _deep_size(value, seen=None) -> int:
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(key, seen) + _deep_size(item, seen) for key, item in value.items())
+    return size
+
+
+def run(days: int, repeat: int) -> dict:
+    store = WeatherStore()
+    fill(store, days)
+    nested = {}
+    fill(nested, days)
+    dates = list(store)
+
+    raw = sum(sys.getsizeof(store._days[day].values) for day in dates)
+    started = time.perf_counter()
+    store.seal_before('9999-12-31')
+    seal_seconds = time.perf_counter() - started
+    packed = sum(sys.getsizeof(store._days[day].packed) for day in dates)
+    boxed = _deep_size(nested) - sys.getsizeof(nested)
+
+    best_decode = best_read = math.inf
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for day in dates:
+            store._days[day].readable()
+        best_decode = min(best_decode, time.perf_counter() - started)
+        started = time.perf_counter()
+        for day in dates:
+            store[day][12]
+        best_read = min(best_read, time.perf_counter() - started)
+
+    return {
+        'days': len(dates),
+        'raw_bytes_per_day': raw / len(dates),
+        'sealed_bytes_per_day': packed / len(dates),
+        'nested_dict_bytes_per_day': boxed / len(dates),
+        'ratio': raw / packed,
+        'ratio_vs_nested_dict': boxed / packed,
+        'seal_us_per_day': seal_seconds / len(dates) * 1e6,
+        'decode_us_per_day': best_decode / len(dates) * 1e6,
+        'read_hour_us': best_read / len(dates) * 1e6,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    for name, value in run(args.days, args.repeat).items():
+        print(f"{name:28} {value:10.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
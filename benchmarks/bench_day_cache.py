@@ -0,0 +1,85 @@
+"""Benchmark: dashboard-style date lookups with and without a DayCache.
+
+Fills a WeatherStore with a year of readings (see bench_compression), seals
+every day, and writes the same year to a weather file. It then replays a
+skewed lookup pattern, most lookups hitting the last few weeks, reading
+one hour of each looked-up day, and reports for the sealed store and the
+file alone and behind caches of a few sizes:
+
+- microseconds per day lookup
+- the cache hit rate and evictions
+
+Run from the repository root:
+
+    python -m benchmarks.bench_day_cache --days 365 --lookups 20000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.tdd_practice.day_cache import DayCache
+from src.tdd_practice.weather_file import WeatherFile, write_weather_file
+from src.tdd_practice.weather_store import WeatherStore
+
+from .bench_compression import fill
+
+
+def _lookups(dates: list, count: int, seed: int = 0) -> list:
+    """Return ``count`` dates, 90% of them from the newest 21 days."""
+    generator = random.Random(seed)
+    recent = dates[-21:]
+    return [
+        generator.choice(recent) if generator.random() < 0.9 else generator.choice(dates)
+        for _ in range(count)
+    ]
+
+
+def _replay(storage, lookups: list) -> float:
+    started = time.perf_counter()
+    for date in lookups:
+        storage[date][12]
+    return (time.perf_counter() - started) / len(lookups) * 1e6
+
+
+def run(days: int, lookups: int, capacities: list) -> list:
+    store = WeatherStore()
+    fill(store, days)
+    pattern = _lookups(list(store), lookups)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'weather.bin')
+        write_weather_file(path, store)
+        store.seal_before('9999-12-31')
+        with WeatherFile(path) as weather_file:
+            for name, source in (('sealed store', store), ('weather file', weather_file)):
+                results.append((name, None, _replay(source, pattern), None))
+                for capacity in capacities:
+                    cache = DayCache(source, capacity)
+                    microseconds = _replay(cache, pattern)
+                    results.append((name, capacity, microseconds, cache.stats()))
+                    cache.close()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--lookups', type=int, default=20000)
+    parser.add_argument('--capacity', type=int, nargs='+', default=[8, 32, 128])
+    args = parser.parse_args(argv)
+
+    print(f"{'source':14} {'capacity':>8} {'us/lookup':>10} {'hit rate':>9} {'evictions':>10}")
+    for name, capacity, microseconds, stats in run(args.days, args.lookups, args.capacity):
+        if stats is None:
+            print(f"{name:14} {'-':>8} {microseconds:10.2f}")
+        else:
+            print(f"{name:14} {capacity:8} {microseconds:10.2f} {stats.hit_rate:9.1%} {stats.evictions:10}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
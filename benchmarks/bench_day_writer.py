@@ -0,0 +1,100 @@
+"""Microbenchmark: per-write cost of store_* calls against a bound DayWriter.
+
+Writes a full day of rainfall readings through each path and prints the
+nanoseconds per write, and its speed relative to store_rainfall into the
+nested storage dict:
+
+- store_rainfall into the nested storage dict
+- store_rainfall into a WeatherStore (date parsed/hashed and hour checked
+  per call, aggregates kept per write)
+- DayWriter.store_rainfall (date resolved once, hour checked and
+  aggregates kept per call)
+- DayWriter.store_many (date resolved once, hours validated once per batch)
+
+Every path starts from empty storage, so the cost of creating each day is
+included.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_day_writer --days 200
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.weather_store import WeatherStore
+
+HOURS = list(range(24))
+
+
+def _dates(days: int) -> list[str]:
+    start = date(2024, 1, 1)
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def _per_write_ns(write, dates, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        write(dates)
+        best = min(best, time.perf_counter_ns() - started)
+    return best / (len(dates) * len(HOURS))
+
+
+def run(days: int, repeat: int) -> dict:
+    dates = _dates(days)
+    values = [float(hour) for hour in HOURS]
+
+    def dict_store(dates):
+        storage = {}
+        for day in dates:
+            for hour in HOURS:
+                store_rainfall(day, hour, 1.0, storage)
+
+    def weather_store(dates):
+        storage = WeatherStore()
+        for day in dates:
+            for hour in HOURS:
+                store_rainfall(day, hour, 1.0, storage)
+
+    def day_writer(dates):
+        storage = WeatherStore()
+        for day in dates:
+            writer = storage.day_writer(day)
+            for hour in HOURS:
+                writer.store_rainfall(hour, 1.0)
+
+    def day_writer_batch(dates):
+        storage = WeatherStore()
+        for day in dates:
+            storage.day_writer(day).store_many('rainfall', HOURS, values)
+
+    return {
+        name: _per_write_ns(write, dates, repeat)
+        for name, write in (
+            ('store_rainfall(dict)', dict_store),
+            ('store_rainfall(WeatherStore)', weather_store),
+            ('DayWriter.store_rainfall', day_writer),
+            ('DayWriter.store_many', day_writer_batch),
+        )
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = run(args.days, args.repeat)
+    baseline = results['store_rainfall(dict)']
+    for name, nanoseconds in results.items():
+        print(f"{name:30} {nanoseconds:8.0f} ns/write  {baseline / nanoseconds:5.2f}x dict")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
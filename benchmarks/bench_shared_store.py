@@ -0,0 +1,88 @@
+"""Benchmark: per-worker memory of shared-memory readers against per-worker copies.
+
+Fills a SharedWeatherStore with a year of readings (see bench_compression),
+then starts worker processes that either attach a SharedWeatherReader or
+build their own copy of the same year, as a WeatherStore or as the nested
+storage dict. Each worker reads every hour of every day and reports:
+
+- the private memory it gained, in KiB (from Linux ``smaps_rollup``; not
+  reported elsewhere)
+- microseconds per day to look it up and read its 24 hours
+
+Run from the repository root:
+
+    python -m benchmarks.bench_shared_store --days 365 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from src.tdd_practice.shared_store import SharedWeatherReader, SharedWeatherStore
+from src.tdd_practice.weather_store import WeatherStore
+
+from .bench_compression import fill
+
+
+def _private_kib():
+    try:
+        with open('/proc/self/smaps_rollup') as smaps:
+            return sum(
+                int(line.split()[1]) for line in smaps if line.startswith(('Private_Clean', 'Private_Dirty'))
+            )
+    except OSError:
+        return None
+
+
+def _read_all(storage) -> float:
+    started = time.perf_counter()
+    dates = list(storage)
+    for date in dates:
+        day = storage[date]
+        for hour in day:
+            day[hour]
+    return (time.perf_counter() - started) / len(dates) * 1e6
+
+
+def _worker(mode: str, name: str, days: int):
+    baseline = _private_kib()
+    if mode == 'shared':
+        with SharedWeatherReader(name) as reader:
+            microseconds = _read_all(reader)
+            used = _private_kib()
+    else:
+        store = WeatherStore() if mode == 'store' else {}
+        fill(store, days)
+        microseconds = _read_all(store)
+        used = _private_kib()
+    return (None if baseline is None else used - baseline), microseconds
+
+
+def run(days: int, workers: int) -> list:
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with SharedWeatherStore('2024-01-01', days) as store:
+        fill(store, days)
+        with context.Pool(workers) as pool:
+            for mode in ('shared', 'store', 'dict'):
+                results.append((mode, pool.starmap(_worker, [(mode, store.name, days)] * workers)))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':8} {'worker':>6} {'private KiB':>12} {'us/day':>8}")
+    for mode, runs in run(args.days, args.workers):
+        for worker, (kib, microseconds) in enumerate(runs):
+            kib = '-' if kib is None else f"{kib:12d}"
+            print(f"{mode:8} {worker:6} {kib:>12} {microseconds:8.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Benchmark: memoized sum_current_stock against recomputing, by input repeat rate.
+
+Replays a stream of sum_current_stock calls in which a given fraction of the
+calls repeat one of a small set of site configurations (shared max_fill and
+min_threshold, same A/B/C levels), and the rest are new level readings. It
+reports nanoseconds per call without a cache and through
+memoized_sum_current_stock, with the achieved hit rate, so the break-even
+repeat rate can be read off the table.
+
+Before the table it prints the cost of one call on the same integer
+arguments without a cache, as a cache hit and as a cache miss, and the hit
+rate at which the cache would break even: ``(miss - plain) / (miss - hit)``,
+or "never" when a hit is not cheaper than recomputing.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_stock_memo --calls 200000
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from src.tdd_practice.stock_calculator import memoized_sum_current_stock, sum_current_stock
+
+MAX_FILL = 100
+MIN_THRESHOLD = 20
+
+
+def _calls(count: int, repeat_rate: float, sites: int, seed: int = 0) -> list:
+    generator = random.Random(seed)
+    known = [
+        (generator.randint(0, MAX_FILL), generator.randint(0, MAX_FILL), generator.randint(0, MAX_FILL))
+        for _ in range(sites)
+    ]
+    return [
+        generator.choice(known) if generator.random() < repeat_rate
+        else (generator.uniform(0, MAX_FILL), generator.uniform(0, MAX_FILL), generator.uniform(0, MAX_FILL))
+        for _ in range(count)
+    ]
+
+
+def _time(function, calls: list, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for a, b, c in calls:
+            function(a, b, c, MAX_FILL, MIN_THRESHOLD)
+        best = min(best, time.perf_counter() - started)
+    return best / len(calls) * 1e9
+
+
+def _costs(calls: int, repeat: int) -> tuple[float, float, float]:
+    """Return nanoseconds per call without a cache, as a cache hit and as a cache miss."""
+    same = [(10, 50, 90)] * calls
+    plain = _time(sum_current_stock, same, repeat)
+    memoized = memoized_sum_current_stock(None)
+    memoized(10, 50, 90, MAX_FILL, MIN_THRESHOLD)
+    hit = _time(memoized, same, repeat)
+    unique = [(a, 50, 90) for a in range(calls)]
+    miss = float('inf')
+    for _ in range(repeat):
+        miss = min(miss, _time(memoized_sum_current_stock(None), unique, 1))
+    return plain, hit, miss
+
+
+def break_even(plain: float, hit: float, miss: float):
+    """Return the hit rate above which the cache is faster, or None if it never is."""
+    if hit >= plain:
+        return None
+    return max(0.0, (miss - plain) / (miss - hit))
+
+
+def run(calls: int, sites: int, maxsize: int, rates: list, repeat: int) -> list:
+    results = []
+    for rate in rates:
+        stream = _calls(calls, rate, sites)
+        plain = _time(sum_current_stock, stream, repeat)
+        # A fresh cache per round so each round starts cold, like a new process.
+        best = float('inf')
+        for _ in range(repeat):
+            memoized = memoized_sum_current_stock(maxsize)
+            best = min(best, _time(memoized, stream, 1))
+        results.append((rate, plain, best, memoized.hit_rate()))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200_000)
+    parser.add_argument('--sites', type=int, default=500)
+    parser.add_argument('--maxsize', type=int, default=1024)
+    parser.add_argument('--rates', type=float, nargs='+', default=[0.0, 0.25, 0.5, 0.75, 0.9, 0.99])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    plain, hit, miss = _costs(args.calls, args.repeat)
+    rate = break_even(plain, hit, miss)
+    print(f"per call: plain {plain:.0f} ns, cache hit {hit:.0f} ns, cache miss {miss:.0f} ns; "
+          f"break-even hit rate {'never' if rate is None else f'{rate:.0%}'}")
+    print(f"{'repeat rate':>11} {'plain ns':>9} {'memo ns':>8} {'hit rate':>9} {'speedup':>8}")
+    for rate, plain, memoized, hit_rate in run(args.calls, args.sites, args.maxsize, args.rates, args.repeat):
+        print(f"{rate:11.0%} {plain:9.0f} {memoized:8.0f} {hit_rate:9.1%} {plain / memoized:7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""Baseline gate: fail when benchmarks got slower than a saved baseline.
+
+Record a baseline on a known-good tree, then compare a new run against it
+before deploying:
+
+    python -m pytest benchmarks --benchmark-only --benchmark-json=baseline.json
+    python -m pytest benchmarks --benchmark-only --benchmark-json=current.json
+    python -m benchmarks.compare baseline.json current.json --threshold 0.15
+
+Exits with status 1 when any benchmark's median (or the chosen ``--stat``)
+is more than ``threshold`` slower than in the baseline. Benchmarks present
+in only one of the files are listed but do not fail the gate.
+"""
+
+import argparse
+import json
+import sys
+from typing import NamedTuple
+
+STATS = ('min', 'median', 'mean')
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+
+def load(path: str, stat: str = 'median') -> dict:
+    """Return ``{fullname: seconds}`` from a ``--benchmark-json`` file."""
+    with open(path) as results:
+        data = json.load(results)
+    return {bench['fullname']: bench['stats'][stat] for bench in data['benchmarks']}
+
+
+def compare(baseline: dict, current: dict) -> tuple[list[Comparison], list[str], list[str]]:
+    """
+    Pair up the benchmarks of two runs.
+
+    Returns:
+        The comparisons of benchmarks in both runs, sorted by name, then the
+        names only in the baseline and the names only in the current run.
+    """
+    comparisons = [
+        Comparison(name, baseline[name], current[name])
+        for name in sorted(baseline.keys() & current.keys())
+    ]
+    return comparisons, sorted(baseline.keys() - current.keys()), sorted(current.keys() - baseline.keys())
+
+
+def regressions(comparisons: list[Comparison], threshold: float) -> list[Comparison]:
+    """Return the comparisons more than ``threshold`` (e.g. 0.15 for 15%) slower than baseline."""
+    return [comparison for comparison in comparisons if comparison.ratio > 1 + threshold]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--stat', choices=STATS, default='median')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown as a fraction, default 0.10")
+    args = parser.parse_args(argv)
+
+    comparisons, missing, added = compare(load(args.baseline, args.stat), load(args.current, args.stat))
+    slower = regressions(comparisons, args.threshold)
+    for comparison in comparisons:
+        flag = 'REGRESSED' if comparison in slower else ''
+        print(f"{comparison.name:80} {comparison.baseline * 1e6:12.1f} us "
+              f"{comparison.current * 1e6:12.1f} us {comparison.ratio:6.2f}x {flag}")
+    for name in missing:
+        print(f"{name:80} missing from {args.current}")
+    for name in added:
+        print(f"{name:80} not in baseline")
+
+    if slower:
+        print(f"{len(slower)} of {len(comparisons)} benchmarks regressed by more than "
+              f"{args.threshold:.0%} ({args.stat})")
+        return 1
+    print(f"All {len(comparisons)} benchmarks within {args.threshold:.0%} of baseline ({args.stat})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
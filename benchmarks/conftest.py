@@ -0,0 +1,16 @@
+"""Pytest configuration for the pytest-benchmark suite.
+
+The suite needs the pytest-benchmark plugin; without it the benchmark
+modules are skipped at collection so a plain ``pytest`` run from the
+repository root keeps working.
+"""
+import sys
+from importlib.util import find_spec
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+if find_spec('pytest_benchmark') is None:
+    collect_ignore_glob = ['test_*.py']
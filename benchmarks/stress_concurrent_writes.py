@@ -0,0 +1,98 @@
+"""Stress benchmark: independent feeds writing one store from separate threads.
+
+Runs one thread per feed (rainfall, temperature, wind speed, and extra
+rainfall feeds that overwrite the first), then checks that no reading was lost
+and that the running aggregates still match the stored data.
+
+Run from the repository root:
+
+    python -m benchmarks.stress_concurrent_writes --days 90 --rounds 3
+"""
+
+import argparse
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+def _dates(days: int) -> list[str]:
+    start = date(2024, 1, 1)
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def run(days: int, rounds: int, rainfall_feeds: int) -> dict:
+    storage = ConcurrentWeatherStore()
+    dates = _dates(days)
+
+    def rainfall_feed(feed):
+        for round_ in range(rounds):
+            for day in dates:
+                for hour in range(24):
+                    store_rainfall(day, hour, float(feed * 1000 + round_), storage)
+
+    def temperature_feed():
+        for round_ in range(rounds):
+            for day in dates:
+                for hour in range(24):
+                    store_temperature(day, hour, {'max': 20 + round_, 'min': 10, 'average': 15}, storage)
+
+    def wind_feed():
+        for round_ in range(rounds):
+            for day in dates:
+                for hour in range(24):
+                    store_wind_speed(day, hour, {'min': 1.0, 'max': 9.0 + round_}, storage)
+
+    threads = [threading.Thread(target=rainfall_feed, args=(feed,)) for feed in range(rainfall_feeds)]
+    threads += [threading.Thread(target=temperature_feed), threading.Thread(target=wind_feed)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - started
+
+    writes = (rainfall_feeds + 2) * rounds * days * 24
+    lost = sum(
+        1
+        for day in dates
+        for hour in range(24)
+        if set(storage[day].get(hour, {})) != {'rainfall', 'temperature', 'wind_speed'}
+    )
+    readings = [value for _, _, value in storage.query_range(dates[0], dates[-1], 'rainfall')]
+    aggregate_sum = sum(
+        storage.monthly(month, 'rainfall').sum
+        for month in sorted({day[:7] for day in dates})
+    )
+    return {
+        'writes': writes,
+        'seconds': seconds,
+        'writes_per_second': writes / seconds,
+        'lost_hours': lost,
+        'aggregates_consistent': aggregate_sum == sum(readings),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--rainfall-feeds', type=int, default=3)
+    parser.add_argument('--switch-interval', type=float, default=1e-6,
+                        help="sys.setswitchinterval value, small to force interleaving")
+    args = parser.parse_args(argv)
+
+    sys.setswitchinterval(args.switch_interval)
+    result = run(args.days, args.rounds, args.rainfall_feeds)
+    for key, value in result.items():
+        print(f"{key}: {value:.1f}" if isinstance(value, float) else f"{key}: {value}")
+    return 0 if not result['lost_hours'] and result['aggregates_consistent'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Benchmarks for the stock calculator at 1, 10k and 1M rows, and the planner over a quarter.
+
+Run from the repository root:
+
+    python -m pytest benchmarks/test_stock_benchmarks.py --benchmark-only
+"""
+
+import random
+from array import array
+
+import pytest
+from src.tdd_practice.stock_calculator import (
+    plan_replenishment,
+    sum_current_stock,
+    sum_current_stock_batch,
+    sum_production,
+)
+
+MAX_FILL = 100
+MIN_THRESHOLD = 20
+QUARTER_HOURS = 24 * 91
+
+
+def _levels(rows: int) -> list[float]:
+    generator = random.Random(rows)
+    return [generator.uniform(0, MAX_FILL) for _ in range(rows)]
+
+
+def test_single_row(benchmark):
+    """One sum_current_stock call."""
+    assert benchmark(sum_current_stock, 50, 70, 90, MAX_FILL, MIN_THRESHOLD) == 80
+
+
+@pytest.mark.parametrize('rows', [10_000, 1_000_000], ids=['10k', '1M'])
+def test_batch(benchmark, rows):
+    """sum_current_stock_batch over three levels per row."""
+    A, B, C = _levels(rows), _levels(rows + 1)[:rows], _levels(rows + 2)[:rows]
+
+    totals, invalid = benchmark.pedantic(
+        sum_current_stock_batch, (A, B, C, MAX_FILL, MIN_THRESHOLD), rounds=3 if rows > 10_000 else 20,
+    )
+    assert len(totals) == rows
+    assert not any(invalid)
+
+
+@pytest.mark.parametrize('rows', [10_000, 1_000_000], ids=['10k', '1M'])
+def test_batch_loop(benchmark, rows):
+    """The same rows as one sum_current_stock call each, the baseline test_batch must beat."""
+    A, B, C = _levels(rows), _levels(rows + 1)[:rows], _levels(rows + 2)[:rows]
+
+    def loop():
+        return [sum_current_stock(a, b, c, MAX_FILL, MIN_THRESHOLD) for a, b, c in zip(A, B, C)]
+
+    totals = benchmark.pedantic(loop, rounds=3 if rows > 10_000 else 20)
+    assert len(totals) == rows
+
+
+@pytest.mark.parametrize('rows', [10_000, 1_000_000], ids=['10k', '1M'])
+def test_production(benchmark, rows):
+    """sum_production over one buffer of levels."""
+    levels = array('d', _levels(rows))
+
+    total = benchmark.pedantic(
+        sum_production, (levels, MAX_FILL, MIN_THRESHOLD), rounds=3 if rows > 10_000 else 20,
+    )
+    assert total > 0
+
+
+def test_plan_quarter(benchmark):
+    """plan_replenishment over a quarter of hourly levels for A, B and C."""
+    levels = {product: _levels(QUARTER_HOURS + offset)[:QUARTER_HOURS] for offset, product in enumerate('ABC')}
+
+    plan = benchmark(plan_replenishment, levels, MAX_FILL, MIN_THRESHOLD)
+    assert len(plan.production) == QUARTER_HOURS
+
+
+def test_snapshot_loop_quarter(benchmark):
+    """The same quarter as one sum_current_stock call per hour, for comparison."""
+    levels = [_levels(QUARTER_HOURS + offset)[:QUARTER_HOURS] for offset in range(3)]
+
+    def loop():
+        return [sum_current_stock(a, b, c, MAX_FILL, MIN_THRESHOLD) for a, b, c in zip(*levels)]
+
+    assert len(benchmark(loop)) == QUARTER_HOURS
@@ -0,0 +1,137 @@
+"""Benchmarks for store_* writes and range reads.
+
+Run from the repository root:
+
+    python -m pytest benchmarks/test_storage_benchmarks.py --benchmark-only
+"""
+
+from datetime import date, timedelta
+from itertools import count
+
+import pytest
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.weather_storage import store_temperature, store_temperature_many
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.wind_storage import store_wind_speed, store_wind_speed_many
+
+DAYS = 30
+HOURS = range(24)
+STORAGES = {'dict': dict, 'WeatherStore': WeatherStore}
+
+
+def _dates(days: int) -> list[str]:
+    start = date(2024, 1, 1)
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def _rows(days: int) -> tuple[list, list]:
+    dates = []
+    hours = []
+    for day in _dates(days):
+        dates.extend([day] * 24)
+        hours.extend(HOURS)
+    return dates, hours
+
+
+def _temperature(value: float) -> dict:
+    return {'max': value + 5, 'min': value - 5, 'average': value}
+
+
+def _wind_speed(value: float) -> dict:
+    return {'min': value, 'max': value * 2}
+
+
+SINGLE = {
+    'rainfall': (store_rainfall, float),
+    'temperature': (store_temperature, _temperature),
+    'wind_speed': (store_wind_speed, _wind_speed),
+}
+MANY = {
+    'rainfall': (store_rainfall_many, float),
+    'temperature': (store_temperature_many, _temperature),
+    'wind_speed': (store_wind_speed_many, _wind_speed),
+}
+
+
+@pytest.mark.parametrize('storage_type', STORAGES)
+@pytest.mark.parametrize('metric', SINGLE)
+def test_single_writes(benchmark, metric, storage_type):
+    """One store_* call per reading for a month of hourly data."""
+    store, make = SINGLE[metric]
+    dates = _dates(DAYS)
+    readings = [make(hour) for hour in HOURS]
+
+    def write():
+        storage = STORAGES[storage_type]()
+        for day in dates:
+            for hour in HOURS:
+                store(day, hour, readings[hour], storage)
+        return storage
+
+    storage = benchmark(write)
+    assert len(storage) == DAYS
+
+
+@pytest.mark.parametrize('storage_type', STORAGES)
+@pytest.mark.parametrize('metric', MANY)
+def test_bulk_writes(benchmark, metric, storage_type):
+    """One store_*_many call for a month of hourly data."""
+    store_many, make = MANY[metric]
+    dates, hours = _rows(DAYS)
+    values = [make(hour) for hour in hours]
+
+    def write():
+        storage = STORAGES[storage_type]()
+        return storage, store_many(dates, hours, values, storage)
+
+    storage, rejects = benchmark(write)
+    assert len(storage) == DAYS
+    assert rejects == []
+
+
+@pytest.mark.parametrize('storage_type', STORAGES)
+def test_overwrite_heavy_writes(benchmark, storage_type):
+    """Rewrite every hour of a month, retracting each day's extremes in turn."""
+    storage = STORAGES[storage_type]()
+    dates = _dates(DAYS)
+    for day in dates:
+        for hour in HOURS:
+            store_temperature(day, hour, _temperature(hour), storage)
+            store_rainfall(day, hour, float(hour), storage)
+    # Each pass replaces the current maximum with the new minimum, the
+    # worst case for keeping running extremes up to date.
+    passes = count(1)
+
+    def overwrite():
+        shift = next(passes) % 2
+        for day in dates:
+            for hour in reversed(HOURS):
+                value = float(hour if shift else 23 - hour)
+                store_temperature(day, hour, _temperature(value), storage)
+                store_rainfall(day, hour, value, storage)
+
+    benchmark(overwrite)
+    assert len(storage) == DAYS
+
+
+@pytest.fixture(scope='module')
+def filled_store():
+    storage = WeatherStore()
+    dates, hours = _rows(365)
+    store_rainfall_many(dates, hours, [float(hour) for hour in hours], storage)
+    store_temperature_many(dates, hours, [_temperature(hour) for hour in hours], storage)
+    return storage
+
+
+@pytest.mark.parametrize('metric', ['rainfall', 'temperature', 'temperature.max'])
+def test_range_reads(benchmark, filled_store, metric):
+    """Read one metric across a quarter of a year of hourly data."""
+    readings = benchmark(lambda: list(filled_store.query_range('2024-02-01', '2024-04-30', metric)))
+    assert len(readings) == 90 * 24
+
+
+def test_daily_aggregates(benchmark, filled_store):
+    """Read the running daily aggregate of every day in a year."""
+    dates = list(filled_store)
+    aggregates = benchmark(lambda: [filled_store.daily(day, 'rainfall') for day in dates])
+    assert len(aggregates) == 365
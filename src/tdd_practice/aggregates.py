@@ -0,0 +1,49 @@
+"""Running sum/count/min/max aggregates over stored weather readings."""
+
+from math import inf
+
+
+class Aggregate:
+    """Sum, count, min and max of a set of readings; min and max are None when empty."""
+
+    __slots__ = ('sum', 'count', 'min', 'max')
+
+    def __init__(self, sum: float = 0.0, count: int = 0, min: float = None, max: float = None):
+        self.sum = sum
+        self.count = count
+        self.min = min
+        self.max = max
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def merge(self, other: 'Aggregate') -> None:
+        """Fold another aggregate into this one."""
+        if not other.count:
+            return
+        self.sum += other.sum
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def __eq__(self, other):
+        if not isinstance(other, Aggregate):
+            return NotImplemented
+        return (self.sum, self.count, self.min, self.max) == (
+            other.sum, other.count, other.min, other.max)
+
+    def __repr__(self):
+        return (f"Aggregate(sum={self.sum!r}, count={self.count!r}, "
+                f"min={self.min!r}, max={self.max!r})")
+
+
+def bounds(values) -> tuple[float, float]:
+    """Return (min, max) of values, or (inf, -inf) when there are none."""
+    low, high = inf, -inf
+    for value in values:
+        if value < low:
+            low = value
+        if value > high:
+            high = value
+    return low, high
@@ -0,0 +1,176 @@
+"""asyncio front-end that coalesces sensor and control-center feeds into bulk writes."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from .store_functions import STORE_MANY_FUNCTIONS
+
+# One feed per registered metric.
+FEEDS = STORE_MANY_FUNCTIONS
+
+# Errors store_*_many raises for readings the storage cannot accept.
+_READING_ERRORS = (TypeError, ValueError, AttributeError)
+
+
+@dataclass
+class FeedStats:
+    """
+    Counters for one feed; lag_seconds is the wait of the oldest reading in the last batch.
+
+    ``rejected`` counts readings the storage refused, ``failed`` readings
+    whose write raised any other error, and ``last_error`` describes the
+    latest error raised by a write, if any.
+    """
+
+    received: int = 0
+    written: int = 0
+    rejected: int = 0
+    failed: int = 0
+    batches: int = 0
+    queued: int = 0
+    lag_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    last_error: str = None
+
+
+class AsyncWeatherIngestor:
+    """
+    Accept readings from many concurrent producers and write them in batches.
+
+    Every feed has its own bounded queue and consumer task. ``put`` waits while
+    a feed's queue is full, which pushes back on that feed's producers only.
+    Each consumer takes whatever is queued, up to ``batch_size`` readings, and
+    stores it with one ``store_*_many`` call before yielding to the event loop,
+    so a busy or slow feed cannot stall the others. A batch whose write
+    raises is written again one reading at a time, so the readings that can
+    be stored are, and each one that cannot is counted and its error kept in
+    the feed's stats; the consumer keeps running either way.
+
+    Use as an async context manager, or call ``start`` and ``stop``::
+
+        async with AsyncWeatherIngestor(storage) as ingestor:
+            await ingestor.put('rainfall', '2024-01-15', 10, 5.5)
+    """
+
+    def __init__(self, storage, max_queue: int = 10_000, batch_size: int = 1_000):
+        if max_queue < 1 or batch_size < 1:
+            raise ValueError("max_queue and batch_size must be positive")
+        self.storage = storage
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self._queues = {}
+        self._tasks = []
+        self._stats = {feed: FeedStats() for feed in FEEDS}
+        self._started = None
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._started = time.monotonic()
+        self._queues = {feed: asyncio.Queue(self.max_queue) for feed in FEEDS}
+        self._tasks = [
+            asyncio.create_task(self._consume(feed), name=f"weather-ingest-{feed}")
+            for feed in FEEDS
+        ]
+
+    async def stop(self) -> None:
+        """Write everything still queued, then stop the consumers."""
+        for queue in self._queues.values():
+            await queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = {}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def put(self, feed: str, date: str, hour: int, value) -> None:
+        """
+        Queue one reading, waiting while the feed's queue is full.
+
+        Args:
+            feed: A metric name from the registry, e.g. 'rainfall'
+            date: The date in format 'YYYY-MM-DD'
+            hour: The hour (0-23) of the reading
+            value: The reading, as accepted by the feed's store_* function
+
+        Raises:
+            KeyError: If feed is not a known feed
+            RuntimeError: If the ingestor has not been started
+        """
+        queue = self._queues.get(feed)
+        if queue is None:
+            if feed not in FEEDS:
+                raise KeyError(feed)
+            raise RuntimeError("AsyncWeatherIngestor has not been started")
+        await queue.put((date, hour, value, time.monotonic()))
+        self._stats[feed].received += 1
+
+    def stats(self) -> dict:
+        """Return a ``{feed: FeedStats}`` snapshot with current queue depths and throughput."""
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        snapshot = {}
+        for feed, stats in self._stats.items():
+            queue = self._queues.get(feed)
+            snapshot[feed] = FeedStats(
+                received=stats.received,
+                written=stats.written,
+                rejected=stats.rejected,
+                failed=stats.failed,
+                batches=stats.batches,
+                queued=queue.qsize() if queue else 0,
+                lag_seconds=stats.lag_seconds,
+                rows_per_second=stats.written / elapsed if elapsed else 0.0,
+                last_error=stats.last_error,
+            )
+        return snapshot
+
+    async def _consume(self, feed: str) -> None:
+        queue = self._queues[feed]
+        store_many = FEEDS[feed]
+        stats = self._stats[feed]
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            dates, hours, values, enqueued = zip(*batch)
+            try:
+                try:
+                    rejected = len(store_many(dates, hours, values, self.storage))
+                    failed = 0
+                except Exception as error:
+                    # Part of the batch may be stored already; rewriting a
+                    # reading stores the same value again.
+                    stats.last_error = repr(error)
+                    rejected, failed = self._store_rows(store_many, stats, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+            stats.rejected += rejected
+            stats.failed += failed
+            stats.written += len(batch) - rejected - failed
+            stats.batches += 1
+            stats.lag_seconds = time.monotonic() - min(enqueued)
+            await asyncio.sleep(0)
+
+    def _store_rows(self, store_many, stats: FeedStats, batch: list) -> tuple[int, int]:
+        """Store a batch one reading at a time; return the rejected and failed counts."""
+        rejected = failed = 0
+        for date, hour, value, _ in batch:
+            try:
+                rejected += len(store_many([date], [hour], [value], self.storage))
+            except _READING_ERRORS as error:
+                rejected += 1
+                stats.last_error = repr(error)
+            except Exception as error:
+                # Keep consuming: a dead consumer would block the feed's producers.
+                failed += 1
+                stats.last_error = repr(error)
+        return rejected, failed
@@ -0,0 +1,101 @@
+"""Parallel backfill of historical weather rows across worker processes."""
+
+import os
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
+from .bulk import Reject
+from .ingest import parse_rows, store_columns
+from .weather_store import WeatherStore
+
+
+def partition_by_date(rows, partitions: int) -> list[tuple[list, list]]:
+    """
+    Split rows into contiguous date ranges holding roughly equal row counts.
+
+    Every row of a date lands in the same partition and rows keep their input
+    order within a partition, so last-write-wins is preserved.
+
+    Args:
+        rows: Sequence of ``(date, hour, metric, value)`` rows
+        partitions: Maximum number of partitions
+
+    Returns:
+        ``(indices, rows)`` pairs in date order, where ``indices`` are the
+        positions of the partition's rows in the input.
+    """
+    counts = {}
+    for row in rows:
+        date = row[0] if row else None
+        counts[date] = counts.get(date, 0) + 1
+    # Rows without a usable date go to the first partition, whose worker
+    # rejects them; only string dates can bound a partition.
+    dates = sorted(date for date in counts if isinstance(date, str))
+    target = len(rows) / max(1, partitions)
+    bounds = []
+    filled = len(rows) - sum(counts[date] for date in dates)
+    for date in dates:
+        filled += counts[date]
+        if filled >= target * (len(bounds) + 1) and len(bounds) < partitions - 1:
+            bounds.append(date)
+    keyed = {date: bisect_left(bounds, date) if isinstance(date, str) else 0 for date in counts}
+
+    split = [([], []) for _ in range(len(bounds) + 1)]
+    for index, row in enumerate(rows):
+        indices, chunk = split[keyed[row[0] if row else None]]
+        indices.append(index)
+        chunk.append(row)
+    return [part for part in split if part[0]]
+
+
+def _build_partition(rows) -> tuple[WeatherStore, list[Reject]]:
+    store = WeatherStore()
+    columns, rejects = parse_rows(rows)
+    rejects.extend(store_columns(columns, store))
+    return store, rejects
+
+
+def backfill(rows, storage: WeatherStore = None, workers: int = None,
+             partitions: int = None) -> tuple[WeatherStore, list[Reject]]:
+    """
+    Build a WeatherStore from historical rows using a pool of worker processes.
+
+    Rows are partitioned by date range, each worker builds a store for its
+    partitions, and the partial stores are merged into ``storage`` in date
+    order; days ``storage`` does not hold yet are adopted as built rather
+    than stored again. Readings from the rows overwrite readings already in ``storage``
+    and, for the same date, hour and metric, later rows overwrite earlier
+    ones, matching the overwrite behaviour of the store_* functions.
+
+    Args:
+        rows: Sequence of ``(date, hour, metric, value)`` rows, with metric
+            naming a column such as 'rainfall' or 'temperature.max'
+        storage: Store to merge into; a new WeatherStore when omitted
+        workers: Number of worker processes; ``os.cpu_count()`` when omitted.
+            With one worker the rows are stored in this process.
+        partitions: Number of date-range partitions; defaults to ``workers``
+
+    Returns:
+        The merged store and the rejected rows, indexed by position in ``rows``.
+    """
+    storage = WeatherStore() if storage is None else storage
+    workers = workers or os.cpu_count() or 1
+    parts = partition_by_date(rows, partitions or workers)
+
+    if workers == 1 or len(parts) <= 1:
+        results = map(_build_partition, (chunk for _, chunk in parts))
+        return _merge(storage, parts, results)
+    with ProcessPoolExecutor(max_workers=min(workers, len(parts))) as pool:
+        results = pool.map(_build_partition, (chunk for _, chunk in parts))
+        return _merge(storage, parts, results)
+
+
+def _merge(storage: WeatherStore, parts, results) -> tuple[WeatherStore, list[Reject]]:
+    rejects = []
+    for (indices, _), (store, partition_rejects) in zip(parts, results):
+        # Partitions hold disjoint dates, so their days are taken over rather
+        # than stored again.
+        storage._adopt(store)
+        rejects.extend(Reject(indices[reject.index], reject.reason) for reject in partition_rejects)
+    rejects.sort()
+    return storage, rejects
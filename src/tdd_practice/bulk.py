@@ -0,0 +1,73 @@
+"""Helpers for storing many weather readings in a single sweep."""
+
+from typing import NamedTuple
+
+
+class Reject(NamedTuple):
+    """A row that could not be stored, identified by its position in the batch."""
+
+    index: int
+    reason: str
+
+
+def group_by_date(dates, hours, values) -> tuple[dict, list[Reject]]:
+    """
+    Validate hours for a batch in one pass and group the valid rows by date.
+
+    Args:
+        dates: Sequence of dates in format 'YYYY-MM-DD'
+        hours: Sequence of hours, one per date
+        values: Sequence of readings, one per date
+
+    Returns:
+        A ``{date: [(index, hour, value), ...]}`` dict of valid rows in input
+        order, and the list of rejected rows.
+
+    Raises:
+        ValueError: If the three sequences differ in length
+    """
+    if not len(dates) == len(hours) == len(values):
+        raise ValueError(
+            f"dates, hours and values must have the same length, "
+            f"got {len(dates)}, {len(hours)} and {len(values)}"
+        )
+    rejects = [
+        Reject(index, f"Hour must be between 0 and 23, got {hour!r}")
+        for index, hour in enumerate(hours)
+        if type(hour) is not int or hour < 0 or hour > 23
+    ]
+    groups = {}
+    rejected = {reject.index for reject in rejects}
+    for index, (date, hour, value) in enumerate(zip(dates, hours, values)):
+        if rejected and index in rejected:
+            continue
+        rows = groups.get(date)
+        if rows is None:
+            rows = groups[date] = []
+        rows.append((index, hour, value))
+    return groups, rejects
+
+
+def store_grouped(metric: str, groups: dict, storage: dict, field: str = None) -> None:
+    """
+    Write rows grouped by :func:`group_by_date` into a nested storage dict.
+
+    Args:
+        metric: The key to store each value under, e.g. 'rainfall'
+        groups: Validated ``{date: [(index, hour, value), ...]}`` rows
+        storage: Dictionary to store the weather data, organized by date and hour
+        field: When given, each value is stored as ``record[metric][field]``,
+            keeping the metric's other fields
+    """
+    for date, rows in groups.items():
+        day = storage.get(date)
+        if day is None:
+            day = storage.setdefault(date, {})
+        for _, hour, value in rows:
+            record = day.get(hour)
+            if record is None:
+                record = day.setdefault(hour, {})
+            if field is None:
+                record[metric] = value
+            else:
+                record.setdefault(metric, {})[field] = value
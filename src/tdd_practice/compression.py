@@ -0,0 +1,260 @@
+"""Lossless compression of a day's hourly columns for sealed weather days.
+
+Each non-empty column is packed on its own with whichever of these encodings
+is smallest:
+
+- ``DECIMAL``: values that are exact decimals with at most six places (e.g.
+  sensor readings at 0.1 resolution) are scaled to integers and stored as a
+  zigzag varint first value followed by zigzag varint deltas, so slowly
+  changing series take about a byte per reading
+- ``XOR``: Gorilla-style float compression; each value is XORed with the
+  previous one and only the meaningful bits of the difference are kept,
+  reusing the previous leading/trailing zero window when it fits
+- ``ZERO_RUNS``: alternating run lengths of zero and non-zero values, with
+  the non-zero values packed by one of the encodings above, for mostly-dry
+  rainfall
+- ``RAW``: little-endian float64, the fallback
+
+A packed day is the concatenation of ``[encoding u8][length varint][payload]``
+segments for its non-empty columns; the number of values in each column comes
+from the day's presence masks, which are kept uncompressed.
+"""
+
+import struct
+from math import copysign
+
+RAW = 0
+DECIMAL = 1
+XOR = 2
+ZERO_RUNS = 3
+
+_MAX_DECIMAL_PLACES = 6
+
+
+def _is_zero(value: float) -> bool:
+    """True for 0.0 but not -0.0, which must keep its sign."""
+    return value == 0 and copysign(1.0, value) > 0
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data, position: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _encode_raw(values: list) -> bytes:
+    return struct.pack(f'<{len(values)}d', *values)
+
+
+def _decode_raw(payload, count: int) -> list:
+    return list(struct.unpack(f'<{count}d', payload))
+
+
+def _encode_decimal(values: list):
+    """Return the DECIMAL payload, or None if some value is not a short exact decimal."""
+    for places in range(_MAX_DECIMAL_PLACES + 1):
+        scale = 10 ** places
+        try:
+            scaled = [round(value * scale) for value in values]
+        except (OverflowError, ValueError):
+            return None
+        if all(number / scale == value and (number or _is_zero(value))
+               for number, value in zip(scaled, values)):
+            break
+    else:
+        return None
+    out = bytearray([places])
+    previous = 0
+    for number in scaled:
+        _put_varint(out, _zigzag(number - previous))
+        previous = number
+    return bytes(out)
+
+
+def _decode_decimal(payload, count: int) -> list:
+    scale = 10 ** payload[0]
+    position = 1
+    number = 0
+    values = []
+    for _ in range(count):
+        delta, position = _get_varint(payload, position)
+        number += _unzigzag(delta)
+        values.append(number / scale)
+    return values
+
+
+def _encode_xor(values: list) -> bytes:
+    words = struct.unpack(f'<{len(values)}Q', struct.pack(f'<{len(values)}d', *values))
+    accumulator = words[0]
+    width = 64
+    previous = words[0]
+    window = None
+    for word in words[1:]:
+        xor = word ^ previous
+        previous = word
+        if not xor:
+            accumulator <<= 1
+            width += 1
+            continue
+        leading = min(64 - xor.bit_length(), 31)
+        trailing = (xor & -xor).bit_length() - 1
+        if window is not None and leading >= window[0] and trailing >= window[1]:
+            size = 64 - window[0] - window[1]
+            accumulator = (accumulator << 2 + size) | 0b10 << size | xor >> window[1]
+            width += 2 + size
+        else:
+            size = 64 - leading - trailing
+            header = (0b11 << 5 | leading) << 6 | size - 1
+            accumulator = (accumulator << 13 | header) << size | xor >> trailing
+            width += 13 + size
+            window = (leading, trailing)
+    padding = -width % 8
+    return (accumulator << padding).to_bytes((width + padding) // 8, 'big')
+
+
+def _decode_xor(payload, count: int) -> list:
+    stream = int.from_bytes(payload, 'big')
+    position = len(payload) * 8
+
+    def read(size: int) -> int:
+        nonlocal position
+        position -= size
+        return stream >> position & (1 << size) - 1
+
+    word = read(64)
+    words = [word]
+    window = None
+    for _ in range(count - 1):
+        if read(1):
+            if read(1):
+                leading = read(5)
+                size = read(6) + 1
+                window = (leading, 64 - leading - size)
+            else:
+                size = 64 - window[0] - window[1]
+            word ^= read(size) << window[1]
+        words.append(word)
+    return list(struct.unpack(f'<{count}d', struct.pack(f'<{count}Q', *words)))
+
+
+def _encode_floats(values: list) -> tuple[int, bytes]:
+    """Return the smallest of the DECIMAL, XOR and RAW encodings of values."""
+    best = (RAW, _encode_raw(values))
+    for encoding, payload in ((DECIMAL, _encode_decimal(values)), (XOR, _encode_xor(values))):
+        if payload is not None and len(payload) < len(best[1]):
+            best = (encoding, payload)
+    return best
+
+
+def _encode_zero_runs(values: list) -> bytes:
+    out = bytearray()
+    nonzero = [value for value in values if not _is_zero(value)]
+    run = 0
+    zero = True
+    for value in values:
+        is_zero = _is_zero(value)
+        if is_zero != zero:
+            _put_varint(out, run)
+            run = 0
+            zero = is_zero
+        run += 1
+    _put_varint(out, run)
+    if nonzero:
+        encoding, payload = _encode_floats(nonzero)
+        out.append(encoding)
+        out += payload
+    return bytes(out)
+
+
+def _decode_zero_runs(payload, count: int) -> list:
+    runs = []
+    position = 0
+    total = 0
+    while total < count:
+        run, position = _get_varint(payload, position)
+        runs.append(run)
+        total += run
+    nonzero = runs[1::2]
+    present = sum(nonzero)
+    literals = iter(
+        _DECODERS[payload[position]](payload[position + 1:], present) if present else ())
+    values = []
+    for index, run in enumerate(runs):
+        if index % 2:
+            values.extend(next(literals) for _ in range(run))
+        else:
+            values.extend([0.0] * run)
+    return values
+
+
+_DECODERS = {
+    RAW: _decode_raw,
+    DECIMAL: _decode_decimal,
+    XOR: _decode_xor,
+    ZERO_RUNS: _decode_zero_runs,
+}
+
+
+def encode_column(values: list) -> tuple[int, bytes]:
+    """Return ``(encoding, payload)``, the smallest lossless encoding of a non-empty column."""
+    best = _encode_floats(values)
+    if 0.0 in values:
+        payload = _encode_zero_runs(values)
+        if len(payload) < len(best[1]):
+            best = (ZERO_RUNS, payload)
+    return best
+
+
+def decode_column(encoding: int, payload, count: int) -> list:
+    """Decode ``count`` values packed by :func:`encode_column`."""
+    return _DECODERS[encoding](payload, count)
+
+
+def pack_columns(columns: list) -> bytes:
+    """Pack lists of column values, skipping empty columns."""
+    out = bytearray()
+    for values in columns:
+        if not values:
+            continue
+        encoding, payload = encode_column(values)
+        out.append(encoding)
+        _put_varint(out, len(payload))
+        out += payload
+    return bytes(out)
+
+
+def unpack_columns(packed: bytes, counts: list) -> list:
+    """Unpack :func:`pack_columns` output given the number of values in each column."""
+    view = memoryview(packed)
+    columns = []
+    position = 0
+    for count in counts:
+        if not count:
+            columns.append([])
+            continue
+        encoding = view[position]
+        size, position = _get_varint(view, position + 1)
+        columns.append(decode_column(encoding, view[position:position + size], count))
+        position += size
+    return columns
@@ -0,0 +1,68 @@
+"""WeatherStore variant that independent feeds can write from separate threads."""
+
+from threading import Lock
+
+from .aggregates import Aggregate
+from .weather_store import WeatherStore, _Day, _Month
+
+
+class ConcurrentWeatherStore(WeatherStore):
+    """
+    Thread-safe WeatherStore with one lock per month of data.
+
+    Writes to a day hold the lock of its month, which also guards the month's
+    running aggregates, so feeds writing different months never contend and
+    feeds writing the same month serialize only for the few slot updates of
+    each reading. Creating a new day or month, which touches the shared date
+    index, takes a separate structure lock once per date.
+
+    Reads through ``store[date][hour]`` are not locked and may observe a
+    composite reading half-way through an overwrite; ``daily``, ``monthly``
+    and ``query_range`` ranges are consistent.
+    """
+
+    __slots__ = ('_structure_lock',)
+
+    def __init__(self):
+        super().__init__()
+        self._structure_lock = Lock()
+
+    def _new_month(self) -> _Month:
+        return _Month(Lock())
+
+    def _day(self, date: str) -> _Day:
+        day = self._days.get(date)
+        if day is None:
+            with self._structure_lock:
+                day = super()._day(date)
+        return day
+
+    def drop_day(self, date: str) -> None:
+        with self._structure_lock:
+            month = self._days[date].month
+            with month.lock:
+                super().drop_day(date)
+
+    def _dates_between(self, start: str, end: str) -> list:
+        with self._structure_lock:
+            return super()._dates_between(start, end)
+
+    def _store_fields(self, day: _Day, hour: int, fields: list) -> None:
+        with day.month.lock:
+            super()._store_fields(day, hour, fields)
+
+    def _store_batch(self, day: _Day, hours, column_values: list) -> None:
+        with day.month.lock:
+            super()._store_batch(day, hours, column_values)
+
+    def seal(self, date: str) -> None:
+        with self._days[date].month.lock:
+            super().seal(date)
+
+    def daily(self, date: str, column: str) -> Aggregate:
+        with self._days[date].month.lock:
+            return super().daily(date, column)
+
+    def monthly(self, month: str, column: str) -> Aggregate:
+        with self._months[month].lock:
+            return super().monthly(month, column)
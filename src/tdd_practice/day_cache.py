@@ -0,0 +1,159 @@
+"""Read-through LRU cache of decoded day blocks in front of a weather store or file."""
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from threading import Lock
+from typing import NamedTuple
+
+from .weather_file import WeatherFile
+from .weather_store import COLUMNS, HOURS_PER_DAY, DayView, WeatherStore, _Day
+
+BLOCK_BYTES = 8 * HOURS_PER_DAY * len(COLUMNS)
+
+
+class CacheStats(NamedTuple):
+    """Counters of a :class:`DayCache` since it was created."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    capacity: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache, 0.0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DayCache(Mapping):
+    """
+    Bounded ``storage[date][hour][metric]`` view that keeps recently read days decoded.
+
+    Reading a sealed day of a WeatherStore decompresses it, and reading a day
+    of a WeatherFile goes through the mapping; a dashboard that asks for the
+    same recent dates over and over pays that on every lookup. The cache
+    keeps the decoded blocks of the ``capacity`` most recently used days and
+    evicts the least recently used one when full. Every block has the same
+    size, ``BLOCK_BYTES`` of values, so memory is bounded by ``capacity``.
+
+    Over a WeatherStore the cache registers as an observer, so every write,
+    including those made through the ``store_*`` functions, invalidates the
+    cached day; days dropped from the store are noticed on the next lookup.
+    A WeatherFile is read-only and is never invalidated. Blocks from a file
+    are copied out of the mapping, so the file can be closed independently.
+
+    Lookups and invalidations may come from different threads.
+
+    Args:
+        source: The WeatherStore or WeatherFile to read through
+        capacity: Most days to keep decoded
+
+    Raises:
+        TypeError: If source is neither a WeatherStore nor a WeatherFile
+        ValueError: If capacity is not positive
+    """
+
+    __slots__ = (
+        'source', 'capacity', '_blocks', '_lock', '_generation',
+        '_hits', '_misses', '_evictions', '_invalidations',
+    )
+
+    def __init__(self, source, capacity: int = 256):
+        if not isinstance(source, (WeatherStore, WeatherFile)):
+            raise TypeError(f"DayCache needs a WeatherStore or WeatherFile, got {type(source).__name__}")
+        if capacity < 1:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.source = source
+        self.capacity = capacity
+        # date -> (the store's day the block was decoded from, or None, block)
+        self._blocks = OrderedDict()
+        self._lock = Lock()
+        # Bumped by every invalidation, so a block decoded before a write
+        # that raced with it is not cached.
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        if isinstance(source, WeatherStore):
+            source.add_observer(self._on_write)
+
+    def _load(self, date) -> tuple:
+        """Return ``(origin, block)`` for a date from the source."""
+        source = self.source
+        if isinstance(source, WeatherStore):
+            origin = source._days[date]
+            return origin, origin.readable()
+        position = source._position(date)
+        if position < 0:
+            raise KeyError(date)
+        day = source._read_day(position)
+        return None, _Day(array('d', day.values), array('L', day.mask))
+
+    def _current(self, date, origin, block: _Day) -> bool:
+        """False once the store has dropped, replaced or sealed the day since it was cached."""
+        if origin is None:
+            return True
+        return self.source._days.get(date) is origin and block.values is not None
+
+    def __getitem__(self, date):
+        with self._lock:
+            entry = self._blocks.get(date)
+            if entry is not None and self._current(date, *entry):
+                self._blocks.move_to_end(date)
+                self._hits += 1
+                return DayView(entry[1])
+            if entry is not None:
+                del self._blocks[date]
+            self._misses += 1
+            generation = self._generation
+        # Decode outside the lock so other dates stay readable meanwhile.
+        origin, block = self._load(date)
+        with self._lock:
+            if generation == self._generation:
+                self._blocks[date] = (origin, block)
+                self._blocks.move_to_end(date)
+                if len(self._blocks) > self.capacity:
+                    self._blocks.popitem(last=False)
+                    self._evictions += 1
+        return DayView(block)
+
+    def __contains__(self, date):
+        return date in self.source
+
+    def __iter__(self):
+        return iter(self.source)
+
+    def __len__(self):
+        return len(self.source)
+
+    def _on_write(self, date: str, hours, column_values: list) -> None:
+        self.invalidate(date)
+
+    def invalidate(self, date: str = None) -> None:
+        """Forget the cached block of a date, or of every date when omitted."""
+        with self._lock:
+            self._generation += 1
+            if date is None:
+                self._invalidations += len(self._blocks)
+                self._blocks.clear()
+            elif self._blocks.pop(date, None) is not None:
+                self._invalidations += 1
+
+    def stats(self) -> CacheStats:
+        """Return the hit, miss, eviction and invalidation counts and the current size."""
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, self._invalidations,
+                len(self._blocks), self.capacity,
+            )
+
+    def close(self) -> None:
+        """Stop observing the store and drop every cached block."""
+        if isinstance(self.source, WeatherStore):
+            self.source.remove_observer(self._on_write)
+        self.invalidate()
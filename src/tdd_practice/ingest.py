@@ -0,0 +1,226 @@
+"""Streaming ingestion of hourly sensor files into weather storage.
+
+Sensor files hold one reading per row with ``date``, ``hour``, ``metric`` and
+``value`` columns, either as CSV with a header line or as newline-delimited
+JSON objects. ``metric`` names a column of the weather store: ``rainfall``,
+``temperature.max``, ``temperature.min``, ``temperature.average``,
+``wind_speed.min`` or ``wind_speed.max``.
+
+Files are read in fixed-size chunks of rows, so memory use is bounded by the
+chunk size no matter how large the file is.
+"""
+
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from math import isfinite
+from pathlib import Path
+
+from .bulk import Reject, store_grouped
+from .weather_store import COLUMN_DTYPES, WeatherStore
+
+FIELDS = ('date', 'hour', 'metric', 'value')
+DEFAULT_CHUNK_SIZE = 10_000
+MAX_KEPT_REJECTS = 1_000
+
+
+@dataclass
+class IngestReport:
+    """Running totals for one ingestion; rejects keeps the first MAX_KEPT_REJECTS."""
+
+    rows: int = 0
+    stored: int = 0
+    rejected: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+    rejects: list = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _row(record: dict) -> tuple:
+    return tuple(record.get(name) for name in FIELDS)
+
+
+def _csv_rows(lines):
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    for row in reader:
+        if row:
+            yield _row(dict(zip(header, row)))
+
+
+def _ndjson_rows(lines):
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield _row(record) if isinstance(record, dict) else None
+
+
+def _integer(value) -> int:
+    """Parse a whole number from CSV text or a JSON number, refusing bools and fractions."""
+    if isinstance(value, bool):
+        raise TypeError(f"Expected a whole number, got {value!r}")
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"Expected a whole number, got {value!r}")
+    return int(value)
+
+
+def _number(value) -> float:
+    """Parse a finite number from CSV text or a JSON number, refusing bools, NaN and infinities."""
+    if isinstance(value, bool):
+        raise TypeError(f"Expected a number, got {value!r}")
+    number = float(value)
+    if not isfinite(number):
+        raise ValueError(f"Expected a finite number, got {value!r}")
+    return number
+
+
+def parse_rows(rows, start: int = 0) -> tuple[dict, list[Reject]]:
+    """
+    Validate raw ``(date, hour, metric, value)`` rows and group them by column and date.
+
+    Hours and values may still be strings; a row of None marks a line that
+    could not be parsed at all.
+
+    Args:
+        rows: Iterable of raw rows
+        start: Index of the first row, used to number rejects
+
+    Returns:
+        A ``{column: {date: [(index, hour, value), ...]}}`` dict of valid rows
+        and the list of rejected rows.
+    """
+    columns = {}
+    rejects = []
+    for index, row in enumerate(rows, start):
+        try:
+            date, hour, column, value = row
+        except (TypeError, ValueError):
+            rejects.append(Reject(index, "Malformed row"))
+            continue
+        if not date:
+            rejects.append(Reject(index, "Missing date"))
+            continue
+        dtype = COLUMN_DTYPES.get(column)
+        if dtype is None:
+            rejects.append(Reject(index, f"Unknown metric {column!r}"))
+            continue
+        try:
+            hour = _integer(hour)
+            value = _integer(value) if dtype is int else _number(value)
+        except (TypeError, ValueError):
+            rejects.append(Reject(index, f"Invalid hour or value in {row!r}"))
+            continue
+        if hour < 0 or hour > 23:
+            rejects.append(Reject(index, f"Hour must be between 0 and 23, got {hour}"))
+            continue
+        groups = columns.get(column)
+        if groups is None:
+            groups = columns[column] = {}
+        dated = groups.get(date)
+        if dated is None:
+            dated = groups[date] = []
+        dated.append((index, hour, value))
+    return columns, rejects
+
+
+def store_columns(columns: dict, storage) -> list[Reject]:
+    """
+    Store rows grouped by :func:`parse_rows` and return the rows storage rejected.
+
+    Args:
+        columns: ``{column: {date: [(index, hour, value), ...]}}`` rows
+        storage: Dictionary to store the weather data, organized by date and hour,
+            or a WeatherStore
+    """
+    rejects = []
+    for column, groups in columns.items():
+        metric, _, metric_field = column.partition('.')
+        if isinstance(storage, WeatherStore):
+            rejects.extend(storage.store_grouped(metric, groups, field=metric_field or None))
+        else:
+            store_grouped(metric, groups, storage, field=metric_field or None)
+    return rejects
+
+
+def _detect_format(source) -> str:
+    name = str(getattr(source, 'name', source))
+    return 'ndjson' if name.endswith(('.ndjson', '.jsonl', '.json')) else 'csv'
+
+
+def ingest_chunks(source, storage, chunk_size: int = DEFAULT_CHUNK_SIZE, format: str = None):
+    """
+    Stream a sensor file into storage one chunk at a time.
+
+    Args:
+        source: Path to the file, or an open text file object
+        storage: Dictionary to store the weather data, organized by date and hour,
+            or a WeatherStore
+        chunk_size: Number of rows parsed, validated and stored per chunk
+        format: 'csv' or 'ndjson'; detected from the file name when omitted
+
+    Yields:
+        The running IngestReport after each chunk has been stored.
+
+    Raises:
+        ValueError: If format or chunk_size is invalid
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    format = format or _detect_format(source)
+    if format == 'csv':
+        parse = _csv_rows
+    elif format == 'ndjson':
+        parse = _ndjson_rows
+    else:
+        raise ValueError(f"Unknown format {format!r}, expected 'csv' or 'ndjson'")
+
+    if isinstance(source, (str, Path)):
+        with open(source, newline='') as lines:
+            yield from _ingest_rows(parse(lines), storage, chunk_size)
+    else:
+        yield from _ingest_rows(parse(source), storage, chunk_size)
+
+
+def _ingest_rows(rows, storage, chunk_size: int):
+    report = IngestReport()
+    started = time.perf_counter()
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        columns, rejects = parse_rows(chunk, report.rows)
+        rejects.extend(store_columns(columns, storage))
+
+        report.rows += len(chunk)
+        report.rejected += len(rejects)
+        report.stored = report.rows - report.rejected
+        report.chunks += 1
+        room = MAX_KEPT_REJECTS - len(report.rejects)
+        if room > 0:
+            report.rejects.extend(sorted(rejects)[:room])
+        report.seconds = time.perf_counter() - started
+        yield report
+
+
+def ingest(source, storage, chunk_size: int = DEFAULT_CHUNK_SIZE, format: str = None) -> IngestReport:
+    """
+    Ingest a whole sensor file into storage and return the final report.
+
+    See :func:`ingest_chunks` for the arguments.
+    """
+    report = IngestReport()
+    for report in ingest_chunks(source, storage, chunk_size, format):
+        pass
+    return report
@@ -0,0 +1,254 @@
+"""Opt-in counters and latency histograms for the store_* write functions.
+
+Instrumentation is off by default. While it is off, each store_* call pays
+for a single ``active is None`` check::
+
+    metrics = instrumentation.enable(storage)
+    store_rainfall('2024-01-15', 10, 5.5, storage)
+    metrics.snapshot()['metrics']['rainfall']['writes']   # 1
+    serve_metrics(metrics, port=9100)                    # GET /metrics
+    instrumentation.disable()
+
+Single writes count overwrites of a reading already stored for the date and
+hour; ``store_*_many`` batches count writes and rejects and time the whole
+batch, without checking for overwrites.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .weather_store import METRIC_FIELDS, WeatherStore
+
+# Upper bounds in seconds of the latency histogram buckets; the last,
+# implicit bucket is +Inf.
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2, 1e-1)
+
+PREFIX = 'tdd_weather'
+
+active = None
+
+
+class Histogram:
+    """Latency histogram over ``LATENCY_BUCKETS``."""
+
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """Return ``(upper bound, observations at or below it)`` pairs, ending with +Inf."""
+        total = 0
+        buckets = []
+        for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class _MetricStats:
+    __slots__ = ('writes', 'overwrites', 'rejects', 'single', 'batch')
+
+    def __init__(self):
+        self.writes = 0
+        self.overwrites = 0
+        self.rejects = 0
+        self.single = Histogram()
+        self.batch = Histogram()
+
+
+def _is_stored(storage, metric: str, date: str, hour: int) -> bool:
+    # A WeatherStore answers from its presence masks: looking the day up
+    # would build a view of it, and decode it if it is sealed.
+    if type(storage) is not dict and isinstance(storage, WeatherStore):
+        return storage._has_reading(date, hour, metric)
+    day = storage.get(date)
+    record = day.get(hour) if day is not None else None
+    return record is not None and metric in record
+
+
+def store_size(storage) -> dict:
+    """Return the number of stored days and ``{metric: readings}`` of a storage."""
+    if isinstance(storage, WeatherStore):
+        return {'days': len(storage), 'readings': storage.reading_counts()}
+    readings = dict.fromkeys(METRIC_FIELDS, 0)
+    for day in list(storage.values()):
+        for record in list(day.values()):
+            for metric in record:
+                if metric in readings:
+                    readings[metric] += 1
+    return {'days': len(storage), 'readings': readings}
+
+
+class WriteMetrics:
+    """
+    Per-metric write, overwrite and reject counters with latency histograms.
+
+    Args:
+        storage: Optional storage whose size is reported with each snapshot
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage
+        self._stats = {metric: _MetricStats() for metric in METRIC_FIELDS}
+        self._lock = threading.Lock()
+
+    def start_write(self, metric: str, storage, date: str, hour: int):
+        """
+        Begin timing a single write; counts a reject if the hour is invalid.
+
+        Returns:
+            A token for :meth:`finish_write`, or None if the write was rejected.
+        """
+        if hour < 0 or hour > 23:
+            with self._lock:
+                self._stats[metric].rejects += 1
+            return None
+        return _is_stored(storage, metric, date, hour), time.perf_counter()
+
+    def finish_write(self, metric: str, token) -> None:
+        """Record a single write begun with :meth:`start_write`."""
+        if token is None:
+            return
+        overwrite, started = token
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            stats = self._stats[metric]
+            stats.writes += 1
+            stats.overwrites += overwrite
+            stats.single.observe(elapsed)
+
+    def record_batch(self, metric: str, rows: int, rejected: int, started: float) -> None:
+        """Record a ``store_*_many`` batch of ``rows`` readings timed from ``started``."""
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            stats = self._stats[metric]
+            stats.writes += rows - rejected
+            stats.rejects += rejected
+            stats.batch.observe(elapsed)
+
+    def snapshot(self) -> dict:
+        """
+        Return the current counters as plain data.
+
+        Returns:
+            ``{'metrics': {metric: {'writes', 'overwrites', 'rejects', 'latency'}},
+            'store': {'days', 'readings'} or None}``, where ``latency`` holds
+            ``{'single', 'batch'}`` histograms as ``{'buckets', 'sum', 'count'}``.
+        """
+        with self._lock:
+            metrics = {
+                metric: {
+                    'writes': stats.writes,
+                    'overwrites': stats.overwrites,
+                    'rejects': stats.rejects,
+                    'latency': {
+                        kind: {
+                            'buckets': histogram.cumulative(),
+                            'sum': histogram.sum,
+                            'count': histogram.count,
+                        }
+                        for kind, histogram in (('single', stats.single), ('batch', stats.batch))
+                    },
+                }
+                for metric, stats in self._stats.items()
+            }
+        size = store_size(self.storage) if self.storage is not None else None
+        return {'metrics': metrics, 'store': size}
+
+    def prometheus_text(self) -> str:
+        """Render the snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        metrics = snapshot['metrics']
+        lines = []
+        for counter, help_text in (
+            ('writes', "Readings written by store_* calls."),
+            ('overwrites', "Single writes that replaced a stored reading."),
+            ('rejects', "Readings rejected for an invalid hour, or in batches an invalid hour, date or value."),
+        ):
+            name = f"{PREFIX}_{counter}_total"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for metric, stats in metrics.items():
+                lines.append(f'{name}{{metric="{metric}"}} {stats[counter]}')
+
+        name = f"{PREFIX}_write_seconds"
+        lines.append(f"# HELP {name} Latency of single store_* calls and store_*_many batches.")
+        lines.append(f"# TYPE {name} histogram")
+        for metric, stats in metrics.items():
+            for kind, histogram in stats['latency'].items():
+                labels = f'metric="{metric}",kind="{kind}"'
+                for bound, count in histogram['buckets']:
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram['sum']!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram['count']}")
+
+        size = snapshot['store']
+        if size is not None:
+            lines.append(f"# HELP {PREFIX}_store_days Days held by the storage.")
+            lines.append(f"# TYPE {PREFIX}_store_days gauge")
+            lines.append(f"{PREFIX}_store_days {size['days']}")
+            lines.append(f"# HELP {PREFIX}_store_readings Hourly readings held by the storage.")
+            lines.append(f"# TYPE {PREFIX}_store_readings gauge")
+            for metric, count in size['readings'].items():
+                lines.append(f'{PREFIX}_store_readings{{metric="{metric}"}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def enable(storage=None) -> WriteMetrics:
+    """Start instrumenting store_* calls and return the new metrics."""
+    global active
+    active = WriteMetrics(storage)
+    return active
+
+
+def disable() -> None:
+    """Stop instrumenting store_* calls."""
+    global active
+    active = None
+
+
+def serve_metrics(metrics: WriteMetrics, port: int = 9100, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """
+    Serve metrics over HTTP from a daemon thread.
+
+    ``GET /metrics`` returns the Prometheus text format and ``GET /snapshot``
+    returns the snapshot as JSON. Call ``shutdown()`` on the returned server
+    to stop it; pass ``port=0`` to pick a free port, available as
+    ``server.server_address[1]``.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == '/metrics':
+                body = metrics.prometheus_text().encode()
+                content_type = 'text/plain; version=0.0.4'
+            elif self.path == '/snapshot':
+                body = json.dumps(metrics.snapshot(), default=str).encode()
+                content_type = 'application/json'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name='weather-metrics', daemon=True).start()
+    return server
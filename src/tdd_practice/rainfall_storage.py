@@ -1,20 +1,5 @@
-def store_rainfall(date: str, hour: int, rainfall_value: float, storage: dict) -> None:
-    """
-    Store rainfall value for a specific date and hour.
-    
-    Args:
-        date: The date in format 'YYYY-MM-DD' (e.g., '2024-01-15')
-        hour: The hour (0-23) for which to store rainfall data
-        rainfall_value: The rainfall value to store
-        storage: Dictionary to store the weather data, organized by date and hour
-    
-    Raises:
-        ValueError: If hour is not in the valid range (0-23)
-    """
-    if hour < 0 or hour > 23:
-        raise ValueError(f"Hour must be between 0 and 23, got {hour}")
-    if date not in storage:
-        storage[date] = {}
-    if hour not in storage[date]:
-        storage[date][hour] = {}
-    storage[date][hour]['rainfall'] = rainfall_value
\ No newline at end of file
+from .store_functions import STORE_FUNCTIONS, STORE_MANY_FUNCTIONS
+
+# Generated from the metric registry; see store_functions.
+store_rainfall = STORE_FUNCTIONS['rainfall']
+store_rainfall_many = STORE_MANY_FUNCTIONS['rainfall']
@@ -0,0 +1,104 @@
+"""Compact value types for temperature and wind speed readings."""
+
+from collections.abc import Mapping
+
+from .registry import METRICS
+
+
+class _Reading(Mapping):
+    """
+    Fixed-field reading that behaves like the equivalent payload dict.
+
+    Fields are stored in ``__slots__`` instead of a per-reading dict. A field
+    set to None is absent, so partial readings compare equal to dicts that
+    omit the field.
+    """
+
+    __slots__ = ()
+    FIELDS = ()
+
+    @classmethod
+    def from_mapping(cls, data: Mapping):
+        """
+        Build a reading from a payload dict such as ``{'min': 5.0, 'max': 15.0}``.
+
+        Raises:
+            TypeError: If data has keys that are not fields of the reading
+        """
+        return cls(**data)
+
+    def __getitem__(self, name):
+        if name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                return value
+        raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        if name not in self.FIELDS:
+            raise KeyError(name)
+        setattr(self, name, value)
+
+    def __iter__(self):
+        return (name for name in self.FIELDS if getattr(self, name) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self)
+        return f"{type(self).__name__}({fields})"
+
+
+class TemperatureReading(_Reading):
+    """Hourly temperature with 'max', 'min' and 'average' fields."""
+
+    __slots__ = ('max', 'min', 'average')
+    FIELDS = ('max', 'min', 'average')
+
+    def __init__(self, max: float = None, min: float = None, average: float = None):
+        self.max = max
+        self.min = min
+        self.average = average
+
+
+class WindReading(_Reading):
+    """Hourly wind speed with 'min' and 'max' fields."""
+
+    __slots__ = ('min', 'max')
+    FIELDS = ('min', 'max')
+
+    def __init__(self, min: float = None, max: float = None):
+        self.min = min
+        self.max = max
+
+
+def reading_type(name: str, fields: tuple) -> type:
+    """Create a slotted reading type with the given fields, all defaulting to None."""
+
+    def __init__(self, **values):
+        for field in fields:
+            setattr(self, field, values.pop(field, None))
+        if values:
+            raise TypeError(f"{name}() got unexpected fields {sorted(values)}")
+
+    return type(name, (_Reading,), {
+        '__slots__': fields,
+        'FIELDS': fields,
+        '__init__': __init__,
+        '__doc__': f"Hourly reading with {', '.join(map(repr, fields))} fields.",
+    })
+
+
+_DEFINED = {
+    'temperature': TemperatureReading,
+    'wind_speed': WindReading,
+}
+
+# Reading type of every composite metric in the registry.
+READING_TYPES = {
+    name: _DEFINED.get(name) or reading_type(
+        ''.join(part.title() for part in name.split('_')) + 'Reading', spec.fields)
+    for name, spec in METRICS.items()
+    if spec.fields is not None
+}
@@ -0,0 +1,115 @@
+"""Registry of the weather metrics every storage backend knows about.
+
+Each metric declares its schema once here; the store columns, the store_*
+and store_*_many functions, the reading types and the ingestion feeds are
+all derived from it. Adding a metric is one more entry in ``METRICS``, or a
+:func:`register_metric` call made before the storage modules are imported::
+
+    from tdd_practice.registry import MetricSpec, register_metric
+    register_metric(MetricSpec('humidity', description='relative humidity value'))
+
+    from tdd_practice.store_functions import STORE_FUNCTIONS
+    STORE_FUNCTIONS['humidity']('2024-01-15', 10, 81.5, storage)
+
+The columns are fixed once ``weather_store`` is imported, and weather files
+record them in their header.
+"""
+
+from dataclasses import dataclass
+from keyword import iskeyword
+
+DTYPES = (float, int)
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """
+    Schema of one metric.
+
+    Attributes:
+        name: Metric name, used as the key in ``storage[date][hour]``
+        fields: Field names of a composite reading such as ``('min', 'max')``,
+            or None for a scalar metric stored as a single number
+        dtype: float, or int for whole-number metrics that must be stored
+            as ints and read back as ints
+        description: What one reading is, for generated docstrings
+        argument: Name of the reading parameter of ``store_<metric>``;
+            ``<name>_data`` for composite metrics and ``<name>_value`` for
+            scalar ones unless given
+    """
+
+    name: str
+    fields: tuple = None
+    dtype: type = float
+    description: str = ''
+    argument: str = None
+
+    def __post_init__(self):
+        if not self.name.isidentifier():
+            raise ValueError(f"Metric names must be identifiers, got {self.name!r}")
+        if self.argument is None:
+            suffix = 'value' if self.fields is None else 'data'
+            object.__setattr__(self, 'argument', f"{self.name}_{suffix}")
+        elif (not self.argument.isidentifier() or iskeyword(self.argument)
+              or self.argument.startswith('_') or self.argument in ('date', 'hour', 'storage')):
+            raise ValueError(f"Metric {self.name!r} needs a public argument name other than "
+                             f"date, hour and storage, got {self.argument!r}")
+        if self.fields is not None and (not self.fields or len(set(self.fields)) != len(self.fields)):
+            raise ValueError(f"Metric {self.name!r} needs distinct field names, got {self.fields!r}")
+        if self.dtype not in DTYPES:
+            raise ValueError(f"Metric {self.name!r} dtype must be float or int, got {self.dtype!r}")
+
+    @property
+    def columns(self) -> tuple:
+        """Column names of the metric: ``name.field`` per field, or ``name``."""
+        if self.fields is None:
+            return (self.name,)
+        return tuple(f"{self.name}.{field}" for field in self.fields)
+
+
+def _registry(*specs: MetricSpec) -> dict:
+    registry = {}
+    for spec in specs:
+        if spec.name in registry:
+            raise ValueError(f"Metric {spec.name!r} is registered twice")
+        registry[spec.name] = spec
+    return registry
+
+
+METRICS = _registry(
+    MetricSpec(
+        'temperature',
+        ('max', 'min', 'average'),
+        description="temperature data, a dictionary containing 'max', 'min', and 'average' values",
+    ),
+    MetricSpec('rainfall', description="rainfall value"),
+    MetricSpec(
+        'wind_speed',
+        ('min', 'max'),
+        description="wind speed data, a dictionary containing 'min' and 'max' values",
+    ),
+)
+
+_frozen = False
+
+
+def register_metric(spec: MetricSpec) -> MetricSpec:
+    """
+    Add a metric to the registry.
+
+    Raises:
+        ValueError: If a metric with the same name is registered
+        RuntimeError: If the store columns have already been built
+    """
+    if _frozen:
+        raise RuntimeError("Metrics must be registered before weather_store is imported")
+    if spec.name in METRICS:
+        raise ValueError(f"Metric {spec.name!r} is registered twice")
+    METRICS[spec.name] = spec
+    return spec
+
+
+def freeze() -> None:
+    """Reject further registrations; called once the store columns are built."""
+    global _frozen
+    _frozen = True
@@ -0,0 +1,205 @@
+"""Tiered retention: hourly readings roll up into daily, then monthly summaries."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date as _date
+
+from .aggregates import Aggregate
+from .weather_store import (
+    COLUMN_INDEX,
+    COLUMNS,
+    WeatherStore,
+    _EMPTY_STATS,
+    _aggregate,
+    _Day,
+    day_number,
+)
+
+
+class _Summary:
+    """Running [sum, min, max] and count per column, as kept by a month."""
+
+    __slots__ = ('stats', 'counts')
+
+    def __init__(self):
+        self.stats = array('d', _EMPTY_STATS)
+        self.counts = array('q', [0] * len(COLUMNS))
+
+    @classmethod
+    def of_day(cls, day: _Day) -> '_Summary':
+        summary = cls()
+        summary.stats = array('d', day.stats)
+        summary.counts = array('q', [bits.bit_count() for bits in day.mask])
+        return summary
+
+    def merge(self, other: '_Summary') -> None:
+        stats = self.stats
+        for column, count in enumerate(other.counts):
+            if not count:
+                continue
+            base = 3 * column
+            stats[base] += other.stats[base]
+            stats[base + 1] = min(stats[base + 1], other.stats[base + 1])
+            stats[base + 2] = max(stats[base + 2], other.stats[base + 2])
+            self.counts[column] += count
+
+    def aggregate(self, column: int) -> Aggregate:
+        return _aggregate(self.stats, column, self.counts[column])
+
+
+def _month_index(month: str) -> int:
+    return int(month[:4]) * 12 + int(month[5:7]) - 1
+
+
+class TieredWeatherStore(WeatherStore):
+    """
+    WeatherStore that keeps hourly readings only for its most recent days.
+
+    Days more than ``hourly_days`` before the newest stored date are rolled up
+    into daily summaries, and months more than ``daily_months`` before the
+    newest date's month are rolled up again into monthly summaries. Each
+    summary keeps the sum, count, minimum and maximum of every column, which
+    covers rainfall totals, temperature min/max/mean and wind min/max, so
+    memory grows with the number of months rather than hours of history.
+
+    Roll-ups run automatically whenever a write creates a newer date, or on
+    demand through :meth:`roll_up`. The store reads and writes like any
+    WeatherStore for its hourly days; ``daily``, ``monthly`` and
+    ``daily_range`` answer from the finest tier holding the date. Dates
+    older than the hourly retention window, including every rolled-up date,
+    cannot be written, also through a DayWriter obtained before the roll-up.
+
+    Args:
+        hourly_days: Days of hourly readings to keep, counting the newest date
+        daily_months: Months of daily summaries to keep, counting the newest month
+    """
+
+    __slots__ = (
+        'hourly_days', 'daily_months', '_daily', '_daily_dates', '_monthly', '_newest', '_horizon',
+    )
+
+    def __init__(self, hourly_days: int = 30, daily_months: int = 12):
+        if hourly_days < 1 or daily_months < 1:
+            raise ValueError("hourly_days and daily_months must be positive")
+        super().__init__()
+        self.hourly_days = hourly_days
+        self.daily_months = daily_months
+        self._daily = {}
+        self._daily_dates = []
+        self._monthly = {}
+        self._newest = None
+        # Day number of the oldest date still kept hourly.
+        self._horizon = 0
+
+    def _check_date(self, date: str) -> int:
+        number = super()._check_date(date)
+        if number < self._horizon:
+            raise ValueError(f"{date} is older than the hourly retention of {self.hourly_days} days")
+        return number
+
+    def _day(self, date: str) -> _Day:
+        day = self._days.get(date)
+        if day is None:
+            day = super()._day(date)
+            if self._newest is None or date > self._newest:
+                self._newest = date
+                self.roll_up(date)
+        return day
+
+    def tier_of(self, date: str):
+        """Return 'hourly', 'daily' or 'monthly', the finest tier holding a date, or None."""
+        if date in self._days:
+            return 'hourly'
+        if date in self._daily:
+            return 'daily'
+        if date[:7] in self._monthly:
+            return 'monthly'
+        return None
+
+    def roll_up(self, today: str = None) -> None:
+        """
+        Roll up days and months that fell out of their tier's retention.
+
+        Args:
+            today: Date the retention periods count back from; the newest
+                stored date when omitted
+        """
+        today = today or self._newest
+        if today is None:
+            return
+        self._horizon = max(self._horizon, day_number(today) - self.hourly_days + 1)
+        oldest_hourly = _date.fromordinal(self._horizon).isoformat()
+        for date in self._dates[:bisect_left(self._dates, oldest_hourly)]:
+            self._roll_day(date)
+
+        oldest_daily = _month_index(today) - self.daily_months + 1
+        months = {date[:7] for date in self._daily_dates} | set(self._months)
+        for month in sorted(months):
+            if _month_index(month) < oldest_daily:
+                self._roll_month(month)
+
+    def _roll_day(self, date: str) -> None:
+        self._daily[date] = _Summary.of_day(self._days[date])
+        self._daily_dates.insert(bisect_left(self._daily_dates, date), date)
+        self.drop_day(date)
+
+    def _roll_month(self, month: str) -> None:
+        year, number = int(month[:4]), int(month[5:7])
+        following = _date(year + number // 12, number % 12 + 1, 1).toordinal()
+        self._horizon = max(self._horizon, following)
+        summary = self._monthly.get(month)
+        if summary is None:
+            summary = self._monthly[month] = _Summary()
+        low = bisect_left(self._dates, f"{month}-01")
+        high = bisect_right(self._dates, f"{month}-31")
+        for date in self._dates[low:high]:
+            summary.merge(_Summary.of_day(self._days[date]))
+            self.drop_day(date)
+        low = bisect_left(self._daily_dates, f"{month}-01")
+        high = bisect_right(self._daily_dates, f"{month}-31")
+        for date in self._daily_dates[low:high]:
+            summary.merge(self._daily.pop(date))
+        del self._daily_dates[low:high]
+
+    def daily(self, date: str, column: str) -> Aggregate:
+        """
+        Return a column's aggregate for a date from its hourly readings or daily summary.
+
+        Raises:
+            KeyError: If the date is not kept at daily resolution or the column is unknown
+        """
+        if date in self._days:
+            return super().daily(date, column)
+        return self._daily[date].aggregate(COLUMN_INDEX[column])
+
+    def daily_range(self, start: str, end: str, column: str):
+        """Yield ``(date, Aggregate)`` in date order for the dates kept at daily resolution or finer."""
+        index = COLUMN_INDEX[column]
+        low = bisect_left(self._daily_dates, start)
+        high = bisect_right(self._daily_dates, end)
+        for date in self._daily_dates[low:high]:
+            yield date, self._daily[date].aggregate(index)
+        for date in self._dates_between(start, end):
+            yield date, super().daily(date, column)
+
+    def monthly(self, month: str, column: str) -> Aggregate:
+        """
+        Return a column's aggregate over a month, combining every tier holding it.
+
+        Raises:
+            KeyError: If nothing is kept for the month or the column is unknown
+        """
+        index = COLUMN_INDEX[column]
+        summary = self._monthly.get(month)
+        if summary is not None:
+            return summary.aggregate(index)
+        low = bisect_left(self._daily_dates, f"{month}-01")
+        high = bisect_right(self._daily_dates, f"{month}-31")
+        if low == high:
+            return super().monthly(month, column)
+        combined = Aggregate()
+        for date in self._daily_dates[low:high]:
+            combined.merge(self._daily[date].aggregate(index))
+        if month in self._months:
+            combined.merge(super().monthly(month, column))
+        return combined
@@ -0,0 +1,183 @@
+"""Lazy hourly series across dates, with incremental rolling windows."""
+
+from collections import deque
+from datetime import date as _date
+from math import fsum, isfinite
+
+from .weather_store import COLUMN_INDEX, HOURS_PER_DAY, DayView, day_number
+
+STATISTICS = ('sum', 'mean', 'count')
+
+
+def _add_exact(partials: list, value: float) -> None:
+    """
+    Add a finite value to an exact sum kept as non-overlapping partials.
+
+    This is the running form of the algorithm behind ``math.fsum``: the
+    partials hold every bit of the sum, so values can be added and taken out
+    again without rounding errors piling up, and ``fsum(partials)`` rounds
+    the exact sum once.
+    """
+    index = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[index] = low
+            index += 1
+        value = high
+    partials[index:] = [value]
+
+
+def _window_sum(partials: list, infinities: dict) -> float:
+    positive, negative = infinities[1], infinities[-1]
+    if positive and negative:
+        return float('nan')
+    if positive or negative:
+        return float('inf') if positive else float('-inf')
+    return fsum(partials)
+
+
+class HourlySeries:
+    """
+    One column's hourly readings from ``start`` 00:00 to ``end`` 23:00, in order.
+
+    The series is lazy: iterating it walks the storage a day at a time and
+    reads each value straight out of the day's block (or nested dict), so
+    nothing is materialized and each date is looked up once.
+
+    Hours without a reading are skipped, or yielded as ``fill`` when it is
+    given, e.g. ``fill=0.0`` for rainfall or ``fill=math.nan`` to mark gaps.
+
+    Args:
+        storage: A WeatherStore, WeatherFile or nested storage dict
+        column: A column in ``COLUMNS``, e.g. 'rainfall' or 'temperature.average'
+        start: First date, in format 'YYYY-MM-DD'
+        end: Last date, inclusive
+        fill: Value for hours without a reading; None skips them
+
+    Raises:
+        KeyError: If column is unknown
+        ValueError: If start or end is not a valid 'YYYY-MM-DD' date
+    """
+
+    __slots__ = ('storage', 'column', 'start', 'end', 'fill', '_index', '_first', '_last')
+
+    def __init__(self, storage, column: str, start: str, end: str, fill: float = None):
+        self._index = COLUMN_INDEX[column]
+        self._first = day_number(start)
+        self._last = day_number(end)
+        self.storage = storage
+        self.column = column
+        self.start = start
+        self.end = end
+        self.fill = fill
+
+    def _positioned(self):
+        """Yield ``(ordinal * 24 + hour, date, hour, value)`` for every hour in the series."""
+        fill = self.fill
+        metric, _, field = self.column.partition('.')
+        start = self._index * HOURS_PER_DAY
+        for number in range(self._first, self._last + 1):
+            date = _date.fromordinal(number).isoformat()
+            base = number * HOURS_PER_DAY
+            day = self.storage.get(date)
+            if isinstance(day, DayView):
+                block = day._day.readable()
+                values = block.values
+                bits = block.mask[self._index]
+                for hour in range(HOURS_PER_DAY):
+                    if bits >> hour & 1:
+                        yield base + hour, date, hour, values[start + hour]
+                    elif fill is not None:
+                        yield base + hour, date, hour, fill
+                continue
+            for hour in range(HOURS_PER_DAY):
+                value = None
+                if day is not None:
+                    value = day.get(hour, {}).get(metric)
+                    if field and value is not None:
+                        value = value.get(field)
+                if value is not None:
+                    yield base + hour, date, hour, value
+                elif fill is not None:
+                    yield base + hour, date, hour, fill
+
+    def __iter__(self):
+        """Yield ``(date, hour, value)`` for every hour in the series."""
+        for _, date, hour, value in self._positioned():
+            yield date, hour, value
+
+    def values(self):
+        """Yield the series' values alone."""
+        for _, _, _, value in self._positioned():
+            yield value
+
+    def rolling(self, hours: int, statistic: str = 'sum', min_periods: int = 1):
+        """
+        Yield a rolling statistic over the trailing ``hours`` hours at each step.
+
+        The window covers clock hours, not readings: at each hour of the
+        series it holds the values from the last ``hours`` hours, up to and
+        including the current one. Each step adds the new value and drops the
+        values that fell out of the window, so the cost per step is O(1)
+        amortized whatever the window size. The window's sum is kept exactly
+        and rounded once per step, so it does not drift: a window of zeros
+        sums to 0.0 however much rain fell before it. Filled hours count as
+        readings, except NaN, which is left out of the window like a missing
+        hour.
+
+        Args:
+            hours: Window length in hours
+            statistic: 'sum', 'mean' or 'count' of the values in the window
+            min_periods: Fewest values the window must hold for a result to be
+                yielded; earlier steps are skipped
+
+        Yields:
+            ``(date, hour, value)`` for every step whose window holds enough values.
+
+        Raises:
+            ValueError: If hours, statistic or min_periods is invalid
+        """
+        if hours < 1:
+            raise ValueError(f"hours must be positive, got {hours}")
+        if statistic not in STATISTICS:
+            raise ValueError(f"statistic must be one of {STATISTICS}, got {statistic!r}")
+        if min_periods < 1:
+            raise ValueError(f"min_periods must be positive, got {min_periods}")
+        window = deque()
+        partials = []
+        # Infinite readings cannot be held in partials; they are counted.
+        infinities = {1: 0, -1: 0}
+        for position, date, hour, value in self._positioned():
+            if value == value:
+                window.append((position, value))
+                if isfinite(value):
+                    _add_exact(partials, value)
+                else:
+                    infinities[1 if value > 0 else -1] += 1
+            while window and window[0][0] <= position - hours:
+                value = window.popleft()[1]
+                if isfinite(value):
+                    _add_exact(partials, -value)
+                else:
+                    infinities[1 if value > 0 else -1] -= 1
+            count = len(window)
+            if count < min_periods:
+                continue
+            if statistic == 'sum':
+                yield date, hour, _window_sum(partials, infinities)
+            elif statistic == 'mean':
+                yield date, hour, _window_sum(partials, infinities) / count
+            else:
+                yield date, hour, count
+
+    def rolling_sum(self, hours: int, min_periods: int = 1):
+        """Yield the rolling sum over the trailing ``hours`` hours; see :meth:`rolling`."""
+        return self.rolling(hours, 'sum', min_periods)
+
+    def rolling_mean(self, hours: int, min_periods: int = 1):
+        """Yield the rolling mean over the trailing ``hours`` hours; see :meth:`rolling`."""
+        return self.rolling(hours, 'mean', min_periods)
@@ -0,0 +1,108 @@
+"""Weather storage for many stations, one columnar shard per station."""
+
+from collections.abc import Mapping
+
+from .aggregates import Aggregate
+from .weather_store import WeatherStore
+
+
+class ShardedWeatherStore(Mapping):
+    """
+    Hourly weather storage keyed by (station, date, hour).
+
+    Each station's readings live in their own WeatherStore shard, created on
+    the station's first write, so a station costs one small store object on
+    top of its day blocks no matter how many stations there are. The store
+    reads as ``{station: WeatherStore}``, and a shard can be passed straight
+    to the store_* functions::
+
+        store_rainfall('2024-01-15', 10, 5.5, stations.shard('north'))
+
+    Cross-station queries combine the running daily aggregates of each shard,
+    without scanning hourly data.
+    """
+
+    __slots__ = ('_shards', '_shard_factory')
+
+    def __init__(self, shard_factory=WeatherStore):
+        self._shards = {}
+        self._shard_factory = shard_factory
+
+    def __getitem__(self, station):
+        return self._shards[station]
+
+    def __contains__(self, station):
+        return station in self._shards
+
+    def __iter__(self):
+        return iter(self._shards)
+
+    def __len__(self):
+        return len(self._shards)
+
+    def shard(self, station) -> WeatherStore:
+        """
+        Return the store for a station, creating it on first use.
+
+        Threads racing to create the same station's shard all get the one
+        that was inserted first: the insert is a single ``dict.setdefault``,
+        so no caller can end up writing to a shard that another replaced.
+        """
+        shard = self._shards.get(station)
+        if shard is None:
+            shard = self._shards.setdefault(station, self._shard_factory())
+        return shard
+
+    def store(self, station, date: str, hour: int, metric: str, data) -> None:
+        """Store a reading for a station; see :meth:`WeatherStore.store`."""
+        self.shard(station).store(date, hour, metric, data)
+
+    def store_temperature(self, station, date: str, hour: int, temperature_data: dict) -> None:
+        """Store a ``{'max', 'min', 'average'}`` temperature reading for a station."""
+        self.shard(station).store_temperature(date, hour, temperature_data)
+
+    def store_rainfall(self, station, date: str, hour: int, rainfall_value: float) -> None:
+        """Store a rainfall value for a station."""
+        self.shard(station).store_rainfall(date, hour, rainfall_value)
+
+    def store_wind_speed(self, station, date: str, hour: int, wind_speed_data: dict) -> None:
+        """Store a ``{'min', 'max'}`` wind speed reading for a station."""
+        self.shard(station).store_wind_speed(date, hour, wind_speed_data)
+
+    def daily_by_station(self, date: str, column: str) -> dict:
+        """
+        Return ``{station: Aggregate}`` of one column for every station with data on a date.
+
+        Args:
+            date: The date in format 'YYYY-MM-DD'
+            column: A column in ``COLUMNS``, e.g. 'wind_speed.max'
+        """
+        by_station = {}
+        for station, shard in self._shards.items():
+            if date in shard:
+                daily = shard.daily(date, column)
+                if daily.count:
+                    by_station[station] = daily
+        return by_station
+
+    def daily_across_stations(self, date: str, column: str) -> Aggregate:
+        """
+        Combine one column's daily aggregate across all stations.
+
+        For example ``daily_across_stations(date, 'wind_speed.max').max`` is the
+        peak wind seen by any station on that date.
+        """
+        combined = Aggregate()
+        for daily in self.daily_by_station(date, column).values():
+            combined.merge(daily)
+        return combined
+
+    def readings_at(self, date: str, hour: int, metric: str) -> dict:
+        """Return ``{station: value}`` for every station holding the metric at that hour."""
+        readings = {}
+        for station, shard in self._shards.items():
+            if date in shard:
+                record = shard[date].get(hour)
+                if record and metric in record:
+                    readings[station] = record[metric]
+        return readings
@@ -0,0 +1,334 @@
+"""WeatherStore kept in shared memory: one writer process, many zero-copy readers.
+
+Layout of the segment, in native byte order:
+
+- header: magic ``b'TDDSHMWS'``, version (u16), column count (u16), slot
+  count (u32), day number of the first slot (i64)
+- column names: one 32-byte NUL-padded ASCII name per column, in ``COLUMNS``
+  order, padded to a multiple of 8 bytes
+- day slots, one per day from the first slot's date on: a sequence counter
+  (u64) and a present flag (u32, padded to 8 bytes), one u32 presence mask
+  per column (padded to a multiple of 8 bytes), then 24 float64 values per
+  column
+
+Slots are direct-addressed, so the slot of a date sits at a fixed offset
+computed from its day number. The writer makes the sequence counter odd
+while it changes a slot and even again once done; a reader copies a slot
+and keeps the copy only if the counter was even and unchanged across it
+(a seqlock), so every day it sees is a consistent snapshot without locks.
+"""
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from collections.abc import Mapping
+from datetime import date as _date
+from multiprocessing import shared_memory
+
+try:
+    import _posixshmem
+except ImportError:
+    _posixshmem = None
+
+from .weather_file import _COLUMN_NAME_SIZE, _pad8
+from .weather_store import COLUMNS, HOURS_PER_DAY, DayView, WeatherStore, _Day, _Month, day_number
+
+MAGIC = b'TDDSHMWS'
+VERSION = 1
+
+_HEADER = struct.Struct('=8sHHIq')
+_SLOT_HEADER = struct.Struct('=QI4x')
+_SEQUENCE = struct.Struct('=Q')
+_PRESENT_OFFSET = 8
+_PRESENT = struct.Struct('=I')
+
+# Attempts at a consistent copy of a slot before a reader gives up, e.g.
+# because the writer died half-way through a write.
+_MAX_ATTEMPTS = 10_000
+
+
+class _Layout:
+    """Offsets and sizes of a segment with a given number of slots."""
+
+    __slots__ = ('slots', 'slots_offset', 'masks_size', 'slot_size', 'size')
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self.slots_offset = _pad8(_HEADER.size + len(COLUMNS) * _COLUMN_NAME_SIZE)
+        self.masks_size = _pad8(4 * len(COLUMNS))
+        self.slot_size = _SLOT_HEADER.size + self.masks_size + 8 * HOURS_PER_DAY * len(COLUMNS)
+        self.size = self.slots_offset + slots * self.slot_size
+
+    def slot_offset(self, slot: int) -> int:
+        return self.slots_offset + slot * self.slot_size
+
+
+class _Segment:
+    """
+    Mapping of an existing POSIX shared memory segment that is never
+    registered with the resource tracker.
+
+    Before Python 3.13 ``SharedMemory(name)`` registers every attached
+    segment with the resource tracker, which then either unlinks it from
+    under the writer when the reader's process exits or, when the tracker is
+    shared with the writer's process, holds one registration for both.
+    Readers map the segment themselves instead, exactly as ``SharedMemory``
+    does but without the registration.
+    """
+
+    def __init__(self, name: str):
+        fd = _posixshmem.shm_open('/' + name, os.O_RDWR, mode=0o600)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.name = name
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        if self.buf is not None:
+            self.buf.release()
+            self.buf = None
+            self._mmap.close()
+
+
+def _attach(name: str):
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    if _posixshmem is None:
+        # Windows segments are not tracked, and live while any handle is open.
+        return shared_memory.SharedMemory(name)
+    return _Segment(name)
+
+
+class SharedWeatherStore(WeatherStore):
+    """
+    WeatherStore whose day blocks live in a shared memory segment.
+
+    The store has one slot per day for ``days`` days from ``start``; each
+    stored day's values and presence masks are written straight into its
+    slot, so any number of worker processes can read them through a
+    :class:`SharedWeatherReader` without holding a copy of the history.
+    Dates outside the slots are rejected.
+
+    The store is written by one process and thread, exactly like a
+    WeatherStore: the ``store_*`` functions, bulk ingestion and day writers
+    all work unchanged, and aggregates are kept by the writer. Every write
+    to a day is wrapped in the slot's seqlock. Days are never sealed, since
+    their slots are fixed; ``seal`` leaves them as they are.
+
+    Args:
+        start: Date of the first slot, in format 'YYYY-MM-DD'
+        days: Number of day slots
+        name: Name of the segment; a unique name is chosen when omitted
+
+    Raises:
+        ValueError: If start is not a valid date or days is not positive
+        FileExistsError: If a segment with that name already exists
+    """
+
+    __slots__ = ('start', 'days', '_first', '_layout', '_memory', '_offsets')
+
+    def __init__(self, start: str, days: int, name: str = None):
+        first = day_number(start)
+        if days < 1:
+            raise ValueError(f"days must be positive, got {days}")
+        super().__init__()
+        self.start = start
+        self.days = days
+        self._first = first
+        self._layout = _Layout(days)
+        self._memory = shared_memory.SharedMemory(name, create=True, size=self._layout.size)
+        self._offsets = {}
+        # New segments are zero-filled: every slot starts even and absent.
+        buffer = self._memory.buf
+        _HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(COLUMNS), days, first)
+        for index, column in enumerate(COLUMNS):
+            offset = _HEADER.size + index * _COLUMN_NAME_SIZE
+            buffer[offset:offset + _COLUMN_NAME_SIZE] = column.encode('ascii').ljust(_COLUMN_NAME_SIZE, b'\0')
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment, for :class:`SharedWeatherReader`."""
+        return self._memory.name
+
+    def _check_date(self, date: str) -> int:
+        number = super()._check_date(date)
+        if not 0 <= number - self._first < self.days:
+            raise ValueError(f"{date} is outside the {self.days} day slots from {self.start}")
+        return number
+
+    def _bump(self, offset: int) -> None:
+        """Advance a slot's sequence counter: odd while it is written, even once done."""
+        sequence, = _SEQUENCE.unpack_from(self._memory.buf, offset)
+        _SEQUENCE.pack_into(self._memory.buf, offset, sequence + 1)
+
+    def _new_day(self, number: int, date: str, month: _Month) -> _Day:
+        offset = self._layout.slot_offset(number - self._first)
+        masks = offset + _SLOT_HEADER.size
+        values = masks + self._layout.masks_size
+        buffer = self._memory.buf
+        day = _Day(
+            buffer[values:offset + self._layout.slot_size].cast('d'),
+            buffer[masks:masks + 4 * len(COLUMNS)].cast('I'),
+            month,
+            date,
+        )
+        self._offsets[date] = offset
+        self._bump(offset)
+        _PRESENT.pack_into(buffer, offset + _PRESENT_OFFSET, 1)
+        self._bump(offset)
+        return day
+
+    def _store_fields(self, day: _Day, hour: int, fields: list) -> None:
+        offset = self._offsets[day.date]
+        self._bump(offset)
+        try:
+            super()._store_fields(day, hour, fields)
+        finally:
+            self._bump(offset)
+
+    def _store_batch(self, day: _Day, hours, column_values: list) -> None:
+        offset = self._offsets[day.date]
+        self._bump(offset)
+        try:
+            super()._store_batch(day, hours, column_values)
+        finally:
+            self._bump(offset)
+
+    def drop_day(self, date: str) -> None:
+        day = self._days[date]
+        super().drop_day(date)
+        offset = self._offsets.pop(date)
+        start = offset + _SLOT_HEADER.size
+        end = offset + self._layout.slot_size
+        self._bump(offset)
+        _PRESENT.pack_into(self._memory.buf, offset + _PRESENT_OFFSET, 0)
+        self._memory.buf[start:end] = bytes(end - start)
+        self._bump(offset)
+        day.values.release()
+        day.mask.release()
+
+    def seal(self, date: str) -> None:
+        """Leave a day as it is: shared slots have a fixed size and are never compressed."""
+        if date not in self._days:
+            raise KeyError(date)
+
+    def close(self) -> None:
+        """Detach from the segment; the store cannot be used afterwards."""
+        for day in self._days.values():
+            day.values.release()
+            day.mask.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        """Remove the segment's name; its memory is freed once every reader has closed it."""
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        self.unlink()
+
+
+class SharedWeatherReader(Mapping):
+    """
+    Read-only ``storage[date][hour][metric]`` view of a SharedWeatherStore.
+
+    The reader maps the writer's segment, so adding reader processes does
+    not add copies of the history. Each ``reader[date]`` lookup copies that
+    one day's slot under its seqlock and returns a view of the copy, which
+    is a consistent snapshot of the day even while the writer is storing
+    into it.
+
+    Args:
+        name: Name of the segment, ``SharedWeatherStore.name``
+
+    Raises:
+        FileNotFoundError: If no segment has that name
+        ValueError: If the segment is not a weather store with ``COLUMNS``
+    """
+
+    def __init__(self, name: str):
+        self._memory = _attach(name)
+        buffer = self._memory.buf
+        magic, version, n_columns, slots, first = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{name} is not a version {VERSION} shared weather store")
+        columns = tuple(
+            bytes(buffer[offset:offset + _COLUMN_NAME_SIZE]).rstrip(b'\0').decode('ascii')
+            for offset in range(_HEADER.size, _HEADER.size + n_columns * _COLUMN_NAME_SIZE,
+                                _COLUMN_NAME_SIZE)
+        )
+        if columns != COLUMNS:
+            self.close()
+            raise ValueError(f"{name} has columns {columns}, expected {COLUMNS}")
+        self._layout = _Layout(slots)
+        self._first = first
+
+    def _slot(self, date) -> int:
+        if not isinstance(date, str):
+            return -1
+        try:
+            slot = day_number(date) - self._first
+        except ValueError:
+            return -1
+        return slot if 0 <= slot < self._layout.slots else -1
+
+    def _present(self, slot: int) -> bool:
+        return bool(_PRESENT.unpack_from(self._memory.buf, self._layout.slot_offset(slot) + _PRESENT_OFFSET)[0])
+
+    def _snapshot(self, slot: int):
+        """Return a consistent copy of a slot as a day block, or None if the day is not stored."""
+        buffer = self._memory.buf
+        offset = self._layout.slot_offset(slot)
+        masks = offset + _SLOT_HEADER.size
+        values = masks + self._layout.masks_size
+        end = offset + self._layout.slot_size
+        for attempt in range(_MAX_ATTEMPTS):
+            before, present = _SLOT_HEADER.unpack_from(buffer, offset)
+            if not before & 1:
+                mask = array('I')
+                mask.frombytes(buffer[masks:masks + 4 * len(COLUMNS)])
+                block = array('d')
+                block.frombytes(buffer[values:end])
+                if _SEQUENCE.unpack_from(buffer, offset)[0] == before:
+                    return _Day(block, mask) if present else None
+            if attempt:
+                time.sleep(0)
+        raise RuntimeError(f"Slot {slot} kept changing while being read")
+
+    def __getitem__(self, date):
+        slot = self._slot(date)
+        day = self._snapshot(slot) if slot >= 0 else None
+        if day is None:
+            raise KeyError(date)
+        return DayView(day)
+
+    def __contains__(self, date):
+        slot = self._slot(date)
+        return slot >= 0 and self._present(slot)
+
+    def __iter__(self):
+        for slot in range(self._layout.slots):
+            if self._present(slot):
+                yield _date.fromordinal(self._first + slot).isoformat()
+
+    def __len__(self):
+        return sum(1 for slot in range(self._layout.slots) if self._present(slot))
+
+    def close(self) -> None:
+        self._memory.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
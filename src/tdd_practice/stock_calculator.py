@@ -1,3 +1,12 @@
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import accumulate, chain, compress, count, repeat
+from numbers import Number
+from operator import and_, gt, lt, mul, not_, or_, sub
+from typing import NamedTuple
+
+
 def sum_current_stock(A, B, C, max_fill, min_threshold):
     if max_fill <= 0:
         return 'invalid'
@@ -21,3 +30,237 @@ def sum_current_stock(A, B, C, max_fill, min_threshold):
         production_c = gap_c
         
     return production_a + production_b + production_c
+
+
+def memoized_sum_current_stock(maxsize=1024):
+    """
+    Return sum_current_stock wrapped in a bounded cache keyed on its arguments.
+
+    Sites that share max_fill/min_threshold settings and report the same
+    A, B and C levels between cycles get the stored result instead of a
+    recomputation. The least recently used of maxsize entries is evicted
+    when the cache is full; maxsize=None removes the bound.
+
+    The wrapper keeps lru_cache's cache_info() and cache_clear() and adds
+    hit_rate(), the fraction of calls answered from the cache. Caching
+    rarely pays off: sum_current_stock is a handful of comparisons, so a
+    hit is only about 10% cheaper than recomputing while a miss costs about
+    three times as much, and the cache breaks even only when some 90-95% of
+    calls repeat (see benchmarks/bench_stock_memo.py).
+    """
+    cached = lru_cache(maxsize=maxsize)(sum_current_stock)
+
+    def hit_rate():
+        info = cached.cache_info()
+        calls = info.hits + info.misses
+        return info.hits / calls if calls else 0.0
+
+    cached.hit_rate = hit_rate
+    return cached
+
+
+def _per_row(value, n):
+    if isinstance(value, Number):
+        return repeat(value, n)
+    if len(value) != n:
+        raise ValueError(f"Expected {n} per-row values, got {len(value)}")
+    return value
+
+
+def sum_current_stock_batch(A, B, C, max_fill, min_threshold):
+    """
+    Compute sum_current_stock for many sites at once.
+
+    A, B and C are equal-length sequences of stock levels, one entry per site.
+    max_fill and min_threshold may be scalars or per-site sequences.
+
+    Returns a (totals, invalid) pair: totals is a list of production totals,
+    of the same numeric type as the levels, and invalid is a list of flags
+    marking the sites that sum_current_stock would report as 'invalid'.
+    Invalid sites total 0.
+
+    All sites are computed in one list comprehension, which skips the
+    function call a loop over sum_current_stock pays per site; the validity
+    checks run per site only when min() finds an invalid input.
+    """
+    n = len(A)
+    if len(B) != n or len(C) != n:
+        raise ValueError(f"A, B and C must have the same length, got {n}, {len(B)} and {len(C)}")
+    if n == 0:
+        return [], []
+
+    if isinstance(max_fill, Number) and isinstance(min_threshold, Number):
+        fill, threshold = max_fill, min_threshold
+        totals = [
+            (fill - a if fill - a > threshold else 0)
+            + (fill - b if fill - b > threshold else 0)
+            + (fill - c if fill - c > threshold else 0)
+            for a, b, c in zip(A, B, C)
+        ]
+    else:
+        totals = [
+            (fill - a if fill - a > threshold else 0)
+            + (fill - b if fill - b > threshold else 0)
+            + (fill - c if fill - c > threshold else 0)
+            for a, b, c, fill, threshold in zip(A, B, C, _per_row(max_fill, n), _per_row(min_threshold, n))
+        ]
+    lowest_fill = max_fill if isinstance(max_fill, Number) else min(max_fill)
+    if lowest_fill > 0 and min(A) >= 0 and min(B) >= 0 and min(C) >= 0:
+        return totals, [False] * n
+
+    invalid = [
+        fill <= 0 or a < 0 or b < 0 or c < 0
+        for a, b, c, fill in zip(A, B, C, _per_row(max_fill, n))
+    ]
+    return [0 if bad else total for bad, total in zip(invalid, totals)], invalid
+
+
+def sum_production(levels, max_fill, min_threshold):
+    """
+    Sum the production needed to refill any number of products.
+
+    levels is any sized sequence or buffer (list, array, memoryview) of stock
+    levels. max_fill and min_threshold may be scalars or per-product
+    sequences. A product is refilled when its gap to max_fill exceeds
+    min_threshold. Returns 'invalid' under the same rules as
+    sum_current_stock.
+
+    The gaps are computed and thresholded with map() over operator functions,
+    so the per-product work runs in C without Python-level branching.
+    """
+    n = len(levels)
+    fills = _per_row(max_fill, n)
+    thresholds = _per_row(min_threshold, n)
+    if isinstance(max_fill, Number):
+        if max_fill <= 0:
+            return 'invalid'
+    elif n and min(fills) <= 0:
+        return 'invalid'
+    if n == 0:
+        return 0
+    if min(levels) < 0:
+        return 'invalid'
+
+    gaps = list(map(sub, fills, levels))
+    return sum(map(mul, gaps, map(gt, gaps, thresholds)))
+
+
+class ReplenishmentPlan(NamedTuple):
+    """Result of plan_replenishment; periods are indices into the level series."""
+
+    production: array
+    cumulative_shortfall: array
+    breach_starts: Mapping
+    invalid: list
+
+
+class _BreachStarts(Mapping):
+    """
+    ``{product: [period, ...]}`` of the periods at which a product's gap starts
+    exceeding min_threshold.
+
+    A product's breach starts take a few passes over its series, as many as
+    planning its production, so they are found on the first lookup of that
+    product rather than for every plan. The levels and settings are copied
+    up front, so the starts agree with the rest of the plan even if the
+    caller reuses its level buffers afterwards.
+    """
+
+    __slots__ = ('_levels', '_fills', '_thresholds', '_valid', '_starts')
+
+    def __init__(self, levels, fills, thresholds, valid):
+        self._levels = {product: list(series) for product, series in levels.items()}
+        self._fills = {product: fills[product] for product in self._levels}
+        self._thresholds = {product: thresholds[product] for product in self._levels}
+        self._valid = valid
+        self._starts = {}
+
+    def __getitem__(self, product):
+        starts = self._starts.get(product)
+        if starts is None:
+            series = self._levels[product]
+            n = len(series)
+            gaps = map(sub, repeat(self._fills[product], n), series)
+            breaches = map(gt, gaps, repeat(self._thresholds[product], n))
+            breaches = list(breaches if self._valid is None else map(and_, breaches, self._valid))
+            starts = self._starts[product] = list(compress(count(), map(gt, breaches, chain((False,), breaches))))
+        return starts
+
+    def __iter__(self):
+        return iter(self._levels)
+
+    def __len__(self):
+        return len(self._levels)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _per_product(value, products):
+    if isinstance(value, Number):
+        return dict.fromkeys(products, value)
+    missing = [product for product in products if product not in value]
+    if missing:
+        raise ValueError(f"No per-product value for {missing}")
+    return value
+
+
+def plan_replenishment(levels, max_fill, min_threshold):
+    """
+    Plan production over time series of stock levels, one period per entry.
+
+    levels maps each product to an equal-length sequence or buffer of its
+    stock level per period, e.g. hourly. max_fill and min_threshold may be
+    scalars or mappings from product to value.
+
+    Each period is planned like one sum_current_stock snapshot over all the
+    products: a product's gap to max_fill is produced when it exceeds
+    min_threshold. A period where any level is negative, or every period if
+    a product's max_fill is not positive, is invalid and produces 0.
+
+    Returns a ReplenishmentPlan with the production per period, its running
+    total, the invalid flags, and for each product the periods at which its
+    gap starts exceeding min_threshold: the first breach, then each new
+    breach after the gap has recovered. The breach starts are found on the
+    first lookup of each product.
+
+    Production is built one product at a time, each folded into the running
+    per-period totals by a single list comprehension, so the per-period work
+    costs no function call and no intermediate lists.
+    """
+    products = list(levels)
+    n = len(levels[products[0]]) if products else 0
+    for product in products:
+        if len(levels[product]) != n:
+            raise ValueError(f"Expected {n} levels per product, got {len(levels[product])} for {product!r}")
+    fills = _per_product(max_fill, products)
+    thresholds = _per_product(min_threshold, products)
+
+    invalid = [False] * n
+    for product in products:
+        if fills[product] <= 0:
+            invalid = [True] * n
+            break
+        if n and min(levels[product]) < 0:
+            invalid = list(map(or_, invalid, map(lt, levels[product], repeat(0, n))))
+    valid = list(map(not_, invalid)) if any(invalid) else None
+
+    production = [0.0] * n
+    for index, product in enumerate(products):
+        fill, threshold = fills[product], thresholds[product]
+        if index:
+            production = [
+                total + gap if (gap := fill - level) > threshold else total
+                for total, level in zip(production, levels[product])
+            ]
+        else:
+            production = [gap if (gap := fill - level) > threshold else 0.0 for level in levels[product]]
+    if valid is not None:
+        production = [total if ok else 0.0 for ok, total in zip(valid, production)]
+
+    return ReplenishmentPlan(
+        array('d', production),
+        array('d', list(accumulate(production))),
+        _BreachStarts(levels, fills, thresholds, valid),
+        invalid,
+    )
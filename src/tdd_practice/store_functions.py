@@ -0,0 +1,122 @@
+"""store_<metric> and store_<metric>_many functions generated from the metric registry.
+
+Every metric in ``METRICS`` gets the same two functions, so a new metric is
+usable with nested storage dicts, WeatherStores, bulk ingestion and the async
+ingestor as soon as it is registered. Each generated function is specialized
+for its metric: store_<metric> is compiled from source with the metric name
+as a constant and the metric's own name for the reading parameter, so it
+does the same work as a hand-written function for that metric.
+"""
+
+import time
+
+from . import instrumentation
+from .bulk import Reject, group_by_date, store_grouped
+from .registry import METRICS, MetricSpec
+from .weather_store import WeatherStore
+
+
+def _description(spec: MetricSpec) -> str:
+    return spec.description or f"{spec.name.replace('_', ' ')} reading"
+
+
+# Source of store_<metric>. It is compiled once per metric, like the methods
+# dataclasses generates, so that the reading keeps its per-metric parameter
+# name (store_rainfall(..., rainfall_value=2.0, ...)) and the metric name is a
+# constant. Internal names start with an underscore, which argument names
+# cannot (see MetricSpec).
+_STORE_SOURCE = """
+def store_{name}(date: str, hour: int, {argument}, storage: dict) -> None:
+    _metrics = _instrumentation.active
+    if _metrics is not None:
+        _token = _metrics.start_write({name!r}, storage, date, hour)
+    # Plain dicts are recognized by exact type first: an isinstance check
+    # against WeatherStore, a Mapping ABC, costs as much as the write.
+    if type(storage) is not dict and isinstance(storage, _WeatherStore):
+        storage.store(date, hour, {name!r}, {argument})
+    else:
+        if hour < 0 or hour > 23:
+            raise ValueError(f"Hour must be between 0 and 23, got {{hour}}")
+        # setdefault is atomic on dicts, so concurrent feeds cannot replace
+        # a day or hour dict another feed has just created. It only runs
+        # when the day or hour is missing, to avoid allocating a new dict
+        # on every write.
+        _day = storage.get(date)
+        if _day is None:
+            _day = storage.setdefault(date, {{}})
+        _record = _day.get(hour)
+        if _record is None:
+            _record = _day.setdefault(hour, {{}})
+        _record[{name!r}] = {argument}
+    if _metrics is not None:
+        _metrics.finish_write({name!r}, _token)
+"""
+
+
+def make_store_function(spec: MetricSpec):
+    """Build ``store_<metric>(date, hour, <argument>, storage)`` for one metric."""
+    namespace = {'_instrumentation': instrumentation, '_WeatherStore': WeatherStore}
+    source = _STORE_SOURCE.format(name=spec.name, argument=spec.argument)
+    exec(compile(source, f"<store_{spec.name}>", 'exec'), namespace)
+    store = namespace[f"store_{spec.name}"]
+    store.__module__ = __name__
+    store.__doc__ = f"""
+    Store {_description(spec)} for a specific date and hour.
+
+    Args:
+        date: The date in format 'YYYY-MM-DD' (e.g., '2024-01-15')
+        hour: The hour (0-23) for which to store the reading
+        {spec.argument}: The reading to store
+        storage: Dictionary to store the weather data, organized by date and hour,
+            or a WeatherStore
+
+    Raises:
+        ValueError: If hour is not in the valid range (0-23)
+    """
+    return store
+
+
+def make_store_many_function(spec: MetricSpec):
+    """Build ``store_<metric>_many(dates, hours, values, storage)`` for one metric."""
+    metric = spec.name
+
+    def store_many(dates, hours, values, storage: dict) -> list[Reject]:
+        metrics = instrumentation.active
+        if metrics is not None:
+            started = time.perf_counter()
+        groups, rejects = group_by_date(dates, hours, values)
+        if isinstance(storage, WeatherStore):
+            rejects.extend(storage.store_grouped(metric, groups))
+            rejects.sort()
+        else:
+            store_grouped(metric, groups, storage)
+        if metrics is not None:
+            metrics.record_batch(metric, len(values), len(rejects), started)
+        return rejects
+
+    store_many.__name__ = store_many.__qualname__ = f"store_{metric}_many"
+    store_many.__doc__ = f"""
+    Store many readings of {_description(spec)} in a single sweep.
+
+    Hours are validated for the whole batch up front and rows are grouped by
+    date, so each date is looked up once. Rows with an invalid hour are
+    reported instead of raising, and the rest of the batch is still stored.
+
+    Args:
+        dates: Sequence of dates in format 'YYYY-MM-DD', one per row
+        hours: Sequence of hours (0-23), one per row
+        values: Sequence of readings, one per row
+        storage: Dictionary to store the weather data, organized by date and hour,
+            or a WeatherStore
+
+    Returns:
+        The rejected rows as ``Reject(index, reason)`` tuples, in row order.
+
+    Raises:
+        ValueError: If dates, hours and values differ in length
+    """
+    return store_many
+
+
+STORE_FUNCTIONS = {name: make_store_function(spec) for name, spec in METRICS.items()}
+STORE_MANY_FUNCTIONS = {name: make_store_many_function(spec) for name, spec in METRICS.items()}
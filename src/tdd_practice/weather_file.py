@@ -0,0 +1,212 @@
+"""Fixed-layout binary file format for hourly weather history, read through mmap.
+
+Layout, all little-endian:
+
+- header: magic ``b'TDDWEATH'``, version (u16), column count (u16), day count (u32)
+- column names: one 32-byte NUL-padded ASCII name per column, in ``COLUMNS`` order
+- date index: one 10-byte ``'YYYY-MM-DD'`` entry per day, sorted ascending,
+  padded with NULs to a multiple of 8 bytes
+- day blocks, in date index order: one u32 presence mask per column (padded to
+  a multiple of 8 bytes), then 24 float64 values per column
+
+Every day block has the same size, so the block for the n-th date in the index
+sits at a fixed offset and can be read without touching the rest of the file.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+from .weather_store import COLUMNS, HOURS_PER_DAY, DayView, WeatherStore, _Day
+
+MAGIC = b'TDDWEATH'
+VERSION = 1
+
+_HEADER = struct.Struct('<8sHHI')
+_COLUMN_NAME_SIZE = 32
+_DATE_SIZE = 10
+
+
+def _pad8(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+def _layout(n_columns: int, n_days: int) -> tuple[int, int, int, int]:
+    """Return (index offset, blocks offset, masks size, block size)."""
+    index_offset = _HEADER.size + n_columns * _COLUMN_NAME_SIZE
+    blocks_offset = _pad8(index_offset + n_days * _DATE_SIZE)
+    masks_size = _pad8(4 * n_columns)
+    return index_offset, blocks_offset, masks_size, masks_size + 8 * HOURS_PER_DAY * n_columns
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_weather_file(path, store) -> None:
+    """
+    Write a WeatherStore to ``path`` in the fixed-layout format.
+
+    The file is written next to ``path`` and moved into place once complete,
+    so readers never see a partially written file.
+
+    Args:
+        path: Destination file path
+        store: The WeatherStore to write
+    """
+    dates = list(store)
+
+    n_columns = len(COLUMNS)
+    _, blocks_offset, masks_size, _ = _layout(n_columns, len(dates))
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, n_columns, len(dates)))
+    for column in COLUMNS:
+        header += column.encode('ascii').ljust(_COLUMN_NAME_SIZE, b'\0')
+    for date in dates:
+        header += date.encode('ascii')
+    header += b'\0' * (blocks_offset - len(header))
+
+    mask_padding = b'\0' * (masks_size - 4 * n_columns)
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(header)
+        for date in dates:
+            day = store._days[date].readable()
+            file.write(_little_endian(array('I', day.mask)))
+            file.write(mask_padding)
+            file.write(_little_endian(day.values))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def load_weather_file(path, store: WeatherStore = None) -> WeatherStore:
+    """
+    Read a weather file back into a WeatherStore.
+
+    Args:
+        path: File written by :func:`write_weather_file`
+        store: Store to load into, overwriting readings it shares with the
+            file; a new WeatherStore when omitted
+
+    Returns:
+        The loaded store.
+    """
+    if store is None:
+        store = WeatherStore()
+    with WeatherFile(path) as weather_file:
+        for position, date in enumerate(weather_file):
+            weather_file._copy_into(store, date, position)
+    return store
+
+
+class _DateIndex(Sequence):
+    """Sorted date index read straight from the mapped file, for bisect."""
+
+    __slots__ = ('_buffer', '_offset', '_length')
+
+    def __init__(self, buffer, offset: int, length: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+
+    def __getitem__(self, position):
+        if not 0 <= position < self._length:
+            raise IndexError(position)
+        start = self._offset + position * _DATE_SIZE
+        return self._buffer[start:start + _DATE_SIZE].decode('ascii')
+
+    def __len__(self):
+        return self._length
+
+
+class WeatherFile(Mapping):
+    """
+    Read-only ``storage[date][hour][metric]`` view over a weather file.
+
+    The file is memory-mapped and nothing is read up front beyond the header:
+    a date lookup bisects the on-disk index and each day is served straight
+    from its mapped block, so opening cost and resident memory do not grow
+    with the length of the history.
+
+    Day views hold references into the mapping; drop them before calling
+    ``close``.
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        magic, version, n_columns, n_days = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} weather file")
+        columns = tuple(
+            self._mmap[offset:offset + _COLUMN_NAME_SIZE].rstrip(b'\0').decode('ascii')
+            for offset in range(_HEADER.size, _HEADER.size + n_columns * _COLUMN_NAME_SIZE,
+                                _COLUMN_NAME_SIZE)
+        )
+        if columns != COLUMNS:
+            self.close()
+            raise ValueError(f"{path} has columns {columns}, expected {COLUMNS}")
+        index_offset, self._blocks_offset, self._masks_size, self._block_size = _layout(
+            n_columns, n_days)
+        self._index = _DateIndex(self._mmap, index_offset, n_days)
+
+    def _position(self, date) -> int:
+        if not isinstance(date, str):
+            return -1
+        position = bisect_left(self._index, date)
+        if position < len(self._index) and self._index[position] == date:
+            return position
+        return -1
+
+    def _read_day(self, position: int) -> _Day:
+        start = self._blocks_offset + position * self._block_size
+        masks = memoryview(self._mmap)[start:start + 4 * len(COLUMNS)]
+        values = memoryview(self._mmap)[start + self._masks_size:start + self._block_size]
+        if sys.byteorder == 'little':
+            return _Day(values.cast('d'), masks.cast('I'))
+        values, masks = array('d', bytes(values)), array('I', bytes(masks))
+        values.byteswap()
+        masks.byteswap()
+        return _Day(values, masks)
+
+    def _copy_into(self, store: WeatherStore, date: str, position: int) -> None:
+        # Kept in its own frame so the day's views into the mapping are
+        # released before the file can be closed.
+        store._copy_day(date, self._read_day(position))
+
+    def __getitem__(self, date):
+        position = self._position(date)
+        if position < 0:
+            raise KeyError(date)
+        return DayView(self._read_day(position))
+
+    def __contains__(self, date):
+        return self._position(date) >= 0
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
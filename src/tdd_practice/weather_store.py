@@ -0,0 +1,890 @@
+"""Columnar hourly weather store backed by preallocated typed arrays."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from datetime import date as _date
+from math import inf
+
+from .aggregates import Aggregate, bounds
+from .bulk import Reject
+from .compression import pack_columns, unpack_columns
+from .readings import READING_TYPES
+from .registry import METRICS, freeze
+
+HOURS_PER_DAY = 24
+
+# Each metric maps to the fields it stores; scalar metrics have no fields and
+# occupy a single column named after the metric.
+METRIC_FIELDS = {name: spec.fields for name, spec in METRICS.items()}
+
+COLUMNS = tuple(column for spec in METRICS.values() for column in spec.columns)
+COLUMN_INDEX = {column: index for index, column in enumerate(COLUMNS)}
+freeze()
+
+COLUMN_DTYPES = {column: spec.dtype for spec in METRICS.values() for column in spec.columns}
+
+# Accepted value types per column; int metrics are kept exactly in the float
+# blocks (up to 2**53) and converted back on read.
+_COLUMN_TYPES = tuple((int,) if dtype is int else (int, float) for dtype in COLUMN_DTYPES.values())
+_INTEGER_COLUMNS = frozenset(
+    index for index, types in enumerate(_COLUMN_TYPES) if types == (int,)
+)
+
+# (field, column index) pairs per metric, field is None for scalar metrics.
+_METRIC_COLUMNS = {
+    metric: tuple(
+        (field, COLUMN_INDEX[f"{metric}.{field}" if fields else metric])
+        for field in (fields or (None,))
+    )
+    for metric, fields in METRIC_FIELDS.items()
+}
+
+# Presence bit per hour; shifting allocates a new int for most hours.
+_HOUR_BITS = tuple(1 << hour for hour in range(HOURS_PER_DAY))
+_ALL_HOURS = (1 << HOURS_PER_DAY) - 1
+
+_EMPTY_BLOCK = array('d', [0.0]) * (HOURS_PER_DAY * len(COLUMNS))
+_EMPTY_MASK = array('L', [0]) * len(COLUMNS)
+# Running [sum, min, max] per column.
+_EMPTY_STATS = array('d', [0.0, inf, -inf]) * len(COLUMNS)
+
+
+def _check_hour(hour: int) -> None:
+    if hour < 0 or hour > 23:
+        raise ValueError(f"Hour must be between 0 and 23, got {hour}")
+
+
+def day_number(date: str) -> int:
+    """
+    Convert a 'YYYY-MM-DD' date to its integer day number (proleptic ordinal).
+
+    Raises:
+        ValueError: If date is not a valid 'YYYY-MM-DD' date
+    """
+    try:
+        parsed = _date.fromisoformat(date)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or len(date) != 10:
+        raise ValueError(f"Dates must be in format 'YYYY-MM-DD', got {date!r}")
+    return parsed.toordinal()
+
+
+def _columns_for(name: str) -> tuple:
+    """Resolve a metric name or a single column name to (field, column) pairs."""
+    columns = _METRIC_COLUMNS.get(name)
+    if columns is None:
+        columns = ((None, COLUMN_INDEX[name]),)
+    return columns
+
+
+def _aggregate(stats: array, column: int, count: int) -> Aggregate:
+    base = 3 * column
+    if not count:
+        return Aggregate()
+    return Aggregate(stats[base], count, stats[base + 1], stats[base + 2])
+
+
+def _rescan_month(month: '_Month', column: int) -> None:
+    base = 3 * column
+    month.stats[base + 1] = min(day.stats[base + 1] for day in month.days)
+    month.stats[base + 2] = max(day.stats[base + 2] for day in month.days)
+
+
+def _absorb_day(month: '_Month', day: '_Day') -> None:
+    """Link a day of another store into ``month`` and add its aggregates to the month's."""
+    stats = day.stats
+    month_stats = month.stats
+    for column, bits in enumerate(day.mask):
+        if not bits:
+            continue
+        base = 3 * column
+        month_stats[base] += stats[base]
+        month.counts[column] += bits.bit_count()
+        if stats[base + 1] < month_stats[base + 1]:
+            month_stats[base + 1] = stats[base + 1]
+        if stats[base + 2] > month_stats[base + 2]:
+            month_stats[base + 2] = stats[base + 2]
+    month.days.append(day)
+    day.month = month
+
+
+def _check_stored(store: 'WeatherStore', day: '_Day') -> None:
+    # A DayWriter keeps its day block after the store drops the day; writing
+    # into it would be lost to reads yet still add to the month's aggregates.
+    if store._days.get(day.date) is not day:
+        raise ValueError(f"{day.date} is no longer stored and cannot be written through this day")
+
+
+def _columnize(columns: tuple, readings) -> list:
+    """
+    Turn a batch of readings of one metric into ``(column, values)`` pairs.
+
+    Scalar readings, and fields present in every mapping, are validated in
+    one pass by packing them into an ``array('d')``. None readings, and
+    fields missing from a mapping, stay None so the hour is cleared, and the
+    other values are checked one by one.
+
+    Raises:
+        TypeError: If a value is not a number
+        AttributeError: If a composite reading is not a mapping
+    """
+    if columns[0][0] is None:
+        column = columns[0][1]
+        if None in readings:
+            values = [value for value in readings if value is not None]
+            if column in _INTEGER_COLUMNS:
+                _check_integers(values)
+            _check_numbers(values)
+            return [(column, list(readings))]
+        if column in _INTEGER_COLUMNS:
+            _check_integers(readings)
+        return [(column, array('d', readings))]
+    column_values = []
+    for field, column in columns:
+        values = [reading.get(field) for reading in readings]
+        if column in _INTEGER_COLUMNS:
+            _check_integers(value for value in values if value is not None)
+        if None in values:
+            _check_numbers(value for value in values if value is not None)
+        else:
+            values = array('d', values)
+        column_values.append((column, values))
+    return column_values
+
+
+def _check_integers(values) -> None:
+    for value in values:
+        if not isinstance(value, int):
+            raise TypeError(f"Reading values must be ints, got {value!r}")
+
+
+def _check_numbers(values) -> None:
+    for value in values:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"Reading values must be numbers, got {value!r}")
+
+
+def _resolve(columns: tuple, data) -> list:
+    """Pair each column of a metric with its value from ``data``, None when absent."""
+    fields = []
+    for field, column in columns:
+        value = data if field is None else data.get(field)
+        if value is not None and not isinstance(value, _COLUMN_TYPES[column]):
+            kind = 'ints' if column in _INTEGER_COLUMNS else 'numbers'
+            raise TypeError(f"Reading values must be {kind}, got {value!r}")
+        fields.append((column, value))
+    return fields
+
+
+class _Month:
+    """Running [sum, min, max] and count per column over the days of a month.
+
+    ``lock``, when set, guards writes to the month's days and aggregates.
+    """
+
+    __slots__ = ('stats', 'counts', 'days', 'lock')
+
+    def __init__(self, lock=None):
+        self.stats = array('d', _EMPTY_STATS)
+        self.counts = array('q', [0] * len(COLUMNS))
+        self.days = []
+        self.lock = lock
+
+
+class _Day:
+    """One day of readings: a 24-slot block per column plus presence bitmasks.
+
+    ``values[column * 24 + hour]`` holds the reading and bit ``hour`` of
+    ``mask[column]`` records whether it has been written. Days owned by a
+    WeatherStore also carry their ``date``, running ``stats`` and a link to
+    their ``month``.
+
+    A sealed day keeps its values compressed in ``packed`` and has no
+    ``values`` block until it is unsealed; ``readable()`` decodes a copy.
+    """
+
+    __slots__ = ('values', 'mask', 'stats', 'month', 'date', 'packed')
+
+    def __init__(self, values=None, mask=None, month=None, date=None):
+        # Slicing copies an array faster than array(typecode, source).
+        self.values = _EMPTY_BLOCK[:] if values is None else values
+        self.mask = _EMPTY_MASK[:] if mask is None else mask
+        self.stats = None if month is None else _EMPTY_STATS[:]
+        self.month = month
+        self.date = date
+        self.packed = None
+
+    def seal(self) -> None:
+        """Compress the values block and release it."""
+        if self.values is not None:
+            self.packed = pack_columns([self.column_values(column) for column in range(len(COLUMNS))])
+            self.values = None
+
+    def unseal(self) -> None:
+        """Restore the values block of a sealed day so it can be written."""
+        if self.values is None:
+            self.values = self._unpacked_values(self.packed, self.mask)
+            self.packed = None
+
+    def readable(self) -> '_Day':
+        """Return this day, or a decoded copy with its own mask if it is sealed."""
+        # Read once: seal sets packed before dropping values and unseal clears
+        # it only after restoring them, so a concurrent unseal cannot leave
+        # this with neither.
+        packed = self.packed
+        if packed is None:
+            return self
+        mask = array('L', self.mask)
+        return _Day(self._unpacked_values(packed, mask), mask)
+
+    @staticmethod
+    def _unpacked_values(packed: bytes, mask) -> array:
+        values = array('d', _EMPTY_BLOCK)
+        columns = unpack_columns(packed, [bits.bit_count() for bits in mask])
+        for column, (bits, present) in enumerate(zip(mask, columns)):
+            start = column * HOURS_PER_DAY
+            hours = (hour for hour in range(HOURS_PER_DAY) if bits >> hour & 1)
+            for hour, value in zip(hours, present):
+                values[start + hour] = value
+        return values
+
+    def column_values(self, column: int) -> list:
+        bits = self.mask[column]
+        start = column * HOURS_PER_DAY
+        if bits == _ALL_HOURS:
+            return self.values[start:start + HOURS_PER_DAY].tolist()
+        values = self.values
+        return [
+            values[start + hour]
+            for hour in range(bits.bit_length())
+            if bits >> hour & 1
+        ]
+
+    def hours_mask(self) -> int:
+        combined = 0
+        for bits in self.mask:
+            combined |= bits
+        return combined
+
+    def read_metric(self, metric: str, columns: tuple, hour: int):
+        """Return one metric's value or reading for an hour, or None if it is absent."""
+        bit = 1 << hour
+        values = self.values
+        mask = self.mask
+        fields = {
+            field: values[column * HOURS_PER_DAY + hour]
+            for field, column in columns
+            if mask[column] & bit
+        }
+        if not fields:
+            return None
+        if _INTEGER_COLUMNS:
+            for field, column in columns:
+                if column in _INTEGER_COLUMNS and field in fields:
+                    fields[field] = int(fields[field])
+        if None in fields:
+            return fields[None]
+        return READING_TYPES[metric](**fields)
+
+    def read(self, hour: int) -> dict:
+        """Build the ``{metric: value}`` record for an hour, skipping absent metrics."""
+        record = {}
+        for metric, columns in _METRIC_COLUMNS.items():
+            value = self.read_metric(metric, columns, hour)
+            if value is not None:
+                record[metric] = value
+        return record
+
+
+class DayView(Mapping):
+    """Read-only ``{hour: {metric: value}}`` view over one stored day."""
+
+    __slots__ = ('_day',)
+
+    def __init__(self, day: _Day):
+        self._day = day
+
+    def __getitem__(self, hour):
+        if not isinstance(hour, int) or not 0 <= hour < HOURS_PER_DAY:
+            raise KeyError(hour)
+        if not self._day.hours_mask() >> hour & 1:
+            raise KeyError(hour)
+        # The day may have been sealed since the view was taken.
+        return self._day.readable().read(hour)
+
+    def __contains__(self, hour):
+        if not isinstance(hour, int) or not 0 <= hour < HOURS_PER_DAY:
+            return False
+        return bool(self._day.hours_mask() >> hour & 1)
+
+    def __iter__(self):
+        combined = self._day.hours_mask()
+        return (hour for hour in range(HOURS_PER_DAY) if combined >> hour & 1)
+
+    def __len__(self):
+        return self._day.hours_mask().bit_count()
+
+
+class WeatherStore(Mapping):
+    """
+    Hourly weather storage that keeps every metric in per-day typed arrays.
+
+    The store reads like the nested ``storage[date][hour][metric]`` dict used by
+    ``store_temperature``, ``store_rainfall`` and ``store_wind_speed`` and can be
+    passed to them in place of that dict. Each day costs one preallocated
+    ``array('d')`` block of ``24 * len(COLUMNS)`` floats and one presence
+    bitmask per column, instead of a dict per hour and per reading.
+
+    Dates must be 'YYYY-MM-DD' strings. The store keeps a sorted index of
+    their day numbers, so it iterates in date order and answers
+    ``query_range`` in logarithmic time plus the size of the result.
+
+    Observers registered with ``add_observer`` see every write after it has
+    been applied.
+    """
+
+    __slots__ = ('_days', '_day_numbers', '_dates', '_months', '_observers')
+
+    def __init__(self):
+        self._days = {}
+        self._day_numbers = []
+        self._dates = []
+        self._months = {}
+        self._observers = []
+
+    def __getitem__(self, date):
+        return DayView(self._days[date].readable())
+
+    def __contains__(self, date):
+        return date in self._days
+
+    def __iter__(self):
+        return iter(self._dates)
+
+    def __len__(self):
+        return len(self._days)
+
+    def _day(self, date: str) -> _Day:
+        day = self._days.get(date)
+        if day is None:
+            number = self._check_date(date)
+            position = bisect_left(self._day_numbers, number)
+            self._day_numbers.insert(position, number)
+            self._dates.insert(position, date)
+            key = date[:7]
+            month = self._months.get(key)
+            if month is None:
+                month = self._months[key] = self._new_month()
+            day = self._days[date] = self._new_day(number, date, month)
+            month.days.append(day)
+        return day
+
+    def _check_date(self, date: str) -> int:
+        """Return the day number of a date that may be added to the store."""
+        return day_number(date)
+
+    def _new_month(self) -> _Month:
+        return _Month()
+
+    def _new_day(self, number: int, date: str, month: _Month) -> _Day:
+        return _Day(month=month, date=date)
+
+    def drop_day(self, date: str) -> None:
+        """
+        Remove a stored day and retract its readings from its month's aggregates.
+
+        Raises:
+            KeyError: If the date is not stored
+        """
+        day = self._days.pop(date)
+        position = bisect_left(self._day_numbers, day_number(date))
+        del self._day_numbers[position]
+        del self._dates[position]
+        month = day.month
+        month.days.remove(day)
+        if not month.days:
+            del self._months[date[:7]]
+            return
+        stats = day.stats
+        month_stats = month.stats
+        for column, bits in enumerate(day.mask):
+            if not bits:
+                continue
+            base = 3 * column
+            month_stats[base] -= stats[base]
+            month.counts[column] -= bits.bit_count()
+            if stats[base + 1] <= month_stats[base + 1] or stats[base + 2] >= month_stats[base + 2]:
+                _rescan_month(month, column)
+
+    def _dates_between(self, start: str, end: str) -> list:
+        low = bisect_left(self._day_numbers, day_number(start))
+        high = bisect_right(self._day_numbers, day_number(end))
+        return self._dates[low:high]
+
+    def query_range(self, start: str, end: str, metric: str):
+        """
+        Iterate over the readings of one metric between two dates, inclusive.
+
+        Args:
+            start: First date in format 'YYYY-MM-DD'
+            end: Last date in format 'YYYY-MM-DD'
+            metric: A name in ``METRIC_FIELDS`` or a single column in ``COLUMNS``
+
+        Yields:
+            ``(date, hour, value)`` in date and hour order, for every hour in
+            range where the metric is present.
+
+        Raises:
+            ValueError: If start or end is not a valid date
+            KeyError: If metric is not a known metric or column
+        """
+        columns = _columns_for(metric)
+        for date in self._dates_between(start, end):
+            day = self._days[date].readable()
+            for hour in range(HOURS_PER_DAY):
+                value = day.read_metric(metric, columns, hour)
+                if value is not None:
+                    yield date, hour, value
+
+    def _write(self, day: _Day, column: int, hour: int, value: float) -> None:
+        index = column * HOURS_PER_DAY + hour
+        bit = 1 << hour
+        old = day.values[index] if day.mask[column] & bit else None
+        day.values[index] = value
+        day.mask[column] |= bit
+        self._account(day, column, old, value)
+
+    def _clear(self, day: _Day, column: int, hour: int) -> None:
+        bit = 1 << hour
+        if day.mask[column] & bit:
+            day.mask[column] &= ~bit
+            self._account(day, column, day.values[column * HOURS_PER_DAY + hour], None)
+
+    def _account(self, day: _Day, column: int, old, new) -> None:
+        """Move the day and month aggregates of a column from ``old`` to ``new``.
+
+        Sums and counts are adjusted in place. Min and max only need a rescan
+        when the retracted value was an extreme, and then only over the
+        24 slots of the day and the day aggregates of the month.
+        """
+        if old == new:
+            return
+        stats = day.stats
+        month = day.month
+        month_stats = month.stats
+        base = 3 * column
+        if old is None:
+            stats[base] += new
+            month_stats[base] += new
+            month.counts[column] += 1
+        else:
+            delta = -old if new is None else new - old
+            stats[base] += delta
+            month_stats[base] += delta
+            if new is None:
+                month.counts[column] -= 1
+            if old <= stats[base + 1] or old >= stats[base + 2]:
+                stats[base + 1], stats[base + 2] = bounds(day.column_values(column))
+                if old <= month_stats[base + 1] or old >= month_stats[base + 2]:
+                    _rescan_month(month, column)
+        if new is not None:
+            if new < stats[base + 1]:
+                stats[base + 1] = new
+            if new > stats[base + 2]:
+                stats[base + 2] = new
+            if new < month_stats[base + 1]:
+                month_stats[base + 1] = new
+            if new > month_stats[base + 2]:
+                month_stats[base + 2] = new
+
+    def _store_batch(self, day: _Day, hours, column_values: list) -> None:
+        """
+        Write many readings into one day and refresh each column's aggregates once.
+
+        Args:
+            day: The day to write
+            hours: Pre-validated hours, one per reading
+            column_values: ``(column, values)`` pairs; ``values`` holds one
+                number, or None to clear the slot, per entry of ``hours``
+
+        Raises:
+            ValueError: If the day has been dropped since it was looked up
+        """
+        _check_stored(self, day)
+        if day.values is None:
+            day.unseal()
+        slots = day.values
+        mask = day.mask
+        for column, values in column_values:
+            start = column * HOURS_PER_DAY
+            bits = old_bits = mask[column]
+            for hour, value in zip(hours, values):
+                if value is None:
+                    bits &= ~(1 << hour)
+                else:
+                    slots[start + hour] = value
+                    bits |= 1 << hour
+            mask[column] = bits
+            self._refresh(day, column, old_bits.bit_count())
+        if self._observers:
+            self._notify(day, hours, column_values)
+
+    def _refresh(self, day: _Day, column: int, old_count: int) -> None:
+        """Recompute a day column's aggregates from its slots and carry the change to its month."""
+        stats = day.stats
+        month = day.month
+        month_stats = month.stats
+        base = 3 * column
+        old_low, old_high = stats[base + 1], stats[base + 2]
+        present = day.column_values(column)
+        total = sum(present)
+        low, high = bounds(present)
+        month_stats[base] += total - stats[base]
+        month.counts[column] += len(present) - old_count
+        stats[base], stats[base + 1], stats[base + 2] = total, low, high
+        if (low > old_low and old_low <= month_stats[base + 1]) or (
+                high < old_high and old_high >= month_stats[base + 2]):
+            _rescan_month(month, column)
+        else:
+            if low < month_stats[base + 1]:
+                month_stats[base + 1] = low
+            if high > month_stats[base + 2]:
+                month_stats[base + 2] = high
+
+    def daily(self, date: str, column: str) -> Aggregate:
+        """
+        Return the running aggregate of one column over a stored day.
+
+        Args:
+            date: The date in format 'YYYY-MM-DD'
+            column: A column in ``COLUMNS``, e.g. 'rainfall' or 'temperature.max'
+
+        Raises:
+            KeyError: If the date is not stored or the column is unknown
+        """
+        index = COLUMN_INDEX[column]
+        day = self._days[date]
+        return _aggregate(day.stats, index, day.mask[index].bit_count())
+
+    def monthly(self, month: str, column: str) -> Aggregate:
+        """
+        Return the running aggregate of one column over a stored month.
+
+        Args:
+            month: The month in format 'YYYY-MM'
+            column: A column in ``COLUMNS``, e.g. 'rainfall' or 'temperature.max'
+
+        Raises:
+            KeyError: If no day of the month is stored or the column is unknown
+        """
+        index = COLUMN_INDEX[column]
+        stats = self._months[month]
+        return _aggregate(stats.stats, index, stats.counts[index])
+
+    def reading_counts(self) -> dict:
+        """Return ``{metric: number of stored hourly readings}`` across all days."""
+        counts = dict.fromkeys(_METRIC_COLUMNS, 0)
+        for day in list(self._days.values()):
+            mask = day.mask
+            for metric, columns in _METRIC_COLUMNS.items():
+                bits = 0
+                for _, column in columns:
+                    bits |= mask[column]
+                counts[metric] += bits.bit_count()
+        return counts
+
+    def _has_reading(self, date: str, hour: int, metric: str) -> bool:
+        """Return whether a metric is stored for a date and hour, from the presence masks alone."""
+        day = self._days.get(date)
+        if day is None:
+            return False
+        bit = _HOUR_BITS[hour]
+        mask = day.mask
+        for _, column in _METRIC_COLUMNS[metric]:
+            if mask[column] & bit:
+                return True
+        return False
+
+    def store(self, date: str, hour: int, metric: str, data) -> None:
+        """
+        Store a metric reading for a specific date and hour.
+
+        Fields missing from ``data`` are cleared, so a store replaces the whole
+        previous reading just as assigning a new dict would.
+
+        Args:
+            date: The date in format 'YYYY-MM-DD' (e.g., '2024-01-15')
+            hour: The hour (0-23) for which to store the reading
+            metric: One of the names in ``METRIC_FIELDS``
+            data: A number for scalar metrics, otherwise a mapping of field values
+
+        Raises:
+            ValueError: If hour is not in the valid range (0-23), or date is
+                not a valid 'YYYY-MM-DD' date
+            KeyError: If metric is not a known metric
+            TypeError: If a reading value is not a number
+        """
+        _check_hour(hour)
+        fields = _resolve(_METRIC_COLUMNS[metric], data)
+        self._store_fields(self._day(date), hour, fields)
+
+    def _store_fields(self, day: _Day, hour: int, fields: list) -> None:
+        _check_stored(self, day)
+        if day.values is None:
+            day.unseal()
+        for column, value in fields:
+            if value is None:
+                self._clear(day, column, hour)
+            else:
+                self._write(day, column, hour, value)
+        if self._observers:
+            self._notify(day, (hour,), [(column, (value,)) for column, value in fields])
+
+    def add_observer(self, observer) -> None:
+        """
+        Call ``observer(date, hours, column_values)`` after every write.
+
+        ``column_values`` holds ``(column index, values)`` pairs with one
+        number, or None for a cleared slot, per entry of ``hours``. Observers
+        run on the writing thread; in a ConcurrentWeatherStore they run while
+        the month's lock is held, so they see each month's writes in order.
+        """
+        self._observers.append(observer)
+
+    def remove_observer(self, observer) -> None:
+        """Stop calling an observer added with :meth:`add_observer`."""
+        self._observers.remove(observer)
+
+    def _notify(self, day: _Day, hours, column_values: list) -> None:
+        for observer in self._observers:
+            observer(day.date, hours, column_values)
+
+    def store_grouped(self, metric: str, groups: dict, field: str = None) -> list[Reject]:
+        """
+        Store rows grouped by :func:`~tdd_practice.bulk.group_by_date`.
+
+        Each date is looked up once, all of its rows are written in one sweep
+        and its aggregates are refreshed once per column. Rows whose reading
+        cannot be stored are reported instead of aborting the batch.
+
+        Args:
+            metric: One of the names in ``METRIC_FIELDS``
+            groups: Validated ``{date: [(index, hour, value), ...]}`` rows
+            field: When given, each value is a single number for this field of
+                the metric and the metric's other fields are left untouched
+
+        Returns:
+            The rows whose reading was rejected.
+        """
+        if field is None:
+            columns = _METRIC_COLUMNS[metric]
+        else:
+            columns = ((None, COLUMN_INDEX[f"{metric}.{field}"]),)
+        rejects = []
+        for date, rows in groups.items():
+            if date not in self._days:
+                try:
+                    self._check_date(date)
+                except ValueError as error:
+                    rejects.extend(Reject(index, str(error)) for index, _, _ in rows)
+                    continue
+            readings = [data for _, _, data in rows]
+            try:
+                column_values = _columnize(columns, readings)
+            except (TypeError, AttributeError):
+                valid = []
+                for row in rows:
+                    index, _, data = row
+                    try:
+                        _resolve(columns, data)
+                    except (TypeError, AttributeError) as error:
+                        rejects.append(Reject(index, f"Invalid {metric} reading {data!r}: {error}"))
+                    else:
+                        valid.append(row)
+                if not valid:
+                    continue
+                rows = valid
+                column_values = _columnize(columns, [data for _, _, data in rows])
+            self._store_batch(self._day(date), [hour for _, hour, _ in rows], column_values)
+        return rejects
+
+    def seal(self, date: str) -> None:
+        """
+        Compress a stored day's readings in place.
+
+        A sealed day keeps its aggregates and answers reads by decoding its
+        readings on each access; the next write to it unseals it. Sealing
+        suits days that are no longer written, such as past days.
+
+        Raises:
+            KeyError: If the date is not stored
+        """
+        self._days[date].seal()
+
+    def seal_before(self, date: str) -> int:
+        """Seal every stored day before ``date`` and return how many there were."""
+        dates = self._dates[:bisect_left(self._day_numbers, day_number(date))]
+        for stored in dates:
+            self.seal(stored)
+        return len(dates)
+
+    def day_writer(self, date: str) -> 'DayWriter':
+        """
+        Return a writer bound to one day, creating the day if needed.
+
+        The date is parsed and looked up once here; writes through the writer
+        go straight to the day's block.
+
+        Once the day is dropped, by ``drop_day`` or a subclass's retention,
+        the writer's writes raise ValueError.
+
+        Raises:
+            ValueError: If date is not a valid 'YYYY-MM-DD' date
+        """
+        return DayWriter(self, date, self._day(date))
+
+    def merge(self, other: 'WeatherStore') -> None:
+        """
+        Copy every reading of another store into this one, last write wins.
+
+        Readings present in ``other`` overwrite the same date, hour and column
+        here, exactly as storing them again would; readings only present here
+        are kept.
+        """
+        for date in other:
+            self._copy_day(date, other._days[date])
+
+    def _adopt(self, other: 'WeatherStore') -> None:
+        """
+        Move every day of a store built only to be merged into this one.
+
+        Behaves like :meth:`merge`, but days not stored here yet are taken
+        over with their blocks and day aggregates instead of being written
+        again: a month with no days here is taken whole with its aggregates,
+        and other days are linked into the month here, whose aggregates
+        absorb theirs. Days stored in both are copied as ``merge`` does.
+        ``other`` is left empty.
+
+        Stores that keep more per day or month than these blocks, such as
+        subclasses, and stores with observers, which must see every write,
+        fall back to ``merge``.
+        """
+        if type(self) is not WeatherStore or type(other) is not WeatherStore or self._observers:
+            self.merge(other)
+            return
+        numbers = []
+        dates = []
+        for number, date in zip(other._day_numbers, other._dates):
+            day = other._days[date]
+            if date in self._days:
+                self._copy_day(date, day)
+                continue
+            month = self._months.get(date[:7])
+            if month is None:
+                self._months[date[:7]] = day.month
+            elif month is not day.month:
+                _absorb_day(month, day)
+            self._days[date] = day
+            numbers.append(number)
+            dates.append(date)
+        if numbers and self._day_numbers and numbers[0] < self._day_numbers[-1]:
+            pairs = sorted(zip(self._day_numbers + numbers, self._dates + dates))
+            self._day_numbers = [number for number, _ in pairs]
+            self._dates = [date for _, date in pairs]
+        else:
+            self._day_numbers += numbers
+            self._dates += dates
+        other.__init__()
+
+    def _copy_day(self, date: str, source: _Day) -> None:
+        """Store every reading present in another day block under ``date``."""
+        source = source.readable()
+        day = self._day(date)
+        for column, bits in enumerate(source.mask):
+            if not bits:
+                continue
+            hours = [hour for hour in range(HOURS_PER_DAY) if bits >> hour & 1]
+            start = column * HOURS_PER_DAY
+            values = [source.values[start + hour] for hour in hours]
+            self._store_batch(day, hours, [(column, values)])
+
+    def store_temperature(self, date: str, hour: int, temperature_data: dict) -> None:
+        """Store a ``{'max', 'min', 'average'}`` temperature reading."""
+        self.store(date, hour, 'temperature', temperature_data)
+
+    def store_rainfall(self, date: str, hour: int, rainfall_value: float) -> None:
+        """Store a rainfall value."""
+        self.store(date, hour, 'rainfall', rainfall_value)
+
+    def store_wind_speed(self, date: str, hour: int, wind_speed_data: dict) -> None:
+        """Store a ``{'min', 'max'}`` wind speed reading."""
+        self.store(date, hour, 'wind_speed', wind_speed_data)
+
+
+class DayWriter:
+    """
+    Fast write path for many readings of one day.
+
+    Obtained from :meth:`WeatherStore.day_writer`. The date is resolved to its
+    day block once, so writes skip parsing, hashing and looking up the date
+    string; ``store_many`` also validates all hours of a batch in one check.
+    Writes keep the store's aggregates and locking exactly as ``store`` does.
+    """
+
+    __slots__ = ('_store', '_day', 'date')
+
+    def __init__(self, store: WeatherStore, date: str, day: _Day):
+        self._store = store
+        self._day = day
+        self.date = date
+
+    @property
+    def day_id(self) -> int:
+        """Day number of the writer's date, as used to order the store's dates."""
+        return day_number(self.date)
+
+    def store(self, hour: int, metric: str, data) -> None:
+        """Store a metric reading for an hour of this day; see :meth:`WeatherStore.store`."""
+        _check_hour(hour)
+        self._store._store_fields(self._day, hour, _resolve(_METRIC_COLUMNS[metric], data))
+
+    def store_temperature(self, hour: int, temperature_data: dict) -> None:
+        """Store a ``{'max', 'min', 'average'}`` temperature reading."""
+        self.store(hour, 'temperature', temperature_data)
+
+    def store_rainfall(self, hour: int, rainfall_value: float) -> None:
+        """Store a rainfall value."""
+        self.store(hour, 'rainfall', rainfall_value)
+
+    def store_wind_speed(self, hour: int, wind_speed_data: dict) -> None:
+        """Store a ``{'min', 'max'}`` wind speed reading."""
+        self.store(hour, 'wind_speed', wind_speed_data)
+
+    def store_many(self, metric: str, hours, values) -> None:
+        """
+        Store many readings of one metric for this day.
+
+        Hours and values are validated once for the whole batch before
+        anything is written, so a bad batch leaves the day unchanged, and the
+        day's aggregates are refreshed once per column rather than per reading.
+
+        Args:
+            metric: One of the names in ``METRIC_FIELDS``
+            hours: Sequence of hours (0-23)
+            values: Sequence of readings, one per hour
+
+        Raises:
+            ValueError: If any hour is invalid or the sequences differ in length
+            TypeError: If a reading value is not a number
+            AttributeError: If a composite reading is not a mapping
+        """
+        if len(hours) != len(values):
+            raise ValueError(
+                f"hours and values must have the same length, got {len(hours)} and {len(values)}")
+        invalid = [hour for hour in hours if type(hour) is not int or hour < 0 or hour > 23]
+        if invalid:
+            raise ValueError(f"Hour must be between 0 and 23, got {invalid[0]!r}")
+        column_values = _columnize(_METRIC_COLUMNS[metric], values)
+        self._store._store_batch(self._day, hours, column_values)
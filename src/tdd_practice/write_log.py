@@ -0,0 +1,213 @@
+"""Append-only write log and snapshots that make a WeatherStore survive restarts.
+
+Every reading written to the store is appended to the log as a fixed 14-byte
+record, little-endian:
+
+- day number (u32, proleptic ordinal of the date)
+- hour (u8)
+- column index (u8), with the high bit set when the reading was cleared
+- value (float64)
+
+after a 16-byte header holding the magic ``b'TDDWLOG\\0'`` and a version (u16).
+
+A checkpoint writes the whole store as a weather file snapshot and starts an
+empty log, so recovery loads the latest snapshot and replays only the writes
+logged since. Log records hold absolute values, so replaying a record the
+snapshot already contains is harmless; a record torn by a crash is dropped.
+"""
+
+import os
+import struct
+import threading
+from datetime import date as _date
+from pathlib import Path
+
+from .weather_file import load_weather_file, write_weather_file
+from .weather_store import HOURS_PER_DAY, WeatherStore, day_number
+
+LOG_MAGIC = b'TDDWLOG\0'
+LOG_VERSION = 1
+
+_LOG_HEADER = struct.Struct('<8sH6x')
+_RECORD = struct.Struct('<IBBd')
+_CLEARED = 0x80
+
+SNAPSHOT_NAME = 'snapshot.tddw'
+LOG_NAME = 'writes.log'
+
+
+class WriteLog:
+    """
+    Append-only log of store writes, used as a WeatherStore observer::
+
+        log = WriteLog('writes.log')
+        store.add_observer(log.append)
+
+    Args:
+        path: Log file; created with a header if missing, appended to otherwise
+            after dropping any torn final record
+        fsync: Also fsync after every append, so writes survive an OS crash
+            rather than only a process crash
+    """
+
+    def __init__(self, path, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = open(path, 'ab')
+        size = self._file.tell()
+        if size == 0:
+            self._file.write(_LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+            self._file.flush()
+        elif (size - _LOG_HEADER.size) % _RECORD.size:
+            # Drop a record torn by a crash so new records stay aligned.
+            self._file.truncate(size - (size - _LOG_HEADER.size) % _RECORD.size)
+        self._last_date = None
+        self._last_number = 0
+
+    def append(self, date: str, hours, column_values: list) -> None:
+        """Log one write, as reported by :meth:`WeatherStore.add_observer`."""
+        with self._lock:
+            if date != self._last_date:
+                self._last_number = day_number(date)
+                self._last_date = date
+            number = self._last_number
+            records = bytearray()
+            for column, values in column_values:
+                for hour, value in zip(hours, values):
+                    if value is None:
+                        records += _RECORD.pack(number, hour, column | _CLEARED, 0.0)
+                    else:
+                        records += _RECORD.pack(number, hour, column, value)
+            self._file.write(records)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    @property
+    def size(self) -> int:
+        """Bytes written to the log so far, header included."""
+        return self._file.tell()
+
+    def reset(self) -> None:
+        """Discard every logged write, leaving only the header."""
+        with self._lock:
+            self._file.seek(0)
+            self._file.truncate(_LOG_HEADER.size)
+            self._file.seek(0, os.SEEK_END)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def replay_log(path, store: WeatherStore) -> int:
+    """
+    Apply every complete record of a write log to a store, in log order.
+
+    Consecutive records for the same day and column are stored as one batch.
+
+    Returns:
+        The number of records replayed.
+
+    Raises:
+        ValueError: If the file is not a write log
+    """
+    with open(path, 'rb') as file:
+        data = file.read()
+    if len(data) < _LOG_HEADER.size:
+        return 0
+    magic, version = _LOG_HEADER.unpack_from(data, 0)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise ValueError(f"{path} is not a version {LOG_VERSION} write log")
+    end = _LOG_HEADER.size + (len(data) - _LOG_HEADER.size) // _RECORD.size * _RECORD.size
+
+    replayed = 0
+    run_key = None
+    hours = []
+    values = []
+    for number, hour, column, value in _RECORD.iter_unpack(memoryview(data)[_LOG_HEADER.size:end]):
+        if hour >= HOURS_PER_DAY:
+            raise ValueError(f"{path} has a corrupt record at {replayed}")
+        key = (number, column & ~_CLEARED)
+        if key != run_key:
+            _store_run(store, run_key, hours, values)
+            run_key, hours, values = key, [], []
+        hours.append(hour)
+        values.append(None if column & _CLEARED else value)
+        replayed += 1
+    _store_run(store, run_key, hours, values)
+    return replayed
+
+
+def _store_run(store: WeatherStore, key, hours: list, values: list) -> None:
+    if key is None:
+        return
+    number, column = key
+    day = store._day(_date.fromordinal(number).isoformat())
+    store._store_batch(day, hours, [(column, values)])
+
+
+class WeatherJournal:
+    """
+    A WeatherStore kept durable by a write log and periodic snapshots.
+
+    Opening a journal directory recovers the store from its snapshot and log,
+    then logs every later write. Write to ``journal.store`` exactly as to any
+    WeatherStore, e.g. ``store_rainfall(date, hour, value, journal.store)``.
+
+    Args:
+        directory: Directory holding the snapshot and the log; created if needed
+        store_factory: Callable returning the empty store to recover into
+        checkpoint_bytes: When set, checkpoint automatically once the log
+            grows past this size
+        fsync: Passed on to the WriteLog
+    """
+
+    def __init__(self, directory, store_factory=WeatherStore, checkpoint_bytes: int = None,
+                 fsync: bool = False):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_bytes = checkpoint_bytes
+        self._lock = threading.RLock()
+        self.snapshot_path = self.directory / SNAPSHOT_NAME
+        self.log_path = self.directory / LOG_NAME
+
+        self.store = store_factory()
+        if self.snapshot_path.exists():
+            load_weather_file(self.snapshot_path, self.store)
+        self.recovered = replay_log(self.log_path, self.store) if self.log_path.exists() else 0
+
+        self.log = WriteLog(self.log_path, fsync=fsync)
+        self.store.add_observer(self._append)
+
+    def _append(self, date: str, hours, column_values: list) -> None:
+        with self._lock:
+            self.log.append(date, hours, column_values)
+            if self.checkpoint_bytes is not None and self.log.size >= self.checkpoint_bytes:
+                self.checkpoint()
+
+    def checkpoint(self) -> None:
+        """
+        Snapshot the whole store and empty the log.
+
+        The snapshot replaces the previous one atomically before the log is
+        emptied, so a crash at any point still recovers every logged write.
+        Writes applied while the snapshot is taken wait to be logged until
+        the log has been emptied, so none of them is lost with it.
+        """
+        with self._lock:
+            write_weather_file(self.snapshot_path, self.store)
+            self.log.reset()
+
+    def close(self) -> None:
+        """Stop logging and close the log; the store stays usable in memory."""
+        self.store.remove_observer(self._append)
+        self.log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,136 @@
+"""Tests for the daily and monthly aggregates maintained by WeatherStore."""
+
+import random
+
+import pytest
+from src.tdd_practice.aggregates import Aggregate
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+def test_daily_rainfall_total():
+    """Test the daily rainfall sum, count, min, max and mean."""
+    store = WeatherStore()
+
+    for hour, value in [(0, 1.0), (5, 4.0), (23, 7.0)]:
+        store_rainfall('2024-01-15', hour, value, store)
+
+    daily = store.daily('2024-01-15', 'rainfall')
+    assert daily == Aggregate(12.0, 3, 1.0, 7.0)
+    assert daily.mean == 4.0
+
+
+def test_daily_temperature_extremes_and_peak_wind():
+    """Test per-field aggregates of composite metrics."""
+    store = WeatherStore()
+
+    store_temperature('2024-01-15', 0, {'max': 5, 'min': -3, 'average': 1}, store)
+    store_temperature('2024-01-15', 12, {'max': 14, 'min': 6, 'average': 10}, store)
+    store_wind_speed('2024-01-15', 12, {'min': 2.0, 'max': 30.0}, store)
+
+    assert store.daily('2024-01-15', 'temperature.max').max == 14
+    assert store.daily('2024-01-15', 'temperature.min').min == -3
+    assert store.daily('2024-01-15', 'wind_speed.max').max == 30.0
+    assert store.daily('2024-01-15', 'rainfall') == Aggregate()
+
+
+def test_overwrite_retracts_old_value():
+    """Test that overwriting the current extreme retracts it from day and month."""
+    store = WeatherStore()
+
+    store_rainfall('2024-01-15', 0, 10.0, store)
+    store_rainfall('2024-01-15', 1, 2.0, store)
+    store_rainfall('2024-01-20', 0, 8.0, store)
+    store_rainfall('2024-01-15', 0, 1.0, store)
+
+    assert store.daily('2024-01-15', 'rainfall') == Aggregate(3.0, 2, 1.0, 2.0)
+    assert store.monthly('2024-01', 'rainfall') == Aggregate(11.0, 3, 1.0, 8.0)
+
+
+def test_partial_overwrite_retracts_dropped_fields():
+    """Test that fields dropped by an overwrite leave the aggregates."""
+    store = WeatherStore()
+
+    store_temperature('2024-01-15', 0, {'max': 5, 'min': -3, 'average': 1}, store)
+    store_temperature('2024-01-15', 0, {'max': 6, 'min': -2}, store)
+
+    assert store.daily('2024-01-15', 'temperature.average') == Aggregate()
+    assert store.monthly('2024-01', 'temperature.max') == Aggregate(6.0, 1, 6.0, 6.0)
+
+
+def test_months_are_separate():
+    """Test that days only count towards their own month."""
+    store = WeatherStore()
+
+    store_rainfall('2024-01-31', 23, 3.0, store)
+    store_rainfall('2024-02-01', 0, 4.0, store)
+
+    assert store.monthly('2024-01', 'rainfall').sum == 3.0
+    assert store.monthly('2024-02', 'rainfall').sum == 4.0
+    with pytest.raises(KeyError):
+        store.monthly('2024-03', 'rainfall')
+    with pytest.raises(KeyError):
+        store.daily('2024-01-15', 'rainfall')
+
+
+def test_matches_recomputation_after_random_overwrites():
+    """Test that running aggregates match a full recomputation."""
+    rng = random.Random(8)
+    store = WeatherStore()
+    dates = ['2024-05-01', '2024-05-02', '2024-05-17']
+
+    for _ in range(500):
+        store_rainfall(rng.choice(dates), rng.randrange(24), float(rng.randrange(50)), store)
+
+    readings = [value for _, _, value in store.query_range('2024-05-01', '2024-05-31', 'rainfall')]
+    monthly = store.monthly('2024-05', 'rainfall')
+    assert monthly.count == len(readings)
+    assert monthly.sum == pytest.approx(sum(readings))
+    assert (monthly.min, monthly.max) == (min(readings), max(readings))
+    for date in dates:
+        day = [record['rainfall'] for record in store[date].values()]
+        daily = store.daily(date, 'rainfall')
+        assert daily.count == len(day)
+        assert daily.sum == pytest.approx(sum(day))
+        assert (daily.min, daily.max) == (min(day), max(day))
+
+
+def test_overwriting_day_extreme_with_new_month_extreme():
+    """Test that a day rescan does not hide a new value from the month."""
+    store = WeatherStore()
+    store_rainfall('2024-01-01', 0, 5.0, store)
+    store_rainfall('2024-01-02', 0, 10.0, store)
+    store_rainfall('2024-01-02', 1, 20.0, store)
+
+    store_rainfall('2024-01-02', 0, 3.0, store)
+
+    assert store.daily('2024-01-02', 'rainfall') == Aggregate(23.0, 2, 3.0, 20.0)
+    assert store.monthly('2024-01', 'rainfall') == Aggregate(28.0, 3, 3.0, 20.0)
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_batch_writes_match_single_writes(batch):
+    """Test that batched day writes keep the same aggregates as single writes."""
+    rng = random.Random(13)
+    store = WeatherStore()
+    expected = WeatherStore()
+    dates = ['2024-05-01', '2024-05-02', '2024-05-17']
+
+    for _ in range(40):
+        date = rng.choice(dates)
+        hours = [rng.randrange(24) for _ in range(rng.randrange(1, 6))]
+        values = [float(rng.randrange(-20, 50)) for _ in hours]
+        for hour, value in zip(hours, values):
+            store_rainfall(date, hour, value, expected)
+        if batch:
+            store.day_writer(date).store_many('rainfall', hours, values)
+        else:
+            for hour, value in zip(hours, values):
+                store.day_writer(date).store_rainfall(hour, value)
+
+    assert store == expected
+    assert store.monthly('2024-05', 'rainfall') == expected.monthly('2024-05', 'rainfall')
+    for date in dates:
+        assert store.daily(date, 'rainfall') == expected.daily(date, 'rainfall')
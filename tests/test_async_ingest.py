@@ -0,0 +1,143 @@
+"""Tests for the asyncio weather ingestion front-end."""
+
+import asyncio
+
+import pytest
+from src.tdd_practice.async_ingest import AsyncWeatherIngestor
+from src.tdd_practice.weather_store import WeatherStore
+
+
+@pytest.mark.parametrize("storage_factory", [dict, WeatherStore])
+def test_concurrent_producers_are_stored(storage_factory):
+    """Test that readings from concurrent producers of every feed are all stored."""
+    storage = storage_factory()
+
+    async def main():
+        async with AsyncWeatherIngestor(storage, max_queue=8, batch_size=5) as ingestor:
+            async def rainfall():
+                for hour in range(24):
+                    await ingestor.put('rainfall', '2024-01-15', hour, float(hour))
+
+            async def temperature():
+                for hour in range(24):
+                    await ingestor.put('temperature', '2024-01-15', hour,
+                                       {'max': 20, 'min': 10, 'average': 15})
+
+            async def wind():
+                for hour in range(24):
+                    await ingestor.put('wind_speed', '2024-01-16', hour, {'min': 1.0, 'max': 9.0})
+
+            await asyncio.gather(rainfall(), temperature(), wind())
+        return ingestor.stats()
+
+    stats = asyncio.run(main())
+
+    assert len(storage['2024-01-15']) == 24
+    assert storage['2024-01-15'][7] == {
+        'rainfall': 7.0,
+        'temperature': {'max': 20, 'min': 10, 'average': 15},
+    }
+    assert storage['2024-01-16'][23] == {'wind_speed': {'min': 1.0, 'max': 9.0}}
+    for feed in ('rainfall', 'temperature', 'wind_speed'):
+        assert stats[feed].received == stats[feed].written == 24
+        assert stats[feed].queued == 0
+        assert stats[feed].batches >= 24 // 5
+
+
+def test_readings_are_coalesced_into_batches():
+    """Test that queued readings are written together rather than one by one."""
+    storage = {}
+
+    async def main():
+        ingestor = AsyncWeatherIngestor(storage, max_queue=100, batch_size=50)
+        await ingestor.start()
+        for hour in range(24):
+            await ingestor.put('rainfall', '2024-01-15', hour, 1.0)
+        await ingestor.stop()
+        return ingestor.stats()['rainfall']
+
+    stats = asyncio.run(main())
+
+    assert stats.batches == 1
+    assert stats.written == 24
+    assert stats.rows_per_second > 0
+
+
+def test_bad_readings_are_counted_not_raised():
+    """Test that rejected readings are counted and the feed keeps going."""
+    storage = WeatherStore()
+
+    async def main():
+        async with AsyncWeatherIngestor(storage) as ingestor:
+            await ingestor.put('rainfall', '2024-01-15', 24, 1.0)
+            await ingestor.put('rainfall', '2024-01-15', 1, 'heavy')
+            await ingestor.put('rainfall', '2024-01-15', 2, 2.0)
+        return ingestor.stats()['rainfall']
+
+    stats = asyncio.run(main())
+
+    assert (stats.written, stats.rejected) == (1, 2)
+    assert dict(storage['2024-01-15']) == {2: {'rainfall': 2.0}}
+
+
+def test_put_requires_known_feed_and_start():
+    """Test that put refuses unknown feeds and an ingestor that is not running."""
+    async def main():
+        ingestor = AsyncWeatherIngestor({})
+        with pytest.raises(RuntimeError):
+            await ingestor.put('rainfall', '2024-01-15', 1, 1.0)
+        await ingestor.start()
+        with pytest.raises(KeyError):
+            await ingestor.put('humidity', '2024-01-15', 1, 1.0)
+        await ingestor.stop()
+
+    asyncio.run(main())
+
+
+def test_failed_batches_are_retried_per_reading():
+    """Test that a batch whose write raises is stored reading by reading and its errors are kept."""
+    storage = {}
+
+    async def main():
+        ingestor = AsyncWeatherIngestor(storage, batch_size=10)
+        await ingestor.start()
+        await ingestor.put('rainfall', '2024-01-15', 1, 1.0)
+        await ingestor.put('rainfall', ['not', 'a', 'date'], 2, 2.0)
+        await ingestor.put('rainfall', '2024-01-16', 3, 3.0)
+        await ingestor.stop()
+        return ingestor.stats()['rainfall']
+
+    stats = asyncio.run(main())
+
+    assert (stats.written, stats.rejected, stats.failed) == (2, 1, 0)
+    assert 'TypeError' in stats.last_error
+    assert storage == {'2024-01-15': {1: {'rainfall': 1.0}}, '2024-01-16': {3: {'rainfall': 3.0}}}
+
+
+def test_storage_failures_are_counted_apart_from_rejects():
+    """Test that readings whose write fails for another reason are counted as failed."""
+    class FailingStore(WeatherStore):
+        __slots__ = ()
+
+        def _store_batch(self, day, hours, column_values):
+            if day.date == '2024-01-16':
+                raise OSError("disk full")
+            super()._store_batch(day, hours, column_values)
+
+    storage = FailingStore()
+
+    async def main():
+        ingestor = AsyncWeatherIngestor(storage, batch_size=10)
+        await ingestor.start()
+        await ingestor.put('rainfall', '2024-01-15', 1, 1.0)
+        await ingestor.put('rainfall', '2024-01-16', 2, 2.0)
+        await ingestor.put('rainfall', '2024-01-17', 3, 3.0)
+        await ingestor.stop()
+        return ingestor.stats()['rainfall']
+
+    stats = asyncio.run(main())
+
+    assert (stats.written, stats.rejected, stats.failed) == (2, 0, 1)
+    assert stats.last_error == "OSError('disk full')"
+    assert storage['2024-01-15'][1] == {'rainfall': 1.0}
+    assert storage['2024-01-17'][3] == {'rainfall': 3.0}
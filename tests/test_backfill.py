@@ -0,0 +1,115 @@
+"""Tests for the multi-process historical backfill."""
+
+from datetime import date, timedelta
+
+import pytest
+from src.tdd_practice.backfill import backfill, partition_by_date
+from src.tdd_practice.ingest import parse_rows, store_columns
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.weather_store import WeatherStore
+
+
+def _rows(days=20):
+    start = date(2024, 1, 1)
+    rows = []
+    for offset in range(days):
+        day = (start + timedelta(days=offset)).isoformat()
+        for hour in range(0, 24, 6):
+            rows.append((day, hour, 'rainfall', offset + hour / 10))
+            rows.append((day, hour, 'temperature.max', 20 + offset))
+    return rows
+
+
+def test_partitions_are_contiguous_date_ranges():
+    """Test that partitions split on date boundaries and cover every row once."""
+    rows = _rows()
+
+    parts = partition_by_date(rows, 4)
+
+    assert len(parts) == 4
+    assert sorted(index for indices, _ in parts for index in indices) == list(range(len(rows)))
+    ranges = [(chunk[0][0], chunk[-1][0]) for _, chunk in parts]
+    for (_, previous_end), (next_start, _) in zip(ranges, ranges[1:]):
+        assert previous_end < next_start
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_backfill_matches_sequential_ingest(workers):
+    """Test that a parallel backfill stores exactly what a sequential ingest would."""
+    rows = _rows()
+    # Later rows overwrite earlier ones for the same date, hour and metric.
+    rows.append(('2024-01-03', 6, 'rainfall', 99.0))
+    expected = WeatherStore()
+    columns, _ = parse_rows(rows)
+    store_columns(columns, expected)
+
+    store, rejects = backfill(rows, workers=workers, partitions=3)
+
+    assert rejects == []
+    assert store == expected
+    assert store['2024-01-03'][6]['rainfall'] == 99.0
+    assert store.monthly('2024-01', 'rainfall') == expected.monthly('2024-01', 'rainfall')
+
+
+def test_backfill_overwrites_existing_storage():
+    """Test that backfilled readings win over readings already stored."""
+    storage = WeatherStore()
+    store_rainfall('2024-01-02', 0, -1.0, storage)
+    store_rainfall('2024-01-02', 1, 7.0, storage)
+
+    backfill(_rows(3), storage, workers=2)
+
+    assert storage['2024-01-02'][0]['rainfall'] == 1.0
+    assert storage['2024-01-02'][1]['rainfall'] == 7.0
+
+
+def test_backfill_reports_rejects_by_input_position():
+    """Test that rejects from every worker are mapped back to input rows."""
+    rows = _rows(4)
+    rows[3] = ('2024-01-01', 25, 'rainfall', 1.0)
+    rows[-1] = ('2024-01-04', 1, 'humidity', 1.0)
+
+    _, rejects = backfill(rows, workers=2)
+
+    assert [reject.index for reject in rejects] == [3, len(rows) - 1]
+
+
+def test_rows_without_usable_dates_go_to_the_first_partition():
+    """Test that rows with missing or non-string dates never bound a partition."""
+    rows = [('2024-01-01', 0, 'rainfall', 1.0), (None, 1, 'rainfall', 1.0), None, (20240101, 2, 'rainfall', 1.0)]
+
+    parts = partition_by_date(rows, 2)
+
+    assert parts == [([0, 1, 2, 3], rows)]
+    store, rejects = backfill(rows, workers=1, partitions=2)
+    assert [reject.index for reject in rejects] == [1, 2, 3]
+    assert dict(store['2024-01-01']) == {0: {'rainfall': 1.0}}
+
+
+def test_adopting_partition_stores_matches_merging():
+    """Test that taking over a partition's days gives the same store as copying them."""
+    def stores():
+        storage = WeatherStore()
+        store_rainfall('2024-01-10', 0, 5.0, storage)
+        store_rainfall('2024-02-01', 0, 9.0, storage)
+        partition = WeatherStore()
+        for day in ('2024-01-03', '2024-01-10', '2024-01-20', '2024-03-01'):
+            store_rainfall(day, 1, 1.5, partition)
+            store_rainfall(day, 2, -0.5, partition)
+        partition.seal('2024-01-20')
+        return storage, partition
+
+    expected, partition = stores()
+    expected.merge(partition)
+    adopted, partition = stores()
+
+    adopted._adopt(partition)
+
+    assert len(partition) == 0
+    assert list(adopted) == list(expected)
+    assert adopted == expected
+    for month in ('2024-01', '2024-02', '2024-03'):
+        assert adopted.monthly(month, 'rainfall') == expected.monthly(month, 'rainfall')
+    adopted.drop_day('2024-01-03')
+    expected.drop_day('2024-01-03')
+    assert adopted.monthly('2024-01', 'rainfall') == expected.monthly('2024-01', 'rainfall')
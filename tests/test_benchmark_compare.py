@@ -0,0 +1,51 @@
+"""Tests for the benchmark baseline gate."""
+
+import json
+
+from benchmarks.compare import Comparison, compare, load, main, regressions
+
+
+def _write_results(path, medians: dict) -> str:
+    data = {'benchmarks': [
+        {'fullname': name, 'stats': {'min': median / 2, 'median': median, 'mean': median}}
+        for name, median in medians.items()
+    ]}
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_load_reads_chosen_stat(tmp_path):
+    """Test that load maps full benchmark names to the chosen statistic."""
+    path = _write_results(tmp_path / 'run.json', {'bench::a': 0.002})
+
+    assert load(path) == {'bench::a': 0.002}
+    assert load(path, 'min') == {'bench::a': 0.001}
+
+
+def test_compare_pairs_common_benchmarks():
+    """Test that compare pairs shared benchmarks and lists the rest."""
+    comparisons, missing, added = compare({'a': 1.0, 'b': 2.0}, {'b': 3.0, 'c': 1.0})
+
+    assert comparisons == [Comparison('b', 2.0, 3.0)]
+    assert comparisons[0].ratio == 1.5
+    assert missing == ['a']
+    assert added == ['c']
+
+
+def test_regressions_apply_threshold():
+    """Test that only slowdowns beyond the threshold count as regressions."""
+    comparisons = [Comparison('fast', 1.0, 0.5), Comparison('close', 1.0, 1.05), Comparison('slow', 1.0, 1.2)]
+
+    assert regressions(comparisons, 0.10) == [Comparison('slow', 1.0, 1.2)]
+
+
+def test_main_fails_on_regression(tmp_path, capsys):
+    """Test that the gate exits non-zero only when a benchmark regressed."""
+    baseline = _write_results(tmp_path / 'baseline.json', {'bench::a': 1.0, 'bench::b': 1.0})
+    steady = _write_results(tmp_path / 'steady.json', {'bench::a': 1.05, 'bench::b': 0.9})
+    slower = _write_results(tmp_path / 'slower.json', {'bench::a': 1.5, 'bench::b': 1.0})
+
+    assert main([baseline, steady]) == 0
+    assert main([baseline, slower]) == 1
+    assert main([baseline, slower, '--threshold', '0.6']) == 0
+    assert 'REGRESSED' in capsys.readouterr().out
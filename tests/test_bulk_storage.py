@@ -0,0 +1,130 @@
+"""Tests for the bulk store_*_many ingestion functions."""
+
+import pytest
+from src.tdd_practice.bulk import Reject
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.weather_storage import store_temperature, store_temperature_many
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.wind_storage import store_wind_speed, store_wind_speed_many
+
+
+BULK_CASES = [
+    (store_temperature_many, store_temperature, [
+        {'max': 5, 'min': 0, 'average': 2.5},
+        {'max': 25, 'min': 15, 'average': 20},
+        {'max': 10, 'min': 8, 'average': 9},
+        {'max': 12, 'min': 9, 'average': 10},
+    ]),
+    (store_rainfall_many, store_rainfall, [0.0, 5.5, 15.2, 3.0]),
+    (store_wind_speed_many, store_wind_speed, [
+        {'min': 0.0, 'max': 5.0},
+        {'min': 10.0, 'max': 25.0},
+        {'min': 3.0, 'max': 8.0},
+        {'min': 4.0, 'max': 9.0},
+    ]),
+]
+
+
+@pytest.mark.parametrize("storage_factory", [dict, WeatherStore])
+@pytest.mark.parametrize("store_many,store_func,values", BULK_CASES)
+def test_bulk_matches_single_writes(store_many, store_func, values, storage_factory):
+    """Test that a bulk store leaves storage exactly as per-row stores would."""
+    dates = ['2024-01-15', '2024-01-16', '2024-01-15', '2024-01-15']
+    hours = [0, 12, 23, 0]
+    expected = {}
+    storage = storage_factory()
+
+    for date, hour, value in zip(dates, hours, values):
+        store_func(date, hour, value, expected)
+    rejects = store_many(dates, hours, values, storage)
+
+    assert rejects == []
+    assert storage == expected
+    assert storage['2024-01-15'][0] == expected['2024-01-15'][0]
+
+
+@pytest.mark.parametrize("storage_factory", [dict, WeatherStore])
+@pytest.mark.parametrize("store_many,store_func,values", BULK_CASES)
+def test_bulk_reports_invalid_hours(store_many, store_func, values, storage_factory):
+    """Test that invalid hours are reported per row without aborting the batch."""
+    dates = ['2024-01-15'] * 4
+    hours = [-1, 5, 24, 6]
+    storage = storage_factory()
+
+    rejects = store_many(dates, hours, values, storage)
+
+    assert [reject.index for reject in rejects] == [0, 2]
+    assert all("Hour must be between 0 and 23" in reject.reason for reject in rejects)
+    assert sorted(storage['2024-01-15']) == [5, 6]
+
+
+@pytest.mark.parametrize("store_many", [
+    store_temperature_many, store_rainfall_many, store_wind_speed_many,
+])
+def test_bulk_rejects_mismatched_lengths(store_many):
+    """Test that sequences of different lengths are refused outright."""
+    with pytest.raises(ValueError, match="same length"):
+        store_many(['2024-01-15'], [1, 2], [1.0], {})
+
+
+def test_bulk_rejects_non_numeric_values_in_weather_store():
+    """Test that a WeatherStore reports readings it cannot hold as rejects."""
+    storage = WeatherStore()
+
+    rejects = store_rainfall_many(
+        ['2024-01-15', '2024-01-15', '2024-01-16'],
+        [1, 'x', 2],
+        [1.5, 2.0, 'heavy'],
+        storage,
+    )
+
+    assert [reject.index for reject in rejects] == [1, 2]
+    assert isinstance(rejects[0], Reject)
+    assert dict(storage['2024-01-15']) == {1: {'rainfall': 1.5}}
+    assert '2024-01-16' not in storage
+
+
+def test_bulk_rejects_non_numeric_fields_of_partial_readings():
+    """Test that a bad field is rejected even when other readings leave that field out."""
+    storage = WeatherStore()
+
+    rejects = store_wind_speed_many(
+        ['2024-01-15'] * 3,
+        [1, 2, 3],
+        [{'min': 1.0}, {'min': 'calm', 'max': 4.0}, {'min': 2.0, 'max': 5.0}],
+        storage,
+    )
+
+    assert [reject.index for reject in rejects] == [1]
+    assert dict(storage['2024-01-15']) == {
+        1: {'wind_speed': {'min': 1.0}},
+        3: {'wind_speed': {'min': 2.0, 'max': 5.0}},
+    }
+
+
+def test_bulk_rejects_invalid_dates_in_weather_store():
+    """Test that rows for dates a WeatherStore cannot index are reported."""
+    storage = WeatherStore()
+
+    rejects = store_rainfall_many(['2024-01-15', 'Jan 16'], [1, 2], [1.5, 2.0], storage)
+
+    assert [reject.index for reject in rejects] == [1]
+    assert list(storage) == ['2024-01-15']
+
+
+def test_bulk_none_readings_clear_like_single_writes():
+    """Test that a None reading in a batch clears the hour, as store_rainfall does, and bad rows are still reported."""
+    storage = WeatherStore()
+    store_rainfall('2024-01-01', 2, 4.0, storage)
+
+    rejects = store_rainfall_many(
+        ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-02'],
+        [1, 2, 3, 4],
+        [1.0, None, 'x', None],
+        storage,
+    )
+
+    assert [reject.index for reject in rejects] == [2]
+    assert dict(storage['2024-01-01']) == {1: {'rainfall': 1.0}}
+    assert dict(storage['2024-01-02']) == {}
+    assert storage.daily('2024-01-01', 'rainfall').count == 1
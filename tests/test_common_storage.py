@@ -1,5 +1,7 @@
 """Common tests for all weather data storage functions using parametrization."""
 
+from collections import OrderedDict
+
 import pytest
 from src.tdd_practice.weather_storage import store_temperature
 from src.tdd_practice.rainfall_storage import store_rainfall
@@ -178,3 +180,17 @@ def test_same_hour_different_days(store_func, data_key, data1, data2):
     assert storage[date2][hour][data_key] == data2
     assert storage[date1][hour][data_key] != storage[date2][hour][data_key]
 
+
+
+@pytest.mark.parametrize("store_func,data_key,test_data", [
+    (store_temperature, 'temperature', {'max': 10, 'min': 5, 'average': 7.5}),
+    (store_rainfall, 'rainfall', 10.5),
+    (store_wind_speed, 'wind_speed', {'min': 5.0, 'max': 15.0}),
+])
+def test_dict_subclass_storage(store_func, data_key, test_data):
+    """Test that dict subclasses are stored into like plain dicts."""
+    storage = OrderedDict()
+    
+    store_func('2024-01-15', 10, test_data, storage)
+    
+    assert storage['2024-01-15'][10][data_key] == test_data
@@ -0,0 +1,145 @@
+"""Tests for column compression and sealed weather days."""
+
+import math
+import random
+import struct
+import sys
+
+import pytest
+from benchmarks.bench_compression import fill
+from src.tdd_practice.compression import (
+    DECIMAL,
+    RAW,
+    XOR,
+    ZERO_RUNS,
+    decode_column,
+    encode_column,
+    pack_columns,
+    unpack_columns,
+)
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.weather_file import WeatherFile, write_weather_file
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+
+
+def _bits(values) -> bytes:
+    return struct.pack(f'<{len(values)}d', *values)
+
+
+@pytest.mark.parametrize('values, encoding', [
+    ([20.1, 20.3, 20.3, 20.6, 19.9], DECIMAL),
+    ([0.0] * 20 + [1.2, 0.4] + [0.0] * 2, ZERO_RUNS),
+    ([1 / 3, 1 / 3, 1 / 3, 1 / 3 + 1e-15], XOR),
+    ([-0.0], RAW),
+])
+def test_encode_column_picks_encoding(values, encoding):
+    """Test that typical columns get the expected encoding and round-trip exactly."""
+    chosen, payload = encode_column(values)
+
+    assert chosen == encoding
+    assert _bits(decode_column(chosen, payload, len(values))) == _bits(values)
+
+
+def test_round_trips_are_bit_exact():
+    """Test that every encoding restores values bit for bit, including special floats."""
+    generator = random.Random(7)
+    specials = [0.0, -0.0, math.nan, math.inf, -math.inf, 5e-324, 1e308, 0.1, -12.5]
+    for _ in range(500):
+        values = [
+            generator.choice([generator.choice(specials), generator.random() * 100,
+                              round(generator.uniform(-30, 40), 1), 0.0])
+            for _ in range(generator.randint(1, 24))
+        ]
+        encoding, payload = encode_column(values)
+        assert _bits(decode_column(encoding, payload, len(values))) == _bits(values)
+
+
+def test_pack_columns_skips_empty_columns():
+    """Test that packing keeps column order and takes counts from the caller."""
+    columns = [[1.5, 2.5], [], [0.0, 0.0, 3.0]]
+
+    packed = pack_columns(columns)
+
+    assert unpack_columns(packed, [2, 0, 3]) == columns
+    assert pack_columns([[], []]) == b''
+
+
+def test_sealed_day_reads_and_aggregates_unchanged(tmp_path):
+    """Test that sealing keeps reads, range queries, aggregates and file output intact."""
+    store = WeatherStore()
+    fill(store, 40)
+    before = {date: {hour: dict(record) for hour, record in day.items()} for date, day in store.items()}
+    rainfall = list(store.query_range('2024-01-01', '2024-02-09', 'rainfall'))
+    monthly = store.monthly('2024-01', 'temperature.max')
+
+    assert store.seal_before('2024-02-01') == 31
+    assert store._days['2024-01-15'].values is None
+
+    assert {date: {hour: dict(record) for hour, record in day.items()}
+            for date, day in store.items()} == before
+    assert list(store.query_range('2024-01-01', '2024-02-09', 'rainfall')) == rainfall
+    assert store.monthly('2024-01', 'temperature.max') == monthly
+    write_weather_file(tmp_path / 'weather.tddw', store)
+    with WeatherFile(tmp_path / 'weather.tddw') as weather_file:
+        assert dict(weather_file['2024-01-15'][12]) == before['2024-01-15'][12]
+
+
+@pytest.mark.parametrize('store_type', [WeatherStore, ConcurrentWeatherStore])
+def test_write_unseals_day(store_type):
+    """Test that writing to a sealed day restores it and keeps aggregates right."""
+    store = store_type()
+    for hour in range(24):
+        store_rainfall('2024-01-15', hour, 0.0, store)
+    store_temperature('2024-01-15', 3, {'max': 5.0, 'min': 1.0, 'average': 3.0}, store)
+    store.seal('2024-01-15')
+
+    store_rainfall('2024-01-15', 3, 4.2, store)
+
+    assert store._days['2024-01-15'].packed is None
+    assert store['2024-01-15'][3] == {
+        'temperature': {'max': 5.0, 'min': 1.0, 'average': 3.0},
+        'rainfall': 4.2,
+    }
+    assert store.daily('2024-01-15', 'rainfall').sum == 4.2
+    assert store.daily('2024-01-15', 'rainfall').count == 24
+
+
+def test_views_of_sealed_days_do_not_see_later_writes():
+    """Test that a view decoded from a sealed day keeps its own presence mask."""
+    store = WeatherStore()
+    store_rainfall('2024-01-15', 12, 1.5, store)
+    store.seal('2024-01-15')
+    view = store['2024-01-15']
+
+    store_rainfall('2024-01-15', 13, 2.5, store)
+
+    assert dict(view) == {12: {'rainfall': 1.5}}
+    assert 13 not in view
+    assert store['2024-01-15'][13] == {'rainfall': 2.5}
+
+
+def test_merge_copies_sealed_days():
+    """Test that merging from a store with sealed days copies their readings."""
+    source = WeatherStore()
+    fill(source, 3)
+    source.seal_before('2024-01-04')
+    target = WeatherStore()
+
+    target.merge(source)
+
+    assert target['2024-01-02'][7] == source['2024-01-02'][7]
+    assert target.daily('2024-01-03', 'wind_speed.max') == source.daily('2024-01-03', 'wind_speed.max')
+
+
+def test_realistic_year_compresses_at_least_five_times():
+    """Test the memory target on slowly drifting 0.1-resolution readings and mostly-dry rainfall."""
+    store = WeatherStore()
+    fill(store, 60)
+    days = list(store._days.values())
+    raw = sum(sys.getsizeof(day.values) for day in days)
+
+    store.seal_before('2024-12-31')
+
+    assert raw / sum(sys.getsizeof(day.packed) for day in days) >= 5
@@ -0,0 +1,91 @@
+"""Tests for concurrent writers against shared weather storage."""
+
+import sys
+import threading
+
+import pytest
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+DATES = [f"2024-01-{day:02d}" for day in range(1, 11)]
+
+
+@pytest.fixture
+def frequent_thread_switches():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_feeds(storage, rounds=3):
+    """Write every hour of DATES from one thread per data source."""
+    def rainfall_feed():
+        for round_ in range(rounds):
+            for date in DATES:
+                for hour in range(24):
+                    store_rainfall(date, hour, float(round_ + 1), storage)
+
+    def temperature_feed():
+        for round_ in range(rounds):
+            for date in DATES:
+                for hour in range(24):
+                    store_temperature(date, hour, {'max': 20, 'min': 10, 'average': 15}, storage)
+
+    def wind_feed():
+        for round_ in range(rounds):
+            for date in DATES:
+                for hour in range(24):
+                    store_wind_speed(date, hour, {'min': 1.0, 'max': 9.0}, storage)
+
+    threads = [threading.Thread(target=feed) for feed in (rainfall_feed, temperature_feed, wind_feed)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+@pytest.mark.parametrize("storage_factory", [dict, ConcurrentWeatherStore])
+def test_independent_feeds_do_not_lose_updates(storage_factory, frequent_thread_switches):
+    """Test that three feeds writing the same dates on separate threads keep every reading."""
+    storage = storage_factory()
+
+    _run_feeds(storage)
+
+    assert len(storage) == len(DATES)
+    for date in DATES:
+        assert len(storage[date]) == 24
+        for hour in range(24):
+            assert storage[date][hour] == {
+                'rainfall': 3.0,
+                'temperature': {'max': 20, 'min': 10, 'average': 15},
+                'wind_speed': {'min': 1.0, 'max': 9.0},
+            }
+
+
+def test_aggregates_stay_consistent_under_concurrent_overwrites(frequent_thread_switches):
+    """Test that running aggregates match the final data when feeds overwrite each other."""
+    storage = ConcurrentWeatherStore()
+
+    def rainfall_feed(feed):
+        for round_ in range(10):
+            for date in DATES:
+                for hour in range(24):
+                    store_rainfall(date, hour, float(feed * 100 + round_), storage)
+
+    threads = [threading.Thread(target=rainfall_feed, args=(feed,)) for feed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    readings = [value for _, _, value in storage.query_range(DATES[0], DATES[-1], 'rainfall')]
+    monthly = storage.monthly('2024-01', 'rainfall')
+    assert len(readings) == 24 * len(DATES)
+    assert monthly.count == len(readings)
+    assert monthly.sum == sum(readings)
+    assert (monthly.min, monthly.max) == (min(readings), max(readings))
+    assert list(storage) == DATES
@@ -0,0 +1,138 @@
+"""Tests for the read-through LRU day cache."""
+
+import pytest
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.day_cache import DayCache
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.weather_file import WeatherFile, write_weather_file
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+
+
+@pytest.fixture
+def store():
+    store = WeatherStore()
+    for day in range(1, 6):
+        store_rainfall(f'2024-01-0{day}', 12, float(day), store)
+    store_temperature('2024-01-01', 0, {'max': 5, 'min': 0, 'average': 2.5}, store)
+    return store
+
+
+def test_cache_reads_like_the_store(store):
+    """Test that the cache answers lookups exactly like its store."""
+    cache = DayCache(store)
+
+    assert cache == store
+    assert cache['2024-01-01'][0]['temperature'] == {'max': 5, 'min': 0, 'average': 2.5}
+    assert cache.get('2024-02-01') is None
+    with pytest.raises(KeyError):
+        cache['2024-02-01']
+
+
+def test_repeated_lookups_hit(store):
+    """Test that a second lookup of a date is served from the cache."""
+    store.seal('2024-01-02')
+    cache = DayCache(store)
+
+    assert cache['2024-01-02'][12] == {'rainfall': 2.0}
+    assert cache['2024-01-02'][12] == {'rainfall': 2.0}
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_least_recently_used_day_is_evicted(store):
+    """Test that a full cache evicts the day looked up longest ago."""
+    cache = DayCache(store, capacity=2)
+
+    cache['2024-01-01']
+    cache['2024-01-02']
+    cache['2024-01-01']
+    cache['2024-01-03']
+    cache['2024-01-01']
+    cache['2024-01-02']
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (2, 4, 2, 2)
+
+
+@pytest.mark.parametrize("write", [
+    lambda storage: store_rainfall('2024-01-02', 12, 9.5, storage),
+    lambda storage: store_rainfall_many(['2024-01-02'], [12], [9.5], storage),
+])
+def test_writes_invalidate_sealed_days(store, write):
+    """Test that store_* writes to a cached sealed day are visible through the cache."""
+    store.seal('2024-01-02')
+    cache = DayCache(store)
+    assert cache['2024-01-02'][12] == {'rainfall': 2.0}
+
+    write(store)
+
+    assert cache['2024-01-02'][12] == {'rainfall': 9.5}
+    assert cache.stats().invalidations == 1
+
+
+def test_dropped_and_sealed_days_are_reloaded(store):
+    """Test that the cache notices days dropped or sealed behind its back."""
+    cache = DayCache(store)
+    cache['2024-01-02']
+    cache['2024-01-03']
+
+    store.drop_day('2024-01-02')
+    store.seal('2024-01-03')
+
+    assert cache.get('2024-01-02') is None
+    assert cache['2024-01-03'][12] == {'rainfall': 3.0}
+    assert cache.stats().hits == 0
+    assert cache['2024-01-03'][12] == {'rainfall': 3.0}
+    assert cache.stats().hits == 1
+
+
+def test_cache_over_weather_file_outlives_it(tmp_path, store):
+    """Test that blocks cached from a weather file are copies of the mapped data."""
+    path = tmp_path / 'history.weather'
+    write_weather_file(path, store)
+
+    with WeatherFile(path) as weather:
+        cache = DayCache(weather)
+        view = cache['2024-01-05']
+        assert cache['2024-01-05'] == store['2024-01-05']
+
+    assert view[12] == {'rainfall': 5.0}
+    assert cache.stats().hits == 1
+
+
+def test_concurrent_store_writes_invalidate():
+    """Test that a cache over a ConcurrentWeatherStore sees writes made under its locks."""
+    concurrent = ConcurrentWeatherStore()
+    store_rainfall('2024-01-01', 12, 1.0, concurrent)
+    concurrent.seal('2024-01-01')
+    cache = DayCache(concurrent)
+    cache['2024-01-01']
+
+    store_rainfall('2024-01-01', 13, 2.0, concurrent)
+
+    assert dict(cache['2024-01-01']) == {12: {'rainfall': 1.0}, 13: {'rainfall': 2.0}}
+
+
+def test_close_stops_observing(store):
+    """Test that a closed cache is no longer called on writes and is empty."""
+    cache = DayCache(store)
+    cache['2024-01-01']
+
+    cache.close()
+    store_rainfall('2024-01-01', 13, 2.0, store)
+
+    assert store._observers == []
+    assert cache.stats().size == 0
+
+
+@pytest.mark.parametrize("source, capacity, error", [
+    ({}, 8, TypeError),
+    (WeatherStore(), 0, ValueError),
+])
+def test_invalid_arguments(source, capacity, error):
+    """Test that unsupported sources and non-positive capacities are rejected."""
+    with pytest.raises(error):
+        DayCache(source, capacity)
@@ -0,0 +1,138 @@
+"""Tests for streaming CSV/NDJSON ingestion into weather storage."""
+
+import io
+import json
+
+import pytest
+from src.tdd_practice.ingest import ingest, ingest_chunks
+from src.tdd_practice.weather_store import WeatherStore
+
+
+CSV_TEXT = (
+    "date,hour,metric,value\n"
+    "2024-01-15,10,temperature.max,25\n"
+    "2024-01-15,10,temperature.min,15\n"
+    "2024-01-15,10,temperature.average,20\n"
+    "2024-01-15,10,rainfall,5.5\n"
+    "2024-01-15,10,wind_speed.min,5\n"
+    "2024-01-15,10,wind_speed.max,15\n"
+    "2024-01-16,0,rainfall,0\n"
+)
+
+EXPECTED = {
+    '2024-01-15': {10: {
+        'temperature': {'max': 25.0, 'min': 15.0, 'average': 20.0},
+        'rainfall': 5.5,
+        'wind_speed': {'min': 5.0, 'max': 15.0},
+    }},
+    '2024-01-16': {0: {'rainfall': 0.0}},
+}
+
+
+@pytest.mark.parametrize("storage_factory", [dict, WeatherStore])
+def test_ingest_csv(storage_factory):
+    """Test that a CSV file is ingested into storage."""
+    storage = storage_factory()
+
+    report = ingest(io.StringIO(CSV_TEXT), storage, format='csv')
+
+    assert storage == EXPECTED
+    assert report.rows == 7
+    assert report.stored == 7
+    assert report.rejected == 0
+
+
+@pytest.mark.parametrize("storage_factory", [dict, WeatherStore])
+def test_ingest_ndjson_file(tmp_path, storage_factory):
+    """Test that an NDJSON file is detected by name and ingested."""
+    path = tmp_path / 'readings.ndjson'
+    lines = [
+        json.dumps({'date': date, 'hour': hour, 'metric': metric, 'value': value})
+        for date, hour, metric, value in (
+            ('2024-01-15', 10, 'temperature.max', 25),
+            ('2024-01-15', 10, 'temperature.min', 15),
+            ('2024-01-15', 10, 'temperature.average', 20),
+            ('2024-01-15', 10, 'rainfall', 5.5),
+            ('2024-01-15', 10, 'wind_speed.min', 5.0),
+            ('2024-01-15', 10, 'wind_speed.max', 15.0),
+            ('2024-01-16', 0, 'rainfall', 0.0),
+        )
+    ]
+    path.write_text("\n".join(lines) + "\n")
+    storage = storage_factory()
+
+    report = ingest(path, storage)
+
+    assert storage == EXPECTED
+    assert report.stored == 7
+
+
+def test_chunks_are_bounded_and_report_throughput():
+    """Test that rows are processed in fixed-size chunks with running totals."""
+    storage = WeatherStore()
+
+    reports = [
+        (report.rows, report.chunks)
+        for report in ingest_chunks(io.StringIO(CSV_TEXT), storage, chunk_size=3, format='csv')
+    ]
+
+    assert reports == [(3, 1), (6, 2), (7, 3)]
+    final = ingest(io.StringIO(CSV_TEXT), WeatherStore(), chunk_size=3, format='csv')
+    assert final.rows_per_second > 0
+
+
+def test_bad_rows_are_rejected_without_aborting():
+    """Test that invalid rows are reported by row number and the rest are stored."""
+    text = (
+        "date,hour,metric,value\n"
+        "2024-01-15,24,rainfall,1.0\n"
+        "2024-01-15,1,humidity,50\n"
+        "2024-01-15,2,rainfall,heavy\n"
+        ",3,rainfall,1.0\n"
+        "2024-01-15,4,rainfall,2.0\n"
+    )
+    storage = {}
+
+    report = ingest(io.StringIO(text), storage, chunk_size=2, format='csv')
+
+    assert [reject.index for reject in report.rejects] == [0, 1, 2, 3]
+    assert report.stored == 1
+    assert storage == {'2024-01-15': {4: {'rainfall': 2.0}}}
+
+
+def test_ndjson_hours_must_be_whole_numbers():
+    """Test that fractional and boolean NDJSON hours are rejected rather than truncated."""
+    lines = [
+        json.dumps({'date': '2024-01-15', 'hour': hour, 'metric': 'rainfall', 'value': 1.0})
+        for hour in (3.9, True, 4.0, 5)
+    ]
+    storage = {}
+
+    report = ingest(io.StringIO("\n".join(lines)), storage, format='ndjson')
+
+    assert [reject.index for reject in report.rejects] == [0, 1]
+    assert storage == {'2024-01-15': {4: {'rainfall': 1.0}, 5: {'rainfall': 1.0}}}
+
+
+def test_values_must_be_finite_numbers():
+    """Test that boolean, NaN and infinite values are rejected rather than stored."""
+    lines = [
+        '{"date": "2024-01-15", "hour": 1, "metric": "rainfall", "value": true}',
+        '{"date": "2024-01-15", "hour": 2, "metric": "rainfall", "value": "NaN"}',
+        '{"date": "2024-01-15", "hour": 3, "metric": "rainfall", "value": "inf"}',
+        '{"date": "2024-01-15", "hour": 4, "metric": "rainfall", "value": NaN}',
+        '{"date": "2024-01-15", "hour": 5, "metric": "rainfall", "value": "2.5"}',
+    ]
+    storage = WeatherStore()
+
+    report = ingest(io.StringIO("\n".join(lines)), storage, format='ndjson')
+
+    assert [reject.index for reject in report.rejects] == [0, 1, 2, 3]
+    assert dict(storage['2024-01-15']) == {5: {'rainfall': 2.5}}
+    assert storage.daily('2024-01-15', 'rainfall').sum == 2.5
+
+
+def test_unknown_format():
+    """Test that an unsupported format is refused."""
+    with pytest.raises(ValueError, match="Unknown format"):
+        ingest(io.StringIO(CSV_TEXT), {}, format='xml')
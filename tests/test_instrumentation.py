@@ -0,0 +1,126 @@
+"""Tests for opt-in store_* instrumentation."""
+
+import json
+import urllib.request
+
+import pytest
+from src.tdd_practice import instrumentation
+from src.tdd_practice.instrumentation import LATENCY_BUCKETS, serve_metrics
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.wind_storage import store_wind_speed_many
+
+
+@pytest.fixture
+def enabled():
+    """Enable instrumentation for one test and always switch it back off."""
+    yield instrumentation.enable
+    instrumentation.disable()
+
+
+def test_disabled_by_default():
+    """Test that store_* calls record nothing unless instrumentation is enabled."""
+    assert instrumentation.active is None
+    store_rainfall('2024-01-15', 10, 5.5, {})
+    assert instrumentation.active is None
+
+
+@pytest.mark.parametrize('storage_type', [dict, WeatherStore])
+def test_counts_writes_overwrites_and_rejects(enabled, storage_type):
+    """Test that single writes, overwrites and invalid hours are counted per metric."""
+    storage = storage_type()
+    metrics = enabled(storage)
+
+    store_rainfall('2024-01-15', 10, 5.5, storage)
+    store_rainfall('2024-01-15', 10, 6.0, storage)
+    store_rainfall('2024-01-15', 11, 1.0, storage)
+    store_temperature('2024-01-15', 10, {'max': 20, 'min': 10, 'average': 15}, storage)
+    with pytest.raises(ValueError):
+        store_rainfall('2024-01-15', 24, 1.0, storage)
+
+    snapshot = metrics.snapshot()
+    rainfall = snapshot['metrics']['rainfall']
+    assert (rainfall['writes'], rainfall['overwrites'], rainfall['rejects']) == (3, 1, 1)
+    assert rainfall['latency']['single']['count'] == 3
+    assert snapshot['metrics']['temperature']['writes'] == 1
+    assert snapshot['metrics']['temperature']['overwrites'] == 0
+    assert snapshot['store'] == {
+        'days': 1,
+        'readings': {'temperature': 1, 'rainfall': 2, 'wind_speed': 0},
+    }
+
+
+def test_overwrites_of_sealed_days_are_detected_without_decoding(enabled, monkeypatch):
+    """Test that overwrite detection reads the presence masks rather than the day."""
+    storage = WeatherStore()
+    store_rainfall('2024-01-15', 10, 5.5, storage)
+    store_temperature('2024-01-15', 11, {'max': 20, 'min': 10, 'average': 15}, storage)
+    storage.seal('2024-01-15')
+    metrics = enabled(storage)
+    monkeypatch.setattr(WeatherStore, '__getitem__', None)
+
+    assert metrics.start_write('rainfall', storage, '2024-01-15', 10)[0] is True
+    assert metrics.start_write('rainfall', storage, '2024-01-15', 11)[0] is False
+    assert metrics.start_write('temperature', storage, '2024-01-15', 11)[0] is True
+    assert metrics.start_write('rainfall', storage, '2024-01-16', 10)[0] is False
+
+
+def test_counts_batches(enabled):
+    """Test that store_*_many batches count stored and rejected rows."""
+    metrics = enabled()
+    storage = WeatherStore()
+
+    rejects = store_wind_speed_many(
+        ['2024-01-15'] * 3, [1, 2, 30], [{'min': 1.0, 'max': 2.0}] * 3, storage,
+    )
+
+    stats = metrics.snapshot()['metrics']['wind_speed']
+    assert len(rejects) == 1
+    assert (stats['writes'], stats['rejects']) == (2, 1)
+    assert stats['latency']['batch']['count'] == 1
+    assert metrics.snapshot()['store'] is None
+
+
+def test_histogram_buckets_are_cumulative(enabled):
+    """Test that every observation lands in the +Inf bucket and buckets never decrease."""
+    metrics = enabled()
+    for hour in range(24):
+        store_rainfall('2024-01-15', hour, 1.0, {})
+
+    buckets = metrics.snapshot()['metrics']['rainfall']['latency']['single']['buckets']
+    counts = [count for _, count in buckets]
+    assert len(buckets) == len(LATENCY_BUCKETS) + 1
+    assert counts == sorted(counts)
+    assert buckets[-1] == (float('inf'), 24)
+
+
+def test_prometheus_text(enabled):
+    """Test the Prometheus text rendering of counters, histograms and store size."""
+    storage = {}
+    metrics = enabled(storage)
+    store_rainfall_many(['2024-01-15', '2024-01-16'], [0, 1], [1.0, 2.0], storage)
+
+    text = metrics.prometheus_text()
+    assert '# TYPE tdd_weather_writes_total counter' in text
+    assert 'tdd_weather_writes_total{metric="rainfall"} 2' in text
+    assert 'tdd_weather_write_seconds_bucket{metric="rainfall",kind="batch",le="+Inf"} 1' in text
+    assert 'tdd_weather_write_seconds_count{metric="rainfall",kind="batch"} 1' in text
+    assert 'tdd_weather_store_days 2' in text
+    assert 'tdd_weather_store_readings{metric="rainfall"} 2' in text
+
+
+def test_serve_metrics(enabled):
+    """Test that the HTTP endpoint serves the text format and the JSON snapshot."""
+    metrics = enabled()
+    store_rainfall('2024-01-15', 10, 5.5, {})
+    server = serve_metrics(metrics, port=0)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            assert 'tdd_weather_writes_total{metric="rainfall"} 1' in response.read().decode()
+        with urllib.request.urlopen(f"{base}/snapshot") as response:
+            assert json.load(response)['metrics']['rainfall']['writes'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,90 @@
+"""Tests for the slotted temperature and wind speed reading types."""
+
+import sys
+
+import pytest
+from src.tdd_practice.readings import TemperatureReading, WindReading
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+def test_readings_compare_equal_to_payload_dicts():
+    """Test that readings and the equivalent dicts compare equal both ways."""
+    temperature = TemperatureReading(max=25.5, min=15.2, average=20.3)
+    wind = WindReading(min=5.0, max=15.0)
+
+    assert temperature == {'max': 25.5, 'min': 15.2, 'average': 20.3}
+    assert {'max': 25.5, 'min': 15.2, 'average': 20.3} == temperature
+    assert wind == {'min': 5.0, 'max': 15.0}
+    assert wind != {'min': 5.0, 'max': 16.0}
+
+
+def test_partial_reading_omits_missing_fields():
+    """Test that a field left as None is absent from the reading."""
+    wind = WindReading(max=15.0)
+
+    assert wind == {'max': 15.0}
+    assert 'min' not in wind
+    assert len(wind) == 1
+    with pytest.raises(KeyError):
+        wind['min']
+
+
+def test_readings_have_no_instance_dict():
+    """Test that readings keep their fields in slots."""
+    temperature = TemperatureReading(25.5, 15.2, 20.3)
+
+    assert not hasattr(temperature, '__dict__')
+    with pytest.raises(AttributeError):
+        temperature.humidity = 80
+    assert sys.getsizeof(temperature) < sys.getsizeof(dict(temperature))
+
+
+def test_from_mapping_builds_reading():
+    """Test that from_mapping accepts payload dicts and rejects unknown fields."""
+    assert WindReading.from_mapping({'min': 5.0, 'max': 15.0}) == WindReading(5.0, 15.0)
+
+    with pytest.raises(TypeError):
+        WindReading.from_mapping({'min': 5.0, 'gust': 30.0})
+
+
+def test_setting_unknown_field_fails():
+    """Test that item assignment only accepts the reading's fields."""
+    wind = WindReading()
+    wind['min'] = 5.0
+
+    assert wind == {'min': 5.0}
+    with pytest.raises(KeyError):
+        wind['gust'] = 30.0
+
+
+def test_store_functions_accept_readings_in_dict_storage():
+    """Test that readings are stored as-is in plain dict storage."""
+    storage = {}
+    temperature = TemperatureReading(25.5, 15.2, 20.3)
+
+    store_temperature('2024-01-15', 10, temperature, storage)
+    store_wind_speed('2024-01-15', 10, WindReading(5.0, 15.0), storage)
+
+    assert storage['2024-01-15'][10]['temperature'] is temperature
+    assert storage['2024-01-15'][10]['wind_speed'] == {'min': 5.0, 'max': 15.0}
+
+
+def test_weather_store_returns_readings():
+    """Test that WeatherStore accepts readings and reads composite metrics back as readings."""
+    store = WeatherStore()
+
+    store_temperature('2024-01-15', 10, TemperatureReading(25.5, 15.2, 20.3), store)
+    store_wind_speed('2024-01-15', 10, {'min': 5.0, 'max': 15.0}, store)
+    record = store['2024-01-15'][10]
+
+    assert isinstance(record['temperature'], TemperatureReading)
+    assert isinstance(record['wind_speed'], WindReading)
+    assert record == {
+        'temperature': {'max': 25.5, 'min': 15.2, 'average': 20.3},
+        'wind_speed': {'min': 5.0, 'max': 15.0},
+    }
+    assert list(store.query_range('2024-01-15', '2024-01-15', 'wind_speed')) == [
+        ('2024-01-15', 10, WindReading(5.0, 15.0)),
+    ]
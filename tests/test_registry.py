@@ -0,0 +1,146 @@
+"""Tests for the metric registry and the storage functions generated from it."""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from src.tdd_practice.async_ingest import FEEDS
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.readings import READING_TYPES, reading_type
+from src.tdd_practice.registry import METRICS, MetricSpec, register_metric
+from src.tdd_practice.store_functions import (
+    STORE_FUNCTIONS,
+    STORE_MANY_FUNCTIONS,
+    make_store_function,
+    make_store_many_function,
+)
+from src.tdd_practice.weather_store import COLUMNS, WeatherStore
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.parametrize("kwargs", [
+    {'name': 'relative humidity'},
+    {'name': 'wind', 'fields': ('min', 'min')},
+    {'name': 'wind', 'fields': ()},
+    {'name': 'strikes', 'dtype': str},
+    {'name': 'humidity', 'argument': 'storage'},
+    {'name': 'humidity', 'argument': '_value'},
+    {'name': 'humidity', 'argument': 'lambda'},
+])
+def test_metric_spec_rejects_invalid_schemas(kwargs):
+    """Test that bad names, fields, dtypes and argument names raise ValueError."""
+    with pytest.raises(ValueError):
+        MetricSpec(**kwargs)
+
+
+def test_metric_spec_columns():
+    """Test that scalar metrics have one column and composite metrics one per field."""
+    assert MetricSpec('humidity').columns == ('humidity',)
+    assert MetricSpec('gust', ('min', 'max')).columns == ('gust.min', 'gust.max')
+
+
+def test_every_metric_is_wired_into_storage():
+    """Test that each registered metric has columns, store functions and an ingest feed."""
+    assert COLUMNS == tuple(column for spec in METRICS.values() for column in spec.columns)
+    for name, spec in METRICS.items():
+        assert STORE_FUNCTIONS[name].__name__ == f"store_{name}"
+        assert STORE_MANY_FUNCTIONS[name].__name__ == f"store_{name}_many"
+        assert FEEDS[name] is STORE_MANY_FUNCTIONS[name]
+        assert (name in READING_TYPES) == (spec.fields is not None)
+
+
+@pytest.mark.parametrize("metric, argument, value", [
+    ('temperature', 'temperature_data', {'max': 25, 'min': 15, 'average': 20}),
+    ('rainfall', 'rainfall_value', 2.0),
+    ('wind_speed', 'wind_speed_data', {'min': 5.0, 'max': 15.0}),
+])
+def test_generated_functions_keep_argument_names(metric, argument, value):
+    """Test that readings can be passed by their original keyword to dicts and stores."""
+    assert METRICS[metric].argument == argument
+    for storage in ({}, WeatherStore()):
+        STORE_FUNCTIONS[metric]('2024-01-15', 1, storage=storage, **{argument: value})
+
+        assert storage['2024-01-15'][1][metric] == value
+
+
+def test_register_metric_after_import_raises():
+    """Test that metrics cannot be added once the store columns are built."""
+    with pytest.raises(RuntimeError):
+        register_metric(MetricSpec('humidity'))
+
+
+def test_generated_functions_are_documented():
+    """Test that generated functions carry the metric's description."""
+    assert store_rainfall is STORE_FUNCTIONS['rainfall']
+    assert "Store rainfall value" in store_rainfall.__doc__
+    assert "Raises:" in STORE_FUNCTIONS['temperature'].__doc__
+
+
+def test_generated_functions_store_a_new_metric_in_dicts():
+    """Test that functions built for an unregistered metric write nested dicts."""
+    spec = MetricSpec('humidity', description="relative humidity value")
+    store_humidity = make_store_function(spec)
+    store_humidity_many = make_store_many_function(spec)
+    storage = {}
+
+    store_humidity('2024-01-15', 10, 81.5, storage)
+    rejects = store_humidity_many(['2024-01-15', '2024-01-16'], [11, 24], [80.0, 79.0], storage)
+
+    assert storage == {'2024-01-15': {10: {'humidity': 81.5}, 11: {'humidity': 80.0}}}
+    assert [reject.index for reject in rejects] == [1]
+    with pytest.raises(ValueError):
+        store_humidity('2024-01-15', 24, 81.5, storage)
+
+
+def test_reading_type_is_slotted_and_rejects_unknown_fields():
+    """Test that generated reading types behave like the hand-written ones."""
+    GustReading = reading_type('GustReading', ('min', 'max'))
+    reading = GustReading(max=30.0)
+
+    assert reading == {'max': 30.0}
+    assert not hasattr(reading, '__dict__')
+    with pytest.raises(TypeError):
+        GustReading(peak=40.0)
+
+
+def test_registered_metrics_get_columns_and_aggregates():
+    """Test that metrics registered before import are stored columnar and int metrics refuse fractions."""
+    script = textwrap.dedent("""
+        from src.tdd_practice.registry import MetricSpec, register_metric
+        register_metric(MetricSpec('humidity', description='relative humidity value'))
+        register_metric(MetricSpec('lightning', ('strikes',), dtype=int))
+
+        from src.tdd_practice.store_functions import STORE_FUNCTIONS, STORE_MANY_FUNCTIONS
+        from src.tdd_practice.weather_store import WeatherStore
+
+        store = WeatherStore()
+        STORE_FUNCTIONS['humidity']('2024-01-15', 10, 81.5, store)
+        STORE_MANY_FUNCTIONS['lightning'](
+            ['2024-01-15', '2024-01-15'], [10, 11], [{'strikes': 3}, {'strikes': 4}], store)
+        assert store['2024-01-15'][10] == {'humidity': 81.5, 'lightning': {'strikes': 3}}
+        assert type(store['2024-01-15'][11]['lightning']['strikes']) is int
+        assert store.daily('2024-01-15', 'lightning.strikes').sum == 7
+        try:
+            STORE_FUNCTIONS['lightning']('2024-01-15', 12, {'strikes': 2.5}, store)
+        except TypeError as error:
+            assert 'must be ints' in str(error), error
+        else:
+            raise AssertionError('fractional strikes were stored')
+
+        from src.tdd_practice.ingest import parse_rows
+        columns, rejects = parse_rows([
+            ('2024-01-15', 12, 'lightning.strikes', 2.7),
+            ('2024-01-15', 13, 'lightning.strikes', True),
+            ('2024-01-15', 14, 'lightning.strikes', 2.0),
+            ('2024-01-15', 15, 'lightning.strikes', '5'),
+        ])
+        assert [reject.index for reject in rejects] == [0, 1], rejects
+        assert columns == {'lightning.strikes': {'2024-01-15': [(2, 14, 2), (3, 15, 5)]}}, columns
+    """)
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,125 @@
+"""Tests for tiered hourly, daily and monthly retention."""
+
+from datetime import date, timedelta
+
+import pytest
+from src.tdd_practice.aggregates import Aggregate
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.retention import TieredWeatherStore
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+
+
+def _dates(start: str, days: int) -> list[str]:
+    first = date.fromisoformat(start)
+    return [(first + timedelta(days=offset)).isoformat() for offset in range(days)]
+
+
+def _fill(store, dates):
+    for day in dates:
+        for hour in range(24):
+            store_rainfall(day, hour, float(hour), store)
+            store_temperature(day, hour, {'max': hour + 5.0, 'min': hour - 5.0, 'average': float(hour)}, store)
+
+
+def test_old_days_roll_up_into_daily_summaries():
+    """Test that only the newest hourly_days keep hourly readings."""
+    store = TieredWeatherStore(hourly_days=3, daily_months=12)
+    _fill(store, _dates('2024-01-01', 10))
+
+    assert list(store) == ['2024-01-08', '2024-01-09', '2024-01-10']
+    assert store.tier_of('2024-01-07') == 'daily'
+    assert store.tier_of('2024-01-10') == 'hourly'
+    assert store.daily('2024-01-02', 'rainfall') == Aggregate(276.0, 24, 0.0, 23.0)
+    assert store.daily('2024-01-02', 'temperature.min').min == -5.0
+    assert store.daily('2024-01-02', 'temperature.average').mean == 11.5
+
+
+def test_old_months_roll_up_into_monthly_summaries():
+    """Test that months beyond daily_months keep only a monthly summary."""
+    reference = WeatherStore()
+    store = TieredWeatherStore(hourly_days=5, daily_months=2)
+    dates = _dates('2024-01-01', 91)
+    _fill(reference, dates)
+    _fill(store, dates)
+
+    assert store.tier_of('2024-01-15') == 'monthly'
+    assert store.tier_of('2024-02-15') == 'daily'
+    assert store.tier_of('2024-03-31') == 'hourly'
+    with pytest.raises(KeyError):
+        store.daily('2024-01-15', 'rainfall')
+    for month in ('2024-01', '2024-02', '2024-03'):
+        for column in ('rainfall', 'temperature.max', 'temperature.min'):
+            assert store.monthly(month, column) == reference.monthly(month, column)
+
+
+def test_daily_range_spans_tiers():
+    """Test that daily_range answers from both the daily and hourly tiers in date order."""
+    store = TieredWeatherStore(hourly_days=2)
+    _fill(store, _dates('2024-01-01', 5))
+
+    daily = list(store.daily_range('2024-01-02', '2024-01-05', 'rainfall'))
+
+    assert [day for day, _ in daily] == ['2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05']
+    assert all(aggregate == Aggregate(276.0, 24, 0.0, 23.0) for _, aggregate in daily)
+
+
+def test_writes_older_than_hourly_retention_fail():
+    """Test that rolled-up and out-of-window dates cannot be written."""
+    store = TieredWeatherStore(hourly_days=2)
+    _fill(store, _dates('2024-01-01', 4))
+
+    with pytest.raises(ValueError):
+        store_rainfall('2024-01-01', 0, 1.0, store)
+    rejects = store_rainfall_many(['2024-01-02', '2024-01-04'], [0, 0], [1.0, 2.0], store)
+    assert [reject.index for reject in rejects] == [0]
+    assert store['2024-01-04'][0] == {
+        'rainfall': 2.0,
+        'temperature': {'max': 5.0, 'min': -5.0, 'average': 0.0},
+    }
+
+
+def test_day_writers_of_rolled_up_days_fail():
+    """Test that a DayWriter cannot write into a day rolled up after it was obtained."""
+    store = TieredWeatherStore(hourly_days=2)
+    writer = store.day_writer('2024-01-01')
+    writer.store_rainfall(0, 1.0)
+    _fill(store, _dates('2024-01-02', 2))
+
+    with pytest.raises(ValueError):
+        writer.store_rainfall(1, 2.0)
+    with pytest.raises(ValueError):
+        writer.store_many('rainfall', [2, 3], [2.0, 3.0])
+    assert store.daily('2024-01-01', 'rainfall') == Aggregate(1.0, 1, 1.0, 1.0)
+
+
+def test_memory_is_bounded_by_retention():
+    """Test that the hourly tier stays at hourly_days days as history grows."""
+    store = TieredWeatherStore(hourly_days=7, daily_months=1)
+    for day in _dates('2024-01-01', 200):
+        store_rainfall(day, 12, 1.0, store)
+
+    assert len(store) == 7
+    assert len(store._daily) <= 31
+    assert store.monthly('2024-02', 'rainfall').sum == 29.0
+
+
+@pytest.mark.parametrize('store_type', [WeatherStore, ConcurrentWeatherStore])
+def test_drop_day_retracts_month_aggregates(store_type):
+    """Test that dropping a day removes it from the month's aggregates."""
+    store = store_type()
+    store_rainfall('2024-01-15', 10, 9.0, store)
+    store_rainfall('2024-01-16', 10, 1.0, store)
+    store_rainfall('2024-01-17', 10, 3.0, store)
+
+    store.drop_day('2024-01-15')
+
+    assert list(store) == ['2024-01-16', '2024-01-17']
+    assert store.monthly('2024-01', 'rainfall') == Aggregate(4.0, 2, 1.0, 3.0)
+    store.drop_day('2024-01-16')
+    store.drop_day('2024-01-17')
+    with pytest.raises(KeyError):
+        store.monthly('2024-01', 'rainfall')
+    with pytest.raises(KeyError):
+        store.drop_day('2024-01-17')
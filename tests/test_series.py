@@ -0,0 +1,130 @@
+"""Tests for lazy hourly series and rolling windows."""
+
+import math
+
+import pytest
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.series import HourlySeries
+from src.tdd_practice.weather_file import WeatherFile, write_weather_file
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+
+
+def _rain(storage):
+    store_rainfall('2024-01-15', 22, 1.0, storage)
+    store_rainfall('2024-01-15', 23, 2.0, storage)
+    store_rainfall('2024-01-16', 0, 3.0, storage)
+    store_rainfall('2024-01-16', 2, 4.0, storage)
+    return storage
+
+
+@pytest.fixture(params=[dict, WeatherStore])
+def storage(request):
+    return _rain(request.param())
+
+
+def test_series_spans_dates_in_hour_order(storage):
+    """Test that the series runs across day boundaries and skips missing hours."""
+    series = HourlySeries(storage, 'rainfall', '2024-01-15', '2024-01-16')
+
+    assert list(series) == [
+        ('2024-01-15', 22, 1.0),
+        ('2024-01-15', 23, 2.0),
+        ('2024-01-16', 0, 3.0),
+        ('2024-01-16', 2, 4.0),
+    ]
+    assert list(series.values()) == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_fill_policy_yields_every_hour(storage):
+    """Test that fill yields a value for every hour of every date."""
+    series = HourlySeries(storage, 'rainfall', '2024-01-15', '2024-01-17', fill=0.0)
+    values = list(series.values())
+
+    assert len(values) == 3 * 24
+    assert values[22:27] == [1.0, 2.0, 3.0, 0.0, 4.0]
+    assert sum(values) == 10.0
+
+
+def test_rolling_sum_uses_clock_hours(storage):
+    """Test that a 3-hour rolling sum drops hours that left the window."""
+    series = HourlySeries(storage, 'rainfall', '2024-01-15', '2024-01-16')
+
+    assert list(series.rolling_sum(3)) == [
+        ('2024-01-15', 22, 1.0),
+        ('2024-01-15', 23, 3.0),
+        ('2024-01-16', 0, 6.0),
+        ('2024-01-16', 2, 7.0),
+    ]
+
+
+def test_rolling_mean_with_min_periods():
+    """Test a 24-hour rolling temperature mean that waits for a full window."""
+    store = WeatherStore()
+    for offset in range(48):
+        date = '2024-01-15' if offset < 24 else '2024-01-16'
+        store_temperature(date, offset % 24, {'max': 0.0, 'min': 0.0, 'average': float(offset)}, store)
+    series = HourlySeries(store, 'temperature.average', '2024-01-15', '2024-01-16')
+
+    means = list(series.rolling_mean(24, min_periods=24))
+
+    assert len(means) == 25
+    assert means[0] == ('2024-01-15', 23, 11.5)
+    assert means[-1] == ('2024-01-16', 23, 35.5)
+
+
+def test_nan_fill_is_left_out_of_windows(storage):
+    """Test that NaN-filled hours are yielded but not counted in rolling windows."""
+    series = HourlySeries(storage, 'rainfall', '2024-01-16', '2024-01-16', fill=math.nan)
+
+    assert math.isnan(list(series.values())[1])
+    assert list(series.rolling(24, 'count'))[-1] == ('2024-01-16', 23, 2)
+    assert list(series.rolling_mean(24))[-1] == ('2024-01-16', 23, 3.5)
+
+
+def test_series_reads_weather_files(tmp_path):
+    """Test that a series reads straight from a memory-mapped weather file."""
+    path = tmp_path / 'weather.tddw'
+    write_weather_file(path, _rain(WeatherStore()))
+
+    with WeatherFile(path) as weather_file:
+        sums = list(HourlySeries(weather_file, 'rainfall', '2024-01-15', '2024-01-16').rolling_sum(2))
+
+    assert [value for _, _, value in sums] == [1.0, 3.0, 5.0, 4.0]
+
+
+def test_invalid_arguments():
+    """Test that unknown columns, bad dates and bad windows are rejected."""
+    store = WeatherStore()
+    with pytest.raises(KeyError):
+        HourlySeries(store, 'humidity', '2024-01-15', '2024-01-16')
+    with pytest.raises(ValueError):
+        HourlySeries(store, 'rainfall', '2024-1-15', '2024-01-16')
+    series = HourlySeries(store, 'rainfall', '2024-01-15', '2024-01-16')
+    with pytest.raises(ValueError):
+        list(series.rolling(0))
+    with pytest.raises(ValueError):
+        list(series.rolling(3, 'median'))
+
+
+def test_rolling_sum_does_not_drift():
+    """Test that rolling sums are exact: a window of zeros sums to 0.0 after rain."""
+    storage = {}
+    for hour, value in enumerate([0.1, 0.2, 0.0, 0.0, 0.0]):
+        store_rainfall('2024-01-15', hour, value, storage)
+    series = HourlySeries(storage, 'rainfall', '2024-01-15', '2024-01-15')
+
+    sums = [value for _, _, value in series.rolling_sum(3)]
+
+    assert sums == [0.1, 0.1 + 0.2, 0.1 + 0.2, 0.2, 0.0]
+    assert [value for _, _, value in series.rolling_mean(3)][-2:] == [0.2 / 3, 0.0]
+
+
+def test_rolling_sum_with_infinite_readings():
+    """Test that an infinite reading dominates the windows holding it and then leaves."""
+    storage = {}
+    for hour, value in enumerate([1.0, math.inf, 2.0, 3.0]):
+        store_rainfall('2024-01-15', hour, value, storage)
+    series = HourlySeries(storage, 'rainfall', '2024-01-15', '2024-01-15')
+
+    assert [value for _, _, value in series.rolling_sum(2)] == [1.0, math.inf, math.inf, 5.0]
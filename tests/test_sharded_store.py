@@ -0,0 +1,94 @@
+"""Tests for multi-station sharded weather storage."""
+
+import pytest
+from src.tdd_practice.aggregates import Aggregate
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.sharded_store import ShardedWeatherStore
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.weather_store import WeatherStore
+
+
+def test_writes_are_routed_per_station():
+    """Test that the same date and hour stay separate per station."""
+    stations = ShardedWeatherStore()
+
+    stations.store_rainfall('north', '2024-01-15', 10, 5.0)
+    stations.store_rainfall('south', '2024-01-15', 10, 12.5)
+    stations.store_temperature('north', '2024-01-15', 10, {'max': 20, 'min': 10, 'average': 15})
+
+    assert sorted(stations) == ['north', 'south']
+    assert stations['north']['2024-01-15'][10] == {
+        'rainfall': 5.0,
+        'temperature': {'max': 20, 'min': 10, 'average': 15},
+    }
+    assert stations['south']['2024-01-15'][10] == {'rainfall': 12.5}
+
+
+def test_shards_work_with_store_functions():
+    """Test that a station shard can be passed to the store_* functions."""
+    stations = ShardedWeatherStore()
+
+    store_rainfall('2024-01-15', 3, 1.5, stations.shard('east'))
+
+    assert isinstance(stations['east'], WeatherStore)
+    assert stations['east']['2024-01-15'][3]['rainfall'] == 1.5
+
+
+def test_cross_station_queries():
+    """Test daily aggregates and hourly readings across stations."""
+    stations = ShardedWeatherStore()
+    stations.store_wind_speed('north', '2024-01-15', 1, {'min': 2.0, 'max': 30.0})
+    stations.store_wind_speed('north', '2024-01-15', 2, {'min': 2.0, 'max': 12.0})
+    stations.store_wind_speed('south', '2024-01-15', 1, {'min': 1.0, 'max': 45.0})
+    stations.store_wind_speed('west', '2024-01-16', 1, {'min': 1.0, 'max': 99.0})
+    stations.store_rainfall('east', '2024-01-15', 1, 4.0)
+
+    assert stations.daily_across_stations('2024-01-15', 'wind_speed.max') == Aggregate(87.0, 3, 12.0, 45.0)
+    assert set(stations.daily_by_station('2024-01-15', 'wind_speed.max')) == {'north', 'south'}
+    assert stations.readings_at('2024-01-15', 1, 'wind_speed') == {
+        'north': {'min': 2.0, 'max': 30.0},
+        'south': {'min': 1.0, 'max': 45.0},
+    }
+    assert stations.daily_across_stations('2024-02-01', 'rainfall') == Aggregate()
+
+
+def test_many_stations():
+    """Test that thousands of stations each get their own shard."""
+    stations = ShardedWeatherStore()
+
+    for station in range(2000):
+        stations.store_rainfall(station, '2024-01-15', 0, float(station))
+
+    assert len(stations) == 2000
+    assert stations.daily_across_stations('2024-01-15', 'rainfall').max == 1999.0
+
+
+def test_custom_shard_factory():
+    """Test that shards can use a thread-safe store."""
+    stations = ShardedWeatherStore(ConcurrentWeatherStore)
+
+    stations.store_rainfall('north', '2024-01-15', 0, 1.0)
+
+    assert isinstance(stations['north'], ConcurrentWeatherStore)
+    with pytest.raises(KeyError):
+        stations['south']
+
+
+def test_racing_shard_creation_keeps_one_shard():
+    """Test that a caller losing the race to create a shard gets the winner's shard."""
+    created = []
+
+    def factory():
+        store = WeatherStore()
+        created.append(store)
+        if len(created) == 1:
+            # Another thread creates the same station's shard meanwhile.
+            stations.store_rainfall('north', '2024-01-15', 0, 1.0)
+        return store
+
+    stations = ShardedWeatherStore(factory)
+
+    shard = stations.shard('north')
+
+    assert shard is stations['north'] is created[1]
+    assert shard['2024-01-15'][0] == {'rainfall': 1.0}
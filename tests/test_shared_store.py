@@ -0,0 +1,188 @@
+"""Tests for the shared memory weather store and its readers."""
+
+import subprocess
+import sys
+import textwrap
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+import pytest
+import src.tdd_practice.shared_store as shared_store
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.shared_store import SharedWeatherReader, SharedWeatherStore
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.wind_storage import store_wind_speed
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def store():
+    with SharedWeatherStore('2024-01-01', 366) as store:
+        yield store
+
+
+def _fill(storage):
+    store_temperature('2024-01-16', 0, {'max': 5.0, 'min': 0.0, 'average': 2.5}, storage)
+    store_rainfall('2024-01-16', 0, 0.0, storage)
+    store_rainfall('2024-01-15', 12, 10.5, storage)
+    store_wind_speed('2024-03-01', 23, {'min': 5.0, 'max': 12.0}, storage)
+    store_rainfall_many(['2024-03-01', '2024-03-01'], [1, 2], [0.2, 0.4], storage)
+
+
+def test_reader_sees_what_the_writer_stored(store):
+    """Test that a reader reads back exactly what a plain WeatherStore holds."""
+    expected = WeatherStore()
+    _fill(expected)
+    _fill(store)
+
+    with SharedWeatherReader(store.name) as reader:
+        assert list(reader) == ['2024-01-15', '2024-01-16', '2024-03-01']
+        assert reader == expected
+        assert '2024-01-17' not in reader
+        assert reader.get('2024-01-17') is None
+        assert reader.get('not a date') is None
+    assert store == expected
+    assert store.monthly('2024-03', 'rainfall') == expected.monthly('2024-03', 'rainfall')
+
+
+def test_writes_after_attaching_are_visible(store):
+    """Test that readers share the writer's memory rather than a copy of it."""
+    with SharedWeatherReader(store.name) as reader:
+        writer = store.day_writer('2024-06-01')
+        writer.store_rainfall(6, 1.25)
+
+        assert reader['2024-06-01'][6] == {'rainfall': 1.25}
+
+
+def test_dates_outside_the_slots_are_rejected(store):
+    """Test that only dates within the day slots can be stored."""
+    with pytest.raises(ValueError):
+        store_rainfall('2023-12-31', 0, 1.0, store)
+
+    rejects = store_rainfall_many(['2024-12-31', '2025-01-01'], [0, 0], [1.0, 2.0], store)
+
+    assert [reject.index for reject in rejects] == [1]
+    assert list(store) == ['2024-12-31']
+
+
+def test_dropped_days_disappear_for_readers(store):
+    """Test that dropping a day clears its slot."""
+    _fill(store)
+
+    with SharedWeatherReader(store.name) as reader:
+        store.drop_day('2024-01-15')
+
+        assert '2024-01-15' not in reader
+        assert len(reader) == 2
+        store_rainfall('2024-01-15', 1, 3.0, store)
+        assert dict(reader['2024-01-15']) == {1: {'rainfall': 3.0}}
+
+
+def test_snapshots_are_consistent_while_writing(store):
+    """Test that a reader process never sees a day half-way through a batch write."""
+    hours = list(range(24))
+    batches = 3000
+    store_rainfall_many(['2024-01-01'] * 24, hours, [0.0] * 24, store)
+    script = textwrap.dedent(f"""
+        from src.tdd_practice.shared_store import SharedWeatherReader
+        torn = 0
+        with SharedWeatherReader({store.name!r}) as reader:
+            print('ready', flush=True)
+            while True:
+                day = reader['2024-01-01']
+                values = {{day[hour]['rainfall'] for hour in range(24)}}
+                torn += len(values) != 1
+                if values == {{{float(batches)}}}:
+                    break
+        print(torn)
+    """)
+    reader = subprocess.Popen(
+        [sys.executable, '-c', script], cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    assert reader.stdout.readline() == 'ready\n'
+
+    for value in range(1, batches + 1):
+        store_rainfall_many(['2024-01-01'] * 24, hours, [float(value)] * 24, store)
+
+    output, _ = reader.communicate(timeout=60)
+    assert output.strip() == '0'
+
+
+def test_reader_gives_up_on_a_slot_left_mid_write(store, monkeypatch):
+    """Test that a slot whose writer stopped mid-write raises instead of spinning forever."""
+    store_rainfall('2024-01-01', 0, 1.0, store)
+    store._bump(store._offsets['2024-01-01'])
+    monkeypatch.setattr(shared_store, '_MAX_ATTEMPTS', 3)
+
+    with SharedWeatherReader(store.name) as reader:
+        with pytest.raises(RuntimeError):
+            reader['2024-01-01']
+
+
+def test_reader_in_another_process(store):
+    """Test that another process can attach, read and exit without unlinking the segment."""
+    _fill(store)
+    script = textwrap.dedent(f"""
+        from src.tdd_practice.shared_store import SharedWeatherReader
+        with SharedWeatherReader({store.name!r}) as reader:
+            print(reader['2024-01-15'][12]['rainfall'], len(reader))
+    """)
+
+    result = subprocess.run(
+        [sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['10.5', '3']
+    with SharedWeatherReader(store.name) as reader:
+        assert len(reader) == 3
+
+
+def test_attaching_does_not_stop_other_threads_registering_segments(store, monkeypatch):
+    """Test that stores created while readers attach are registered, and readers never are."""
+    registered = []
+    register = resource_tracker.register
+
+    def recording_register(name, rtype):
+        registered.append(name)
+        register(name, rtype)
+
+    monkeypatch.setattr(resource_tracker, 'register', recording_register)
+    stop = threading.Event()
+
+    def attach():
+        while not stop.is_set():
+            SharedWeatherReader(store.name).close()
+
+    reader = threading.Thread(target=attach)
+    reader.start()
+    created = []
+    try:
+        for _ in range(50):
+            with SharedWeatherStore('2024-01-01', 1) as other:
+                created.append(other.name)
+    finally:
+        stop.set()
+        reader.join()
+
+    assert [name.lstrip('/') for name in registered] == created
+
+
+def test_reader_rejects_other_segments():
+    """Test that attaching to a segment that is not a weather store raises ValueError."""
+    memory = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            SharedWeatherReader(memory.name)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def test_invalid_arguments():
+    """Test that invalid start dates and slot counts are rejected."""
+    with pytest.raises(ValueError):
+        SharedWeatherStore('2024-13-01', 10)
+    with pytest.raises(ValueError):
+        SharedWeatherStore('2024-01-01', 0)
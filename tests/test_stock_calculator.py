@@ -1,3 +1,6 @@
+from array import array
+
+import pytest
 import src.tdd_practice.stock_calculator as stock_calculator
 
 def test_A8_FR_01_stock_gap_exceeds_threshold_object_A():
@@ -119,3 +122,208 @@ def test_BVA_07_minimum_threshold_is_zero():
     C = 10
     
     assert stock_calculator.sum_current_stock(A, B, C, max_fill, min_threshold) == 1
+
+def test_BATCH_01_matches_single_site_calls():
+    max_fill = 10
+    min_threshold = 2
+    
+    A = [5, 10, 10, 5, 0, 8, 7, 9, 11]
+    B = [10, 8, 10, 8, 10, 10, 10, 10, 10]
+    C = [10, 10, 3, 3, 10, 10, 10, 10, 10]
+    
+    totals, invalid = stock_calculator.sum_current_stock_batch(A, B, C, max_fill, min_threshold)
+    
+    assert list(totals) == [
+        stock_calculator.sum_current_stock(a, b, c, max_fill, min_threshold)
+        for a, b, c in zip(A, B, C)
+    ]
+    assert invalid == [False] * len(A)
+
+def test_BATCH_02_invalid_rows_reported_as_mask():
+    max_fill = [10, 0, 10, 10]
+    min_threshold = 2
+    
+    A = [5, 5, -1, 5]
+    B = [10, 10, 10, 10]
+    C = [10, 10, 10, -3]
+    
+    totals, invalid = stock_calculator.sum_current_stock_batch(A, B, C, max_fill, min_threshold)
+    
+    assert invalid == [False, True, True, True]
+    assert list(totals) == [5, 0, 0, 0]
+
+def test_BATCH_03_per_row_threshold():
+    max_fill = 10
+    min_threshold = [0, 2, 5]
+    
+    A = [9, 7, 6]
+    B = [10, 10, 10]
+    C = [10, 10, 10]
+    
+    totals, invalid = stock_calculator.sum_current_stock_batch(A, B, C, max_fill, min_threshold)
+    
+    assert list(totals) == [1, 3, 0]
+
+def test_BATCH_04_mismatched_lengths():
+    with pytest.raises(ValueError):
+        stock_calculator.sum_current_stock_batch([1, 2], [1], [1, 2], 10, 2)
+
+def test_BATCH_05_keeps_numeric_type():
+    from decimal import Decimal
+    
+    totals, _ = stock_calculator.sum_current_stock_batch([5, 10], [10, 3], [10, 10], 10, 2)
+    assert totals == [5, 7]
+    assert all(type(total) is int for total in totals)
+    
+    totals, _ = stock_calculator.sum_current_stock_batch(
+        [Decimal('5.5')], [Decimal('10')], [Decimal('10')], Decimal('10'), Decimal('2'))
+    assert totals == [Decimal('4.5')]
+
+def test_N_01_any_number_of_products():
+    max_fill = 10
+    min_threshold = 2
+    
+    levels = [5, 8, 3, 10, 0, 7]
+    
+    assert stock_calculator.sum_production(levels, max_fill, min_threshold) == 5 + 7 + 10 + 3
+
+def test_N_02_per_product_settings():
+    max_fill = [10, 20, 5]
+    min_threshold = [2, 15, 0]
+    
+    levels = [5, 10, 4]
+    
+    assert stock_calculator.sum_production(levels, max_fill, min_threshold) == 5 + 0 + 1
+
+def test_N_03_accepts_buffers():
+    levels = array('d', [5.0, 8.0, 3.0])
+    
+    assert stock_calculator.sum_production(levels, 10, 2) == 12
+    assert stock_calculator.sum_production(memoryview(levels), 10, 2) == 12
+
+def test_N_04_invalid_inputs():
+    assert stock_calculator.sum_production([5, -1, 3], 10, 2) == 'invalid'
+    assert stock_calculator.sum_production([5, 1, 3], 0, 2) == 'invalid'
+    assert stock_calculator.sum_production([5, 1, 3], [10, 0, 10], 2) == 'invalid'
+
+def test_N_05_no_products():
+    assert stock_calculator.sum_production([], 10, 2) == 0
+
+def test_PLAN_01_matches_snapshot_per_period():
+    max_fill = 10
+    min_threshold = 2
+    
+    levels = {
+        'A': [5, 10, 10, 5, 0, 8],
+        'B': [10, 8, 10, 8, 10, 10],
+        'C': [10, 10, 3, 3, 10, 10],
+    }
+    
+    plan = stock_calculator.plan_replenishment(levels, max_fill, min_threshold)
+    
+    assert list(plan.production) == [
+        stock_calculator.sum_current_stock(a, b, c, max_fill, min_threshold)
+        for a, b, c in zip(levels['A'], levels['B'], levels['C'])
+    ]
+    assert list(plan.cumulative_shortfall) == [5, 5, 12, 24, 34, 34]
+    assert plan.invalid == [False] * 6
+
+def test_PLAN_02_breach_starts():
+    levels = {
+        'A': array('d', [10, 5, 4, 9, 7, 2]),
+        'B': [10, 10, 10, 10, 10, 10],
+    }
+    
+    plan = stock_calculator.plan_replenishment(levels, 10, 2)
+    
+    assert plan.breach_starts == {'A': [1, 4], 'B': []}
+    assert dict(plan.breach_starts) == {'A': [1, 4], 'B': []}
+    with pytest.raises(KeyError):
+        plan.breach_starts['C']
+
+def test_PLAN_03_invalid_periods_produce_nothing():
+    levels = {
+        'A': [5, 5, 5],
+        'B': [10, -1, 0],
+    }
+    
+    plan = stock_calculator.plan_replenishment(levels, 10, 2)
+    
+    assert plan.invalid == [False, True, False]
+    assert list(plan.production) == [5, 0, 15]
+    assert plan.breach_starts == {'A': [0, 2], 'B': [2]}
+
+def test_PLAN_04_per_product_settings():
+    levels = {'A': [5, 9], 'B': [5, 9]}
+    
+    plan = stock_calculator.plan_replenishment(levels, {'A': 10, 'B': 20}, {'A': 2, 'B': 10})
+    
+    assert list(plan.production) == [5 + 15, 11]
+    assert stock_calculator.plan_replenishment(levels, {'A': 10, 'B': 0}, 2).invalid == [True, True]
+
+def test_PLAN_05_rejects_bad_inputs():
+    with pytest.raises(ValueError):
+        stock_calculator.plan_replenishment({'A': [1, 2], 'B': [1]}, 10, 2)
+    with pytest.raises(ValueError):
+        stock_calculator.plan_replenishment({'A': [1], 'B': [1]}, {'A': 10}, 2)
+
+def test_PLAN_06_no_periods():
+    plan = stock_calculator.plan_replenishment({'A': [], 'B': []}, 10, 2)
+    
+    assert list(plan.production) == []
+    assert plan.breach_starts == {'A': [], 'B': []}
+
+def test_PLAN_07_breach_starts_ignore_later_changes_to_levels():
+    levels = {'A': array('d', [10, 5, 4, 9, 7, 2]), 'B': [10, 10, 10, 10, 10, 10]}
+    
+    plan = stock_calculator.plan_replenishment(levels, 10, 2)
+    levels['A'][0] = 0
+    levels['B'][:] = [0] * 6
+    
+    assert plan.breach_starts == {'A': [1, 4], 'B': []}
+
+def test_MEMO_01_same_results_as_sum_current_stock():
+    memoized = stock_calculator.memoized_sum_current_stock()
+    
+    for args in [(5, 10, 10, 10, 2), (10, 8, 10, 10, 2), (-1, 5, 5, 10, 2), (5, 10, 10, 5, 2)]:
+        assert memoized(*args) == stock_calculator.sum_current_stock(*args)
+
+def test_MEMO_02_repeated_inputs_hit():
+    memoized = stock_calculator.memoized_sum_current_stock()
+    
+    assert memoized.hit_rate() == 0.0
+    memoized(5, 10, 10, 10, 2)
+    memoized(5, 10, 10, 10, 2)
+    memoized(5, 10, 3, 10, 2)
+    memoized(5, 10, 10, 10, 2)
+    
+    assert memoized.cache_info().hits == 2
+    assert memoized.hit_rate() == 0.5
+
+def test_MEMO_03_bounded_with_lru_eviction():
+    memoized = stock_calculator.memoized_sum_current_stock(maxsize=2)
+    
+    memoized(1, 1, 1, 10, 2)
+    memoized(2, 2, 2, 10, 2)
+    memoized(1, 1, 1, 10, 2)
+    memoized(3, 3, 3, 10, 2)
+    memoized(1, 1, 1, 10, 2)
+    memoized(2, 2, 2, 10, 2)
+    
+    assert memoized.cache_info().currsize == 2
+    assert memoized.cache_info().hits == 2
+
+def test_MEMO_04_independent_caches():
+    first = stock_calculator.memoized_sum_current_stock()
+    second = stock_calculator.memoized_sum_current_stock()
+    
+    first(5, 10, 10, 10, 2)
+    second(5, 10, 10, 10, 2)
+    
+    assert first.hit_rate() == second.hit_rate() == 0.0
+
+def test_A8_FR_06_accepts_decimal_levels():
+    from decimal import Decimal
+    
+    assert stock_calculator.sum_current_stock(
+        Decimal('5.5'), Decimal('10'), Decimal('10'), Decimal('10'), Decimal('2')) == Decimal('4.5')
@@ -0,0 +1,79 @@
+"""Tests for the memory-mapped weather file format."""
+
+import pytest
+from src.tdd_practice.weather_file import WeatherFile, write_weather_file
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+@pytest.fixture
+def store():
+    store = WeatherStore()
+    store_temperature('2024-01-16', 0, {'max': 5, 'min': 0, 'average': 2.5}, store)
+    store_rainfall('2024-01-16', 0, 0.0, store)
+    store_rainfall('2024-01-15', 12, 10.5, store)
+    store_wind_speed('2024-03-01', 23, {'min': 5.0, 'max': 12.0}, store)
+    return store
+
+
+def test_round_trip(tmp_path, store):
+    """Test that a written file reads back exactly like the store."""
+    path = tmp_path / 'history.weather'
+
+    write_weather_file(path, store)
+
+    with WeatherFile(path) as weather:
+        assert list(weather) == ['2024-01-15', '2024-01-16', '2024-03-01']
+        assert weather == store
+        assert weather['2024-01-16'][0]['temperature'] == {'max': 5, 'min': 0, 'average': 2.5}
+        assert weather['2024-03-01'][23]['wind_speed'] == {'min': 5.0, 'max': 12.0}
+        assert 1 not in weather['2024-01-15']
+
+
+def test_missing_dates(tmp_path, store):
+    """Test lookups of dates that are not in the file."""
+    path = tmp_path / 'history.weather'
+    write_weather_file(path, store)
+
+    with WeatherFile(path) as weather:
+        assert '2024-01-14' not in weather
+        assert '2024-12-31' not in weather
+        with pytest.raises(KeyError):
+            weather['2024-02-01']
+
+
+def test_empty_store(tmp_path):
+    """Test that an empty store produces a valid empty file."""
+    path = tmp_path / 'empty.weather'
+
+    write_weather_file(path, WeatherStore())
+
+    with WeatherFile(path) as weather:
+        assert len(weather) == 0
+
+
+def test_blocks_have_fixed_size(tmp_path, store):
+    """Test that each extra day adds one fixed-size block plus its index entry."""
+    one_day = WeatherStore()
+    store_rainfall('2024-01-15', 0, 1.0, one_day)
+    write_weather_file(tmp_path / 'one.weather', one_day)
+    store_rainfall('2024-01-16', 0, 1.0, one_day)
+    write_weather_file(tmp_path / 'two.weather', one_day)
+
+    one = (tmp_path / 'one.weather').stat().st_size
+    two = (tmp_path / 'two.weather').stat().st_size
+
+    block_size = 6 * 4 + 24 * 8 * 6
+    assert block_size <= two - one <= block_size + 8
+
+
+def test_rejects_other_files(tmp_path):
+    """Test that files without the weather header are refused."""
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'\0' * 64)
+
+    with pytest.raises(ValueError, match="not a version"):
+        WeatherFile(path)
+
@@ -0,0 +1,216 @@
+"""Tests for the columnar WeatherStore used in place of the nested storage dict."""
+
+import pytest
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.weather_store import WeatherStore, COLUMNS
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.rainfall_storage import store_rainfall
+from src.tdd_practice.wind_storage import store_wind_speed
+
+
+@pytest.mark.parametrize("store_func,data_key,test_data", [
+    (store_temperature, 'temperature', {'max': 10, 'min': 5, 'average': 7.5}),
+    (store_rainfall, 'rainfall', 10.5),
+    (store_wind_speed, 'wind_speed', {'min': 5.0, 'max': 15.0}),
+])
+def test_store_functions_accept_weather_store(store_func, data_key, test_data):
+    """Test that the store_* functions write into a WeatherStore."""
+    date = '2024-01-15'
+    hour = 10
+    storage = WeatherStore()
+
+    store_func(date, hour, test_data, storage)
+
+    assert date in storage
+    assert hour in storage[date]
+    assert storage[date][hour][data_key] == test_data
+
+
+@pytest.mark.parametrize("store_func,invalid_hour", [
+    (store_temperature, -1),
+    (store_rainfall, 24),
+    (store_wind_speed, 100),
+])
+def test_fails_with_invalid_hour(store_func, invalid_hour):
+    """Test that a WeatherStore rejects hours outside 0-23."""
+    storage = WeatherStore()
+    test_data = 1.0 if store_func == store_rainfall else {'min': 1.0, 'max': 2.0}
+
+    with pytest.raises(ValueError, match="Hour must be between 0 and 23"):
+        store_func('2024-01-15', invalid_hour, test_data, storage)
+
+    assert len(storage) == 0
+
+
+def test_matches_nested_dict_storage():
+    """Test that a WeatherStore reads back exactly like the nested dict."""
+    storage = {}
+    store = WeatherStore()
+
+    for target in (storage, store):
+        store_temperature('2024-01-15', 0, {'max': 5, 'min': 0, 'average': 2.5}, target)
+        store_rainfall('2024-01-15', 0, 0.0, target)
+        store_rainfall('2024-01-15', 12, 10.5, target)
+        store_wind_speed('2024-01-16', 23, {'min': 5.0, 'max': 12.0}, target)
+
+    assert store == storage
+    assert {date: dict(day) for date, day in store.items()} == storage
+
+
+def test_partial_data_storage():
+    """Test that metrics not yet stored for an hour are absent."""
+    store = WeatherStore()
+
+    store_temperature('2024-01-15', 10, {'max': 20, 'min': 10, 'average': 15}, store)
+
+    assert 'temperature' in store['2024-01-15'][10]
+    assert 'rainfall' not in store['2024-01-15'][10]
+    assert 'wind_speed' not in store['2024-01-15'][10]
+    assert 11 not in store['2024-01-15']
+    with pytest.raises(KeyError):
+        store['2024-01-15'][11]
+
+
+def test_overwrite_replaces_whole_reading():
+    """Test that fields missing from an overwrite are dropped like a dict replace."""
+    store = WeatherStore()
+
+    store_temperature('2024-01-15', 10, {'max': 20, 'min': 10, 'average': 15}, store)
+    store_temperature('2024-01-15', 10, {'max': 25, 'min': 12}, store)
+
+    assert store['2024-01-15'][10]['temperature'] == {'max': 25, 'min': 12}
+
+
+def test_day_is_single_preallocated_block():
+    """Test that a day holds one 24-slot float block per column."""
+    store = WeatherStore()
+
+    store_rainfall('2024-01-15', 3, 1.5, store)
+
+    day = store._days['2024-01-15']
+    assert day.values.typecode == 'd'
+    assert len(day.values) == 24 * len(COLUMNS)
+    assert len(day.mask) == len(COLUMNS)
+    assert len(store['2024-01-15']) == 1
+
+
+@pytest.mark.parametrize("invalid_date", ['Jan 15', '2024-02-30', '20240115', ''])
+def test_fails_with_invalid_date(invalid_date):
+    """Test that a WeatherStore only accepts 'YYYY-MM-DD' dates."""
+    store = WeatherStore()
+
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        store_rainfall(invalid_date, 0, 1.0, store)
+
+    assert len(store) == 0
+
+
+def test_iterates_in_date_order():
+    """Test that dates inserted out of order are kept sorted."""
+    store = WeatherStore()
+
+    for date in ['2024-03-01', '2023-12-31', '2024-01-15', '2024-02-29']:
+        store_rainfall(date, 0, 1.0, store)
+
+    assert list(store) == ['2023-12-31', '2024-01-15', '2024-02-29', '2024-03-01']
+
+
+def test_query_range():
+    """Test range queries by metric and by single column across out-of-order inserts."""
+    store = WeatherStore()
+    store_rainfall('2024-06-02', 5, 2.0, store)
+    store_rainfall('2024-03-01', 0, 1.0, store)
+    store_temperature('2024-04-10', 3, {'max': 20, 'min': 10, 'average': 15}, store)
+    store_rainfall('2024-02-28', 1, 9.0, store)
+    store_rainfall('2024-04-10', 23, 3.0, store)
+    store_rainfall('2024-04-10', 2, 4.0, store)
+
+    assert list(store.query_range('2024-03-01', '2024-06-01', 'rainfall')) == [
+        ('2024-03-01', 0, 1.0),
+        ('2024-04-10', 2, 4.0),
+        ('2024-04-10', 23, 3.0),
+    ]
+    assert list(store.query_range('2024-01-01', '2024-12-31', 'temperature')) == [
+        ('2024-04-10', 3, {'max': 20, 'min': 10, 'average': 15}),
+    ]
+    assert list(store.query_range('2024-01-01', '2024-12-31', 'temperature.min')) == [
+        ('2024-04-10', 3, 10.0),
+    ]
+    assert list(store.query_range('2024-07-01', '2024-08-01', 'rainfall')) == []
+
+
+def test_query_range_unknown_metric():
+    """Test that unknown metrics are refused."""
+    with pytest.raises(KeyError):
+        list(WeatherStore().query_range('2024-01-01', '2024-01-02', 'humidity'))
+
+
+def test_day_writer_matches_store_functions():
+    """Test that writes through a day writer read back like store_* writes."""
+    expected = WeatherStore()
+    store = WeatherStore()
+    store_temperature('2024-01-15', 0, {'max': 5, 'min': 0, 'average': 2.5}, expected)
+    store_rainfall('2024-01-15', 1, 1.5, expected)
+    store_wind_speed('2024-01-15', 2, {'min': 1.0, 'max': 4.0}, expected)
+    for hour in range(3, 24):
+        store_rainfall('2024-01-15', hour, float(hour), expected)
+
+    writer = store.day_writer('2024-01-15')
+    writer.store_temperature(0, {'max': 5, 'min': 0, 'average': 2.5})
+    writer.store_rainfall(1, 1.5)
+    writer.store_wind_speed(2, {'min': 1.0, 'max': 4.0})
+    writer.store_many('rainfall', list(range(3, 24)), [float(hour) for hour in range(3, 24)])
+
+    assert store == expected
+    assert store.daily('2024-01-15', 'rainfall') == expected.daily('2024-01-15', 'rainfall')
+    assert writer.day_id == store.day_writer('2024-01-15').day_id
+
+
+def test_day_writer_validates_batches_before_writing():
+    """Test that a batch with a bad hour or value leaves the day unchanged."""
+    store = WeatherStore()
+    writer = store.day_writer('2024-01-15')
+
+    with pytest.raises(ValueError, match="Hour must be between 0 and 23"):
+        writer.store_many('rainfall', [1, 24], [1.0, 2.0])
+    with pytest.raises(TypeError):
+        writer.store_many('rainfall', [1, 2], [1.0, 'heavy'])
+    with pytest.raises(ValueError, match="Hour must be between 0 and 23"):
+        writer.store_rainfall(-1, 1.0)
+
+    assert len(store['2024-01-15']) == 0
+
+
+@pytest.mark.parametrize('store_type', [WeatherStore, ConcurrentWeatherStore])
+def test_day_writers_of_dropped_days_fail(store_type):
+    """Test that a DayWriter cannot write into a day dropped after it was obtained."""
+    store = store_type()
+    store_rainfall('2024-01-01', 0, 1.0, store)
+    store_rainfall('2024-01-02', 0, 1.0, store)
+    writer = store.day_writer('2024-01-01')
+    store.drop_day('2024-01-01')
+
+    with pytest.raises(ValueError):
+        writer.store_rainfall(5, 100.0)
+    with pytest.raises(ValueError):
+        writer.store_many('rainfall', [5, 6], [100.0, 100.0])
+    store_rainfall('2024-01-01', 1, 2.0, store)
+    with pytest.raises(ValueError):
+        writer.store_rainfall(5, 100.0)
+
+    assert store.monthly('2024-01', 'rainfall').sum == 3.0
+    assert store.monthly('2024-01', 'rainfall').count == 2
+
+
+def test_day_writer_writes_are_observed():
+    """Test that observers added after a DayWriter was obtained see its later writes."""
+    store = WeatherStore()
+    writer = store.day_writer('2024-01-15')
+    writer.store_rainfall(1, 1.5)
+    seen = []
+
+    store.add_observer(lambda date, hours, column_values: seen.append((date, hours)))
+    writer.store_rainfall(2, 2.5)
+
+    assert seen == [('2024-01-15', (2,))]
+    assert store.daily('2024-01-15', 'rainfall').sum == 4.0
@@ -0,0 +1,157 @@
+"""Tests for the append-only write log and journaled weather storage."""
+
+import pytest
+from src.tdd_practice.concurrent_store import ConcurrentWeatherStore
+from src.tdd_practice.rainfall_storage import store_rainfall, store_rainfall_many
+from src.tdd_practice.weather_file import load_weather_file, write_weather_file
+from src.tdd_practice.weather_storage import store_temperature
+from src.tdd_practice.weather_store import WeatherStore
+from src.tdd_practice.wind_storage import store_wind_speed
+from src.tdd_practice.write_log import LOG_NAME, WeatherJournal, WriteLog, replay_log
+
+HEADER_SIZE = 16
+RECORD_SIZE = 14
+
+
+def _fill(store):
+    store_temperature('2024-01-15', 10, {'max': 25.5, 'min': 15.2, 'average': 20.3}, store)
+    store_rainfall('2024-01-15', 10, 5.5, store)
+    store_rainfall('2024-01-15', 10, 6.0, store)
+    store_wind_speed('2024-02-01', 3, {'min': 5.0, 'max': 15.0}, store)
+    store_rainfall_many(['2024-02-01', '2024-02-02'], [3, 4], [1.0, 2.0], store)
+
+
+def _as_dict(store) -> dict:
+    return {date: {hour: dict(record) for hour, record in day.items()} for date, day in store.items()}
+
+
+def test_observers_see_every_write():
+    """Test that observers receive single and batch writes after they are applied."""
+    store = WeatherStore()
+    seen = []
+    store.add_observer(lambda date, hours, column_values: seen.append(
+        (date, list(hours), [(column, list(values)) for column, values in column_values])))
+
+    store_rainfall('2024-01-15', 10, 5.5, store)
+    store.day_writer('2024-01-16').store_many('rainfall', [1, 2], [1.0, 2.0])
+
+    assert seen == [
+        ('2024-01-15', [10], [(3, [5.5])]),
+        ('2024-01-16', [1, 2], [(3, [1.0, 2.0])]),
+    ]
+
+
+def test_replay_rebuilds_store(tmp_path):
+    """Test that replaying a log reproduces the logged store, including overwrites."""
+    store = WeatherStore()
+    log = WriteLog(tmp_path / LOG_NAME)
+    store.add_observer(log.append)
+    _fill(store)
+    log.close()
+
+    recovered = WeatherStore()
+    replayed = replay_log(tmp_path / LOG_NAME, recovered)
+
+    assert replayed == 3 + 1 + 1 + 2 + 2
+    assert _as_dict(recovered) == _as_dict(store)
+    assert recovered.daily('2024-01-15', 'rainfall').sum == 6.0
+
+
+def test_log_costs_fixed_bytes_per_reading(tmp_path):
+    """Test that each logged reading adds one fixed-size record."""
+    log = WriteLog(tmp_path / LOG_NAME)
+    store = WeatherStore()
+    store.add_observer(log.append)
+
+    store_rainfall('2024-01-15', 10, 5.5, store)
+    store_temperature('2024-01-15', 10, {'max': 25.5, 'min': 15.2, 'average': 20.3}, store)
+
+    assert log.size == HEADER_SIZE + 4 * RECORD_SIZE
+    log.close()
+
+
+def test_partial_readings_replay_cleared_fields(tmp_path):
+    """Test that fields cleared by a partial reading stay cleared after replay."""
+    with WeatherJournal(tmp_path) as journal:
+        store_wind_speed('2024-01-15', 10, {'min': 5.0, 'max': 15.0}, journal.store)
+        store_wind_speed('2024-01-15', 10, {'max': 12.0}, journal.store)
+
+    with WeatherJournal(tmp_path) as journal:
+        assert journal.store['2024-01-15'][10] == {'wind_speed': {'max': 12.0}}
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    """Test that a record cut short by a crash is ignored on replay."""
+    with WeatherJournal(tmp_path) as journal:
+        store_rainfall('2024-01-15', 10, 5.5, journal.store)
+        store_rainfall('2024-01-15', 11, 6.5, journal.store)
+    path = tmp_path / LOG_NAME
+    path.write_bytes(path.read_bytes()[:-3])
+
+    with WeatherJournal(tmp_path) as journal:
+        assert journal.recovered == 1
+        assert _as_dict(journal.store) == {'2024-01-15': {10: {'rainfall': 5.5}}}
+        store_rainfall('2024-01-15', 12, 7.5, journal.store)
+
+    with WeatherJournal(tmp_path) as journal:
+        assert journal.recovered == 2
+        assert _as_dict(journal.store) == {'2024-01-15': {10: {'rainfall': 5.5}, 12: {'rainfall': 7.5}}}
+
+
+def test_replay_rejects_other_files(tmp_path):
+    """Test that replaying a file that is not a write log fails."""
+    path = tmp_path / 'other.log'
+    path.write_bytes(b'not a write log at all')
+
+    with pytest.raises(ValueError):
+        replay_log(path, WeatherStore())
+
+
+def test_checkpoint_snapshots_and_empties_log(tmp_path):
+    """Test that a checkpoint moves logged writes into the snapshot."""
+    with WeatherJournal(tmp_path) as journal:
+        _fill(journal.store)
+        journal.checkpoint()
+        assert journal.log.size == HEADER_SIZE
+        store_rainfall('2024-03-01', 0, 9.0, journal.store)
+        expected = _as_dict(journal.store)
+
+    with WeatherJournal(tmp_path) as journal:
+        assert journal.recovered == 1
+        assert _as_dict(journal.store) == expected
+
+
+def test_automatic_checkpoint(tmp_path):
+    """Test that the log is compacted once it passes checkpoint_bytes."""
+    with WeatherJournal(tmp_path, checkpoint_bytes=HEADER_SIZE + 10 * RECORD_SIZE) as journal:
+        for hour in range(24):
+            store_rainfall('2024-01-15', hour, float(hour), journal.store)
+        assert journal.log.size < HEADER_SIZE + 10 * RECORD_SIZE
+
+    with WeatherJournal(tmp_path, store_factory=ConcurrentWeatherStore) as journal:
+        assert isinstance(journal.store, ConcurrentWeatherStore)
+        assert len(journal.store['2024-01-15']) == 24
+        assert journal.store.daily('2024-01-15', 'rainfall').sum == sum(range(24))
+
+
+def test_closed_journal_stops_logging(tmp_path):
+    """Test that writes after close are not logged."""
+    journal = WeatherJournal(tmp_path)
+    store_rainfall('2024-01-15', 10, 5.5, journal.store)
+    journal.close()
+    store_rainfall('2024-01-15', 11, 6.5, journal.store)
+
+    with WeatherJournal(tmp_path) as reopened:
+        assert list(reopened.store['2024-01-15']) == [10]
+
+
+def test_load_weather_file(tmp_path):
+    """Test that a weather file loads back into a store with its aggregates."""
+    store = WeatherStore()
+    _fill(store)
+    write_weather_file(tmp_path / 'weather.tddw', store)
+
+    loaded = load_weather_file(tmp_path / 'weather.tddw')
+
+    assert _as_dict(loaded) == _as_dict(store)
+    assert loaded.monthly('2024-02', 'rainfall') == store.monthly('2024-02', 'rainfall')